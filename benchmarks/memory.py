@@ -0,0 +1,57 @@
+"""
+Benchmark the memory used by wrapped values.
+
+Wraps a million values per case and prints the bytes they take, measured
+with tracemalloc, next to the plain values and to subclasses that keep a
+per-instance __dict__ (what the Flow types cost before they used slots).
+
+Usage:
+    python benchmarks/memory.py [--values 1000000]
+"""
+
+import argparse
+import sys
+import tracemalloc
+
+from typeflow.types import FlowBool, FlowInt, FlowStr, flow
+
+class DictInt(int):
+    """int subclass with a __dict__."""
+
+class DictStr(str):
+    """str subclass with a __dict__."""
+
+def measure(label, make, values):
+    """Build a list of wrapped values and print the bytes per million values."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    wrapped = [make(value) for value in values]
+    used = max(tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(wrapped), 0)
+    tracemalloc.stop()
+    
+    per_million = used * 1000000 / len(values)
+    print(f"{label:>28}: {per_million / 1e6:>8.1f} MB per million")
+    return wrapped
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--values", type=int, default=1000000, help="Number of values per case")
+    args = parser.parse_args()
+    
+    large_ints = range(10 ** 6, 10 ** 6 + args.values)
+    small_ints = [i % 100 for i in range(args.values)]
+    strings = [f"value-{i}" for i in range(args.values)]
+    words = [("yes", "no", "n/a")[i % 3] for i in range(args.values)]
+    flags = [i % 2 == 0 for i in range(args.values)]
+    
+    measure("int (distinct)", lambda value: value + 0, large_ints)
+    measure("int subclass with __dict__", DictInt, large_ints)
+    measure("FlowInt (distinct)", FlowInt, large_ints)
+    measure("flow() small ints", flow, small_ints)
+    measure("str subclass with __dict__", DictStr, strings)
+    measure("FlowStr (distinct)", FlowStr, strings)
+    measure("flow() repeated words", flow, words)
+    measure("FlowBool", FlowBool, flags)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmark process-pool conversion against a single core.
+
+Converts a column of numeric strings with ConversionRegistry.to_float_many()
+and with convert_parallel() for increasing worker counts, and prints the
+values per second and the speedup over a single core.
+
+Usage:
+    python benchmarks/parallel.py [--values 2000000] [--max-workers 32]
+"""
+
+import argparse
+import os
+import time
+
+from typeflow.converters import get_converter
+from typeflow.parallel import convert_parallel
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--values", type=int, default=2000000, help="Number of values to convert")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count(), help="Largest number of workers")
+    parser.add_argument("--chunksize", type=int, default=65536, help="Values per task")
+    args = parser.parse_args()
+    
+    values = [f"{i}.25" for i in range(args.values)]
+    
+    start = time.perf_counter()
+    get_converter('float').to_float_many(values)
+    single = args.values / (time.perf_counter() - start)
+    print(f"{'workers':>8} {'values/s':>14} {'speedup':>8}")
+    print(f"{'serial':>8} {single:>14,.0f} {1:>7.2f}x")
+    
+    workers = 1
+    while workers <= args.max_workers:
+        start = time.perf_counter()
+        convert_parallel(values, 'float', workers=workers, chunksize=args.chunksize)
+        rate = args.values / (time.perf_counter() - start)
+        print(f"{workers:>8} {rate:>14,.0f} {rate / single:>7.2f}x")
+        workers *= 2
+
+if __name__ == "__main__":
+    main()
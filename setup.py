@@ -21,6 +21,9 @@ setup(
     ],
     python_requires=">3.0",
     install_requires=[],
+    extras_require={
+        "numpy": ["numpy"],
+    },
     entry_points={
         "console_scripts": [
             "typeflow=typeflow.__main__:main",
@@ -0,0 +1,122 @@
+"""
+Tests for TypeFlow async conversion.
+"""
+
+import asyncio
+import unittest
+
+from typeflow.aio import aconvert, aconvert_many
+from typeflow.config import get_config
+from typeflow.converters import ConversionRegistry
+
+class UserId(int):
+    """An ID resolved to a user name by the stub service."""
+
+class StubNameService:
+    """Local TCP server answering 'id,id,...' lines with 'name,name,...'."""
+    
+    def __init__(self):
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+    
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+    
+    async def handle(self, reader, writer):
+        line = (await reader.readline()).decode().strip()
+        ids = line.split(",")
+        self.requests.append(ids)
+        writer.write((",".join("missing" if i == "0" else f"user{i}" for i in ids) + "\n").encode())
+        await writer.drain()
+        writer.close()
+    
+    async def names(self, ids):
+        """Client used as a batch converter."""
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+            writer.write((",".join(str(int(i)) for i in ids) + "\n").encode())
+            await writer.drain()
+            names = (await reader.readline()).decode().strip().split(",")
+            writer.close()
+            await asyncio.sleep(0.01)
+            return names
+        finally:
+            self.in_flight -= 1
+    
+    async def name(self, user_id):
+        """Client used as a single-value converter."""
+        names = await self.names([user_id])
+        if names[0] == "missing":
+            raise LookupError(f"No user {user_id}")
+        return names[0]
+
+class TestAsyncConversion(unittest.TestCase):
+    """Test async converters against a local stub service."""
+    
+    def setUp(self):
+        """Set up a fresh registry and stub service for each test."""
+        self.registry = ConversionRegistry()
+        self.service = StubNameService()
+    
+    def run_with_service(self, coro_factory):
+        async def main():
+            await self.service.start()
+            try:
+                return await coro_factory()
+            finally:
+                await self.service.stop()
+        return asyncio.run(main())
+    
+    def test_dedupes_and_batches(self):
+        """Test that identical inputs are converted once, in batches."""
+        self.registry.register_async('str', UserId, self.service.names, batch_size=2)
+        values = [UserId(1), UserId(2), UserId(1), 5, UserId(3), UserId(2)]
+        
+        results = self.run_with_service(lambda: aconvert_many(values, 'str', registry=self.registry))
+        
+        self.assertEqual(results, ["user1", "user2", "user1", "5", "user3", "user2"])
+        self.assertEqual(sorted(map(len, self.service.requests)), [1, 2])
+        self.assertEqual(sorted(i for ids in self.service.requests for i in ids), ["1", "2", "3"])
+    
+    def test_caps_concurrency(self):
+        """Test that at most ``concurrency`` converter calls are in flight."""
+        self.registry.register_async('str', UserId, self.service.name)
+        values = [UserId(i) for i in range(1, 21)]
+        
+        results = self.run_with_service(lambda: aconvert_many(values, 'str', concurrency=3, registry=self.registry))
+        
+        self.assertEqual(results, [f"user{i}" for i in range(1, 21)])
+        self.assertEqual(len(self.service.requests), 20)
+        self.assertEqual(self.service.max_in_flight, 3)
+    
+    def test_failures_use_registry_fallbacks(self):
+        """Test that failed async conversions fall back or raise like convert()."""
+        self.registry.register_async('str', UserId, self.service.name)
+        
+        result = self.run_with_service(lambda: aconvert(UserId(0), 'str', registry=self.registry))
+        self.assertEqual(result, "0")
+        
+        config = get_config()
+        config.raise_errors = True
+        try:
+            with self.assertRaises(TypeError):
+                self.run_with_service(lambda: aconvert_many([UserId(0), UserId(1)], 'str', registry=self.registry))
+        finally:
+            config.raise_errors = False
+    
+    def test_sync_conversion_ignores_async_converters(self):
+        """Test that async converters do not leak into synchronous conversion."""
+        self.registry.register_async('int', str, self.service.name)
+        self.assertEqual(self.registry.to_int("7"), 7)
+        self.assertEqual(list(asyncio.run(aconvert_many(["1", 2], 'int', registry=ConversionRegistry()))), [1, 2])
+
+if __name__ == "__main__":
+    unittest.main()
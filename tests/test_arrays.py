@@ -0,0 +1,60 @@
+"""
+Tests for NumPy-backed Flow arrays.
+"""
+
+import unittest
+
+from typeflow import FlowArray, FlowInt, FlowStr, configure
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestFlowArray(unittest.TestCase):
+    """Test FlowArray operators and NumPy interoperability."""
+    
+    def tearDown(self):
+        configure(verbose=False, raise_errors=False)
+    
+    def test_string_column_plus_number(self):
+        """Test that a column of strings is parsed once and broadcast."""
+        column = FlowArray(['1', '2', '3'])
+        self.assertEqual((column + 4).tolist(), [5, 6, 7])
+        self.assertEqual((4 + column).tolist(), [5, 6, 7])
+        self.assertIs(column.numbers(), column.numbers())
+        self.assertEqual((FlowArray(['1.5', '2']) * 2).tolist(), [3.0, 4.0])
+    
+    def test_string_concatenation(self):
+        """Test vectorized concatenation with strings."""
+        self.assertEqual((FlowArray([1, 2]) + ' units').tolist(), ['1 units', '2 units'])
+        self.assertEqual(('$' + FlowArray(['1', '2'])).tolist(), ['$1', '$2'])
+        self.assertEqual((FlowArray(['a', 'b']) + FlowArray(['x', 'y'])).tolist(), ['ax', 'by'])
+    
+    def test_invalid_values(self):
+        """Test that unparsable values count as 0 unless errors are raised."""
+        self.assertEqual((FlowArray(['1', 'x', '2.5']) + 1).tolist(), [2.0, 1.0, 3.5])
+        
+        configure(raise_errors=True)
+        with self.assertRaises(TypeError):
+            FlowArray(['1', 'x']) + 1
+    
+    def test_numpy_operands(self):
+        """Test NumPy arrays and scalars on either side of a FlowArray."""
+        column = FlowArray(['1', '2', '3'])
+        self.assertIsInstance(np.array([10, 20, 30]) + column, FlowArray)
+        self.assertEqual((np.array([10, 20, 30]) + column).tolist(), [11, 22, 33])
+        self.assertEqual((np.int64(2) * column).tolist(), [2, 4, 6])
+        self.assertEqual(np.sqrt(FlowArray([4, 9])).tolist(), [2.0, 3.0])
+        self.assertEqual(np.asarray(column).tolist(), ['1', '2', '3'])
+    
+    def test_flow_types_with_arrays(self):
+        """Test NumPy arrays and scalars as operands of the Flow types."""
+        self.assertEqual((FlowInt(3) + np.array([1, 2])).tolist(), [4, 5])
+        self.assertEqual((FlowInt(2) * FlowArray(['1', '2'])).tolist(), [2, 4])
+        self.assertEqual((FlowStr('#') + np.array([1, 2])).tolist(), ['#1', '#2'])
+        self.assertEqual(FlowInt(3) + np.float32(1.5), 4.5)
+
+if __name__ == "__main__":
+    unittest.main()
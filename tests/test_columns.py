@@ -0,0 +1,69 @@
+"""
+Tests for NumPy-backed column conversion.
+"""
+
+import unittest
+
+from typeflow import convert_column
+from typeflow.converters import ConversionRegistry
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestConvertColumn(unittest.TestCase):
+    """Test convert_column()."""
+    
+    def test_int_column(self):
+        """Test clean, blank and invalid integer strings."""
+        values, mask = convert_column(["1", " 2 ", "", "x", "-7", "3.0"], 'int')
+        self.assertEqual(values.dtype, np.int64)
+        self.assertEqual(mask.tolist(), [True, True, False, False, True, False])
+        self.assertEqual(values[mask].tolist(), [1, 2, -7])
+    
+    def test_float_column_from_bytes(self):
+        """Test bytes input and values only the registry can parse."""
+        values, mask = convert_column([b"1.5", b" 2", b"inf", b"1-2", b""], 'float')
+        self.assertEqual(mask.tolist(), [True, True, True, False, False])
+        self.assertEqual(values[:3].tolist(), [1.5, 2.0, float("inf")])
+    
+    def test_bool_column(self):
+        """Test the boolean vocabulary and nulls."""
+        values, mask = convert_column(["yes", "No", "", "1", "off", None], 'bool')
+        self.assertEqual(mask.tolist(), [True, True, False, True, True, False])
+        self.assertEqual(values[mask].tolist(), [True, False, True, False])
+    
+    def test_bool_column_rejects_unknown_words(self):
+        """Test that unrecognised words are invalid instead of False."""
+        values, mask = convert_column(["true", "maybe", "", " yes", "0"], 'bool')
+        self.assertEqual(mask.tolist(), [True, False, False, False, True])
+        self.assertEqual(values[mask].tolist(), [True, False])
+    
+    def test_mixed_objects_use_registry(self):
+        """Test that non-string rows go through the registry."""
+        class Cents:
+            def __init__(self, amount):
+                self.amount = amount
+        
+        registry = ConversionRegistry()
+        registry.register_float(Cents, lambda c: c.amount / 100)
+        
+        values, mask = convert_column(["1.5", 2, Cents(250), object()], 'float', registry=registry)
+        self.assertEqual(mask.tolist(), [True, True, True, False])
+        self.assertEqual(values[:3].tolist(), [1.5, 2.0, 2.5])
+    
+    def test_numeric_arrays(self):
+        """Test that numeric ndarrays are cast directly."""
+        values, mask = convert_column(np.array([1.9, np.nan]), 'int')
+        self.assertEqual(mask.tolist(), [True, False])
+        self.assertEqual(values[0], 1)
+    
+    def test_unknown_target(self):
+        """Test that unsupported targets are rejected."""
+        with self.assertRaises(ValueError):
+            convert_column(["a"], 'dict')
+
+if __name__ == "__main__":
+    unittest.main()
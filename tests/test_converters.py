@@ -0,0 +1,479 @@
+"""
+Tests for the TypeFlow conversion registry.
+"""
+
+import array
+import asyncio
+import datetime
+import decimal
+import mmap
+import threading
+import unittest
+import uuid
+
+from typeflow import flow
+from typeflow.converters import ConversionRegistry, ConverterOverlay, TargetKind
+from typeflow.datetimes import DatetimeParser
+
+class TestConverterResolution(unittest.TestCase):
+    """Test how converters are resolved for source types."""
+    
+    def setUp(self):
+        """Set up a fresh registry for each test."""
+        self.registry = ConversionRegistry()
+    
+    def test_subclass_uses_closest_registered_base(self):
+        """Test that resolution follows the MRO of the source type."""
+        class Base:
+            pass
+        
+        class Child(Base):
+            pass
+        
+        self.registry.register_int(object, lambda x: 1)
+        self.registry.register_int(Base, lambda x: 2)
+        self.assertEqual(self.registry.to_int(Child()), 2)
+        
+        # Subclasses must not be written back into the converter table
+        self.assertNotIn(Child, self.registry._snapshot.converters["int"])
+    
+    def test_misses_are_cached(self):
+        """Test that types without a converter are only resolved once."""
+        class Unknown:
+            pass
+        
+        calls = []
+        snapshot = self.registry._snapshot
+        original = snapshot.resolve
+        snapshot.resolve = lambda t, target: calls.append(t) or original(t, target)
+        
+        self.registry.to_float(Unknown())
+        self.registry.to_float(Unknown())
+        self.assertEqual(calls, [Unknown])
+    
+    def test_registration_invalidates_resolutions(self):
+        """Test that registering a converter replaces cached misses."""
+        class Meters:
+            def __init__(self, value):
+                self.value = value
+        
+        self.registry.warmup([Meters])
+        self.assertEqual(self.registry.to_int(Meters(5)), 0)
+        
+        self.registry.register_int(Meters, lambda m: m.value)
+        self.assertEqual(self.registry.to_int(Meters(5)), 5)
+    
+    def test_resolution_cache_is_bounded(self):
+        """Test that the resolution cache evicts old types."""
+        registry = ConversionRegistry(cache_size=4)
+        types = [type(f"T{i}", (), {}) for i in range(10)]
+        registry.warmup(types)
+        self.assertLessEqual(len(registry._snapshot.matrix), 4)
+
+class TestDispatchMatrix(unittest.TestCase):
+    """Test the unified (source type, target kind) dispatch."""
+    
+    def setUp(self):
+        """Set up a fresh registry for each test."""
+        self.registry = ConversionRegistry()
+    
+    def test_to_methods_share_one_dispatch_path(self):
+        """Test that every to_* method goes through convert()."""
+        self.assertEqual(self.registry.to_str(None), "None")
+        self.assertEqual(self.registry.to_int(" 42 "), 42)
+        self.assertEqual(self.registry.to_float("x"), 0.0)
+        self.assertEqual(self.registry.to_bool("yes"), True)
+        self.assertEqual(self.registry.to_list(7), [7])
+        self.assertEqual(self.registry.to_dict(object), {0: object})
+        self.assertEqual(self.registry.convert("3", 'int'), 3)
+    
+    def test_generation_tracks_registrations(self):
+        """Test that registering a converter bumps the generation."""
+        generation = self.registry.generation
+        self.registry.register('int', complex, lambda c: int(c.real))
+        self.assertEqual(self.registry.generation, generation + 1)
+        self.assertEqual(self.registry.to_int(3 + 4j), 3)
+    
+    def test_unknown_target(self):
+        """Test that unknown targets are rejected."""
+        with self.assertRaises(ValueError):
+            self.registry.register('complex', int, complex)
+        with self.assertRaises(ValueError):
+            self.registry.convert(1, 'complex')
+    
+    def test_add_target(self):
+        """Test adding a new target kind to the matrix."""
+        self.registry.add_target(TargetKind('complex', 'complex', complex, lambda x: 0j, lambda x: 0j, '0j'))
+        self.registry.register('complex', str, lambda s: complex(s.strip()))
+        self.assertEqual(self.registry.convert(" 1+2j ", 'complex'), 1 + 2j)
+        self.assertEqual(self.registry.convert(2, 'complex'), 2 + 0j)
+
+class TestBatchConversion(unittest.TestCase):
+    """Test the *_many batch conversion methods."""
+    
+    def setUp(self):
+        """Set up a fresh registry for each test."""
+        self.registry = ConversionRegistry()
+    
+    def test_numeric_targets_return_arrays(self):
+        """Test that numeric results are packed into arrays in input order."""
+        ints = self.registry.to_int_many(["1", 2, 3.7, None, "bad", b" 6 "])
+        self.assertEqual(ints, array.array('q', [1, 2, 3, 0, 0, 6]))
+        
+        floats = self.registry.to_float_many(iter(["1.5", 2]))
+        self.assertEqual(floats, array.array('d', [1.5, 2.0]))
+        
+        bools = self.registry.to_bool_many(["yes", "no", 0, 1.0])
+        self.assertEqual(bools.tolist(), [1, 0, 0, 1])
+    
+    def test_other_targets_return_lists(self):
+        """Test that str, list and dict targets return lists."""
+        self.assertEqual(self.registry.to_str_many([1, True, None]), ["1", "True", "None"])
+        self.assertEqual(self.registry.to_list_many([(1, 2), 3]), [[1, 2], [3]])
+        self.assertEqual(self.registry.to_dict_many([[5]]), [{0: 5}])
+    
+    def test_large_integers_fall_back_to_list(self):
+        """Test that integers beyond 64 bits are kept exact."""
+        self.assertEqual(self.registry.to_int_many([2 ** 70, "1"]), [2 ** 70, 1])
+    
+    def test_non_numeric_results_fall_back_to_list(self):
+        """Test that custom converters returning other values give a list."""
+        self.registry.register_int(str, lambda value: value.strip())
+        self.assertEqual(self.registry.to_int_many([" a ", "b"]), ["a", "b"])
+    
+    def test_converter_resolved_once_per_type(self):
+        """Test that each type group resolves its converter once."""
+        calls = []
+        snapshot = self.registry._snapshot
+        original = snapshot.resolve
+        snapshot.resolve = lambda t, target: calls.append(t) or original(t, target)
+        
+        self.registry.to_int_many(["1", 2, "3", 4, "5"])
+        self.assertEqual(sorted(calls, key=lambda t: t.__name__), [int, str])
+
+class TestValueCache(unittest.TestCase):
+    """Test memoization of repeated values."""
+    
+    def setUp(self):
+        """Set up a fresh registry with the value cache enabled."""
+        self.registry = ConversionRegistry()
+        self.registry.enable_value_cache(maxsize=3)
+    
+    def test_disabled_by_default(self):
+        """Test that the value cache is opt-in."""
+        self.assertIsNone(ConversionRegistry().value_cache_info())
+    
+    def test_hits_misses_and_evictions(self):
+        """Test the cache statistics."""
+        for value in ["1", "1", "2", "1", "3", "4"]:
+            self.registry.to_int(value)
+        
+        info = self.registry.value_cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions), (2, 4, 1))
+        self.assertEqual(info.currsize, 3)
+    
+    def test_only_immutable_inputs_and_results(self):
+        """Test which values and targets are cached."""
+        self.registry.to_int(5)
+        self.registry.to_list("a")
+        self.registry.to_list("a")
+        self.assertEqual(self.registry.value_cache_info().currsize, 0)
+    
+    def test_equal_decimals_are_distinct(self):
+        """Test that Decimals are keyed by their exact representation."""
+        self.assertEqual(self.registry.to_str(decimal.Decimal("1")), "1")
+        self.assertEqual(self.registry.to_str(decimal.Decimal("1.0")), "1.0")
+    
+    def test_failures_are_not_cached(self):
+        """Test that failed conversions keep falling back."""
+        self.assertEqual(self.registry.to_int("x"), 0)
+        self.assertEqual(self.registry.value_cache_info().currsize, 0)
+    
+    def test_registration_invalidates(self):
+        """Test that registering a relevant converter drops cached results."""
+        self.assertEqual(self.registry.to_int("7"), 7)
+        self.registry.register_float(list, float)
+        self.assertEqual(self.registry.value_cache_info().currsize, 1)
+        
+        self.registry.register_int(str, lambda s: int(s) * 2)
+        self.assertEqual(self.registry.to_int("7"), 14)
+
+class TestBufferConversion(unittest.TestCase):
+    """Test conversions straight from bytes-like buffers."""
+    
+    def setUp(self):
+        """Set up a fresh registry for each test."""
+        self.registry = ConversionRegistry()
+    
+    def test_bytes_and_bytearray(self):
+        """Test numeric and boolean parsing of bytes."""
+        self.assertEqual(self.registry.to_int(b" 12 "), 12)
+        self.assertEqual(self.registry.to_float(bytearray(b"2.5\n")), 2.5)
+        self.assertEqual(self.registry.to_bool(b"YES"), True)
+        self.assertEqual(self.registry.to_bool(b"no"), False)
+        self.assertEqual(self.registry.to_int(b"twelve"), 0)
+    
+    def test_memoryview_slices_of_mmap(self):
+        """Test parsing fields out of a memory-mapped buffer."""
+        buffer = mmap.mmap(-1, 16)
+        buffer.write(b"  42 1.5 on")
+        view = memoryview(buffer)
+        try:
+            self.assertEqual(self.registry.to_int(view[0:4]), 42)
+            self.assertEqual(self.registry.to_float(view[5:8]), 1.5)
+            self.assertEqual(self.registry.to_bool(view[9:11]), True)
+            self.assertEqual(self.registry.to_str(view[9:11]), "on")
+        finally:
+            view.release()
+            buffer.close()
+    
+    def test_register_memoryview_converter(self):
+        """Test that memoryview can be used as a source type."""
+        self.registry.register('int', memoryview, lambda v: int.from_bytes(v, 'big'))
+        self.assertEqual(self.registry.to_int(memoryview(b"\x01\x00")), 256)
+
+class TestConversionPaths(unittest.TestCase):
+    """Test chaining converters through other target kinds."""
+    
+    def setUp(self):
+        """Set up a registry with a type that only converts to str."""
+        self.registry = ConversionRegistry()
+        
+        class Sku:
+            def __init__(self, code):
+                self.code = code
+        
+        self.Sku = Sku
+        self.registry.register_str(Sku, lambda sku: sku.code)
+    
+    def test_chained_conversions(self):
+        """Test that a str converter is enough for every target."""
+        self.assertEqual(self.registry.to_int(self.Sku(" 42 ")), 42)
+        self.assertEqual(self.registry.to_float(self.Sku("1.5")), 1.5)
+    
+    def test_shortest_path(self):
+        """Test the paths that are chosen."""
+        self.assertEqual(self.registry.conversion_path(self.Sku, 'int'), ['str', 'int'])
+        
+        self.assertEqual(self.registry.conversion_path(self.Sku, 'datetime'), ['str', 'datetime'])
+        
+        self.registry.register_int(self.Sku, lambda sku: int(sku.code))
+        self.assertEqual(self.registry.conversion_path(self.Sku, 'int'), ['int'])
+    
+    def test_builtin_protocols_take_precedence(self):
+        """Test that types the builtin constructors handle are not chained."""
+        self.assertEqual(self.registry.conversion_path(int, 'str'), ['str'])
+        self.assertEqual(self.registry.conversion_path(decimal.Decimal, 'bool'), [])
+        self.assertEqual(self.registry.to_bool((0,)), True)
+    
+    def test_bool_list_and_dict_are_never_chained(self):
+        """Test that truthiness and the wrapping fallbacks apply instead of a chain."""
+        self.registry.register_str(datetime.datetime, lambda value: "no")
+        for value in (datetime.datetime.now(), datetime.date.today(), datetime.time(), uuid.uuid4(), self.Sku("no")):
+            self.assertIs(self.registry.to_bool(value), True)
+        for value in (decimal.Decimal("1.5"), datetime.datetime(2024, 1, 1), uuid.UUID(int=1)):
+            self.assertEqual(self.registry.to_list(value), [value])
+        self.assertEqual(self.registry.to_dict(self.Sku("a"))[0].code, "a")
+        self.assertEqual(flow([1]) + decimal.Decimal("1.5"), [1, decimal.Decimal("1.5")])
+    
+    def test_failed_chain_falls_back(self):
+        """Test that a chain that fails uses the target's default."""
+        self.assertEqual(self.registry.to_int(self.Sku("abc")), 0)
+
+class TestConcurrentRegistration(unittest.TestCase):
+    """Test readers converting while writers register converters."""
+    
+    def test_readers_see_consistent_snapshots(self):
+        """Test that conversions keep working during registrations."""
+        registry = ConversionRegistry()
+        types = [type(f"Plugin{i}", (), {}) for i in range(200)]
+        errors = []
+        done = threading.Event()
+        
+        def read():
+            try:
+                while not done.is_set():
+                    for type_ in types:
+                        registry.to_int(type_())
+                        self.assertEqual(registry.to_int("5"), 5)
+            except Exception as e:
+                errors.append(e)
+        
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        
+        for i, type_ in enumerate(types):
+            registry.register_int(type_, lambda value, i=i: i)
+        done.set()
+        
+        for reader in readers:
+            reader.join()
+        
+        self.assertEqual(errors, [])
+        self.assertEqual(registry.to_int(types[7]()), 7)
+    
+    def test_published_tables_are_read_only(self):
+        """Test that snapshots can't be modified in place."""
+        registry = ConversionRegistry()
+        with self.assertRaises(TypeError):
+            registry._snapshot.converters["int"][complex] = int
+
+class TestConverterScopes(unittest.TestCase):
+    """Test ContextVar-scoped converter overlays."""
+    
+    def setUp(self):
+        """Set up a fresh registry and a comma-decimal overlay."""
+        self.registry = ConversionRegistry()
+        self.european = {'float': {str: lambda s: float(s.replace(",", "."))}}
+    
+    def test_scope_overrides_and_restores(self):
+        """Test that an overlay applies only inside the scope."""
+        with self.registry.scope(self.european):
+            self.assertEqual(self.registry.to_float("1,5"), 1.5)
+            self.assertEqual(self.registry.to_int("7"), 7)
+            self.assertEqual(self.registry.to_float_many(["2,5"]), array.array('d', [2.5]))
+        self.assertEqual(self.registry.to_float("1,5"), 0.0)
+    
+    def test_nested_scopes(self):
+        """Test that the innermost overlay takes precedence."""
+        with self.registry.scope(self.european):
+            with self.registry.scope({'int': {str: lambda s: int(s, 16)}}):
+                self.assertEqual(self.registry.to_int("ff"), 255)
+                self.assertEqual(self.registry.to_float("1,5"), 1.5)
+            self.assertEqual(self.registry.to_int("ff"), 0)
+    
+    def test_threads_are_isolated(self):
+        """Test that a scope in one thread does not leak into another."""
+        results = {}
+        entered = threading.Event()
+        release = threading.Event()
+        
+        def tenant():
+            with self.registry.scope(self.european):
+                entered.set()
+                release.wait()
+                results['tenant'] = self.registry.to_float("1,5")
+        
+        thread = threading.Thread(target=tenant)
+        thread.start()
+        entered.wait()
+        results['other'] = self.registry.to_float("1,5")
+        release.set()
+        thread.join()
+        
+        self.assertEqual(results, {'tenant': 1.5, 'other': 0.0})
+    
+    def test_asyncio_tasks_are_isolated(self):
+        """Test that concurrent tasks each see their own overlay."""
+        async def handle(overlay, value):
+            with self.registry.scope(overlay):
+                await asyncio.sleep(0)
+                return self.registry.to_int(value)
+        
+        async def main():
+            return await asyncio.gather(
+                handle({'int': {str: lambda s: int(s, 16)}}, "10"),
+                handle({'int': {str: lambda s: int(s, 2)}}, "10"),
+            )
+        
+        self.assertEqual(asyncio.run(main()), [16, 2])
+    
+    def test_reusable_overlay(self):
+        """Test that a ConverterOverlay reuses its compiled matrix."""
+        overlay = ConverterOverlay(self.european)
+        with self.registry.scope(overlay):
+            self.registry.to_float("1,5")
+            snapshot = overlay.snapshot(self.registry._snapshot)
+        with self.registry.scope(overlay):
+            self.assertIs(overlay.snapshot(self.registry._snapshot), snapshot)
+    
+    def test_nested_overlays_are_reused(self):
+        """Test that re-entering the same nested scopes reuses their snapshot."""
+        outer = ConverterOverlay(self.european)
+        inner = ConverterOverlay({'int': {str: lambda s: int(s, 16)}})
+        snapshots = []
+        for _ in range(2):
+            with self.registry.scope(outer), self.registry.scope(inner):
+                self.assertEqual(self.registry.to_int("ff"), 255)
+                snapshots.append(self.registry._current_snapshot())
+        self.assertIs(snapshots[0], snapshots[1])
+    
+    def test_scopes_are_counted(self):
+        """Test that the overlay lookup is skipped once every scope exits."""
+        with self.registry.scope(self.european):
+            with self.registry.scope(self.european):
+                pass
+            self.assertTrue(self.registry._scoped)
+            self.assertEqual(self.registry.to_float("1,5"), 1.5)
+        self.assertFalse(self.registry._scoped)
+        
+        with self.assertRaises(RuntimeError):
+            with self.registry.scope(self.european):
+                raise RuntimeError
+        self.assertFalse(self.registry._scoped)
+    
+    def test_unknown_target(self):
+        """Test that overlays for unknown targets are rejected."""
+        with self.assertRaises(ValueError):
+            with self.registry.scope({'complex': {str: complex}}):
+                pass
+
+class TestDatetimeTarget(unittest.TestCase):
+    """Test conversion to datetimes."""
+    
+    def setUp(self):
+        """Set up a fresh registry for each test."""
+        self.registry = ConversionRegistry()
+    
+    def test_iso_strings_bytes_and_epochs(self):
+        """Test the ISO fast path, bytes input and epoch timestamps."""
+        utc = datetime.timezone.utc
+        self.assertEqual(self.registry.to_datetime(" 2024-03-01T12:30:00 "), datetime.datetime(2024, 3, 1, 12, 30))
+        self.assertEqual(self.registry.to_datetime(b"2024-03-01"), datetime.datetime(2024, 3, 1))
+        self.assertEqual(self.registry.to_datetime(0), datetime.datetime(1970, 1, 1, tzinfo=utc))
+        self.assertEqual(self.registry.to_datetime(1.5), datetime.datetime(1970, 1, 1, 0, 0, 1, 500000, tzinfo=utc))
+        self.assertEqual(self.registry.to_datetime(datetime.date(2024, 3, 1)), datetime.datetime(2024, 3, 1))
+        self.assertIsNone(self.registry.to_datetime("not a date"))
+        self.assertIsNone(self.registry.to_datetime(None))
+    
+    def test_format_is_detected_once(self):
+        """Test that a forked parser reuses the detected format for following values."""
+        parser = DatetimeParser().fork()
+        self.assertEqual(parser("25/12/2023 08:00"), datetime.datetime(2023, 12, 25, 8, 0))
+        self.assertEqual(parser.format, '%d/%m/%Y %H:%M')
+        self.assertEqual(parser("26/12/2023 09:15"), datetime.datetime(2023, 12, 26, 9, 15))
+        self.assertEqual(parser.format, '%d/%m/%Y %H:%M')
+        
+        # A value in another format switches the parser over
+        self.assertEqual(parser("2023-12-27"), datetime.datetime(2023, 12, 27))
+        self.assertIsNone(parser.format)
+    
+    def test_single_values_ignore_call_history(self):
+        """Test that an ambiguous value parses the same whatever came before."""
+        expected = self.registry.to_datetime("01/02/2024")
+        self.assertEqual(expected, datetime.datetime(2024, 1, 2))
+        self.assertEqual(self.registry.to_datetime("13/02/2024"), datetime.datetime(2024, 2, 13))
+        self.assertEqual(self.registry.to_datetime("01/02/2024"), expected)
+        self.assertIsNone(DatetimeParser().format)
+    
+    def test_batches_detect_their_own_format(self):
+        """Test that each batch gets its own parser state."""
+        self.assertEqual(self.registry.to_datetime_many(["Mar 01, 2024", "Mar 02, 2024"]),
+                         [datetime.datetime(2024, 3, 1), datetime.datetime(2024, 3, 2)])
+    
+    def test_registered_and_chained_converters(self):
+        """Test custom datetime converters and chaining through str."""
+        class Stamp:
+            def __init__(self, text):
+                self.text = text
+        
+        self.registry.register_str(Stamp, lambda x: x.text)
+        self.assertEqual(self.registry.conversion_path(Stamp, 'datetime'), ['str', 'datetime'])
+        self.assertEqual(self.registry.to_datetime(Stamp("2024-01-02")), datetime.datetime(2024, 1, 2))
+        
+        self.registry.register('datetime', str, DatetimeParser(['%Y.%m.%d']))
+        self.assertEqual(self.registry.to_datetime("2024.05.06"), datetime.datetime(2024, 5, 6))
+
+if __name__ == "__main__":
+    unittest.main()
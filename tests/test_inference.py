@@ -0,0 +1,63 @@
+"""
+Tests for TypeFlow type inference.
+"""
+
+import datetime
+import io
+import itertools
+import unittest
+
+from typeflow.converters import ConversionRegistry
+from typeflow.inference import ColumnProfile, infer
+from typeflow.io import read_csv
+
+class TestInfer(unittest.TestCase):
+    """Test sample-based classification of columns."""
+    
+    def test_classifies_record_fields(self):
+        """Test classifying the fields of records."""
+        records = [
+            {'id': '1', 'price': ' 2.5', 'paid': 'yes', 'at': '2024-01-02T03:04:05', 'note': 'hi'},
+            {'id': ' 2 ', 'price': '3', 'paid': 'No', 'at': '2024-01-03', 'note': '5', 'extra': None},
+        ]
+        self.assertEqual(infer(records), {
+            'id': 'int', 'price': 'float', 'paid': 'bool', 'at': 'datetime', 'note': 'str', 'extra': 'str',
+        })
+        self.assertEqual(infer(records, details=True)['at'], ColumnProfile('datetime', 'datetime', 2, 0))
+    
+    def test_matches_default_converter_semantics(self):
+        """Test that inferred kinds agree with what the default converters do."""
+        registry = ConversionRegistry()
+        self.assertEqual(infer(['0', '1', '1']), 'int')
+        self.assertEqual(infer(['0', '1', 'yes']), 'bool')
+        # str -> bool does not strip, so ' yes' would convert to False
+        self.assertEqual(infer(['yes', ' yes']), 'str')
+        self.assertFalse(registry.to_bool(' yes'))
+        # str -> int strips, so ' 7 ' is an int
+        self.assertEqual(infer([' 7 ', 8]), 'int')
+        self.assertEqual(registry.to_int(' 7 '), 7)
+    
+    def test_python_values_and_nulls(self):
+        """Test non-string values, null-heavy columns and row input."""
+        self.assertEqual(infer([True, False]), 'bool')
+        self.assertEqual(infer([1, 2.5]), 'float')
+        self.assertEqual(infer([datetime.date(2024, 1, 1), '2024-01-02', '03/01/2024']), 'datetime')
+        self.assertEqual(infer([None, '', '3'], details=True), ColumnProfile('null', 'int', 3, 2))
+        self.assertEqual(infer([(1, 'a'), (2, 'b', 'x')]), ['int', 'str', 'str'])
+        self.assertEqual(infer([None, (1, 'a')], details=True)[0], ColumnProfile('null', 'int', 2, 1))
+        self.assertEqual(infer({'a': ['1', '2'], 'b': ['y', 'n']}), {'a': 'int', 'b': 'bool'})
+    
+    def test_sample_limits_the_scan(self):
+        """Test that only the first ``sample`` items are looked at."""
+        values = itertools.chain(['1'] * 10, ['x'])
+        self.assertEqual(infer(values, sample=10), 'int')
+    
+    def test_drives_csv_reader(self):
+        """Test that an inferred schema can be used with read_csv()."""
+        data = "id,price,ok\n1,2.5,yes\n2,3,no\n"
+        schema = infer(itertools.islice(read_csv(io.StringIO(data)), 100))
+        rows = list(read_csv(io.StringIO(data), schema))
+        self.assertEqual(rows[1], {'id': 2, 'price': 3.0, 'ok': False})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Tests for TypeFlow streaming readers.
+"""
+
+import datetime
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from typeflow.converters import ConversionRegistry
+from typeflow.io import read_csv, read_jsonl
+from typeflow.types import FlowDict
+
+CSV = "id,price,active,name\n1,9.5,yes,apple\n2,,no,pear\nx,1.0,yes,plum\n3,2.5,maybe,fig\n4,3\n"
+
+class TestReadCSV(unittest.TestCase):
+    """Test streaming CSV conversion."""
+    
+    def setUp(self):
+        """Set up a fresh registry for each test."""
+        self.registry = ConversionRegistry()
+        self.schema = {'id': int, 'price': 'float', 'active': bool}
+    
+    def test_converts_columns_and_reports_bad_rows(self):
+        """Test that bad rows go to on_error instead of being coerced."""
+        errors = []
+        rows = list(read_csv(io.StringIO(CSV), self.schema, on_error=errors.append, registry=self.registry))
+        
+        self.assertEqual(rows, [
+            {'id': 1, 'price': 9.5, 'active': True, 'name': 'apple'},
+            {'id': 2, 'price': None, 'active': False, 'name': 'pear'},
+        ])
+        self.assertEqual([(e.line, e.column, e.value) for e in errors],
+                         [(4, 'id', 'x'), (5, 'active', 'maybe'), (6, None, None)])
+        self.assertEqual(errors[0].row, ['x', '1.0', 'yes', 'plum'])
+    
+    def test_raises_without_side_channel(self):
+        """Test that a failing row raises when no on_error is given."""
+        with self.assertRaisesRegex(ValueError, "line 4 in column 'id'"):
+            list(read_csv(io.StringIO(CSV), self.schema, registry=self.registry))
+    
+    def test_batches_from_path_and_binary_file(self):
+        """Test batching, paths and binary file objects."""
+        data = "a,b\n" + "".join(f"{i},{i * 2}\n" for i in range(5))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.csv")
+            with open(path, "w", newline="") as f:
+                f.write(data)
+            
+            batches = list(read_csv(path, {'a': int}, batch_size=2, registry=self.registry))
+            self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+            self.assertEqual(batches[2], [{'a': 4, 'b': '8'}])
+            
+            with open(path, "rb") as f:
+                rows = list(read_csv(f, {'b': int}, registry=self.registry))
+                self.assertFalse(f.closed)
+            self.assertEqual(rows[-1], {'a': '4', 'b': 8})
+    
+    def test_uses_registered_converters(self):
+        """Test that column converters come from the registry."""
+        self.registry.register_int(str, lambda x: int(x, 16))
+        rows = read_csv(io.StringIO("n\nff\n"), {'n': int}, registry=self.registry)
+        self.assertEqual(next(rows), {'n': 255})
+    
+    def test_datetime_formats_per_column(self):
+        """Test that each datetime column detects its own format."""
+        data = "us,eu\n03/04/2024,13/04/2024\n03/05/2024,14/05/2024\n"
+        rows = list(read_csv(io.StringIO(data), {'us': datetime.datetime, 'eu': 'datetime'}, registry=self.registry))
+        self.assertEqual(rows[1], {'us': datetime.datetime(2024, 3, 5), 'eu': datetime.datetime(2024, 5, 14)})
+    
+    def test_unknown_column(self):
+        """Test that schema columns must exist in the header."""
+        with self.assertRaises(ValueError):
+            next(read_csv(io.StringIO("a\n1\n"), {'b': int}, registry=self.registry))
+
+EVENTS = [
+    {"id": "1", "order": {"items": [{"qty": "2", "sku": "a"}], "paid": "yes"}},
+    {"id": "2", "order": {"items": [{"qty": "3", "sku": "b"}, {"qty": "1"}], "paid": "no"}},
+    {"id": "3", "order": {"items": [{"qty": "2.5"}], "paid": "maybe"}, "new": "7"},
+]
+
+class TestReadJSONL(unittest.TestCase):
+    """Test JSON Lines conversion with learned key path plans."""
+    
+    def setUp(self):
+        """Set up a fresh registry for each test."""
+        self.registry = ConversionRegistry()
+        self.data = "".join(json.dumps(event) + "\n" for event in EVENTS)
+    
+    def test_converts_learned_paths_and_reports_drift(self):
+        """Test that paths re-specialize when their type drifts."""
+        drifts = []
+        records = list(read_jsonl(io.StringIO(self.data), learn=2, on_drift=drifts.append, registry=self.registry))
+        
+        self.assertEqual(records[1], {"id": 2, "order": {"items": [{"qty": 3, "sku": "b"}, {"qty": 1}], "paid": False}})
+        # Paths first seen after learning are left alone
+        self.assertEqual(records[2], {"id": 3, "order": {"items": [{"qty": 2.5}], "paid": "maybe"}, "new": "7"})
+        self.assertEqual([(d.path, d.old, d.new, d.line) for d in drifts],
+                         [("order.items[].qty", "int", "float", 3), ("order.paid", "bool", "str", 3)])
+    
+    def test_float_at_int_path_is_drift(self):
+        """Test that fractional floats are not truncated at int paths."""
+        data = '{"n": "1"}\n{"n": 2.0}\n{"n": 2.5}\n'
+        drifts = []
+        records = list(read_jsonl(io.StringIO(data), learn=1, on_drift=drifts.append, registry=self.registry))
+        self.assertEqual([r["n"] for r in records], [1, 2, 2.5])
+        self.assertEqual(len(drifts), 1)
+    
+    def test_stricter_converter_drifts_once(self):
+        """Test that a value only the registry rejects widens the path to str once."""
+        def strict_int(value):
+            if not value.isdigit():
+                raise ValueError(f"Not a plain integer: {value!r}")
+            return int(value)
+        
+        self.registry.register_int(str, strict_int)
+        data = '{"n": "1"}\n{"n": "1_000"}\n{"n": "5"}\n'
+        drifts = []
+        records = list(read_jsonl(io.StringIO(data), learn=1, on_drift=drifts.append, registry=self.registry))
+        self.assertEqual([r["n"] for r in records], [1, "1_000", "5"])
+        self.assertEqual([(d.old, d.new, d.line) for d in drifts], [("int", "str", 2)])
+    
+    def test_flow_dicts_and_bad_lines(self):
+        """Test FlowDict output and the side channel for invalid JSON."""
+        errors = []
+        data = self.data + "not json\n\n"
+        records = list(read_jsonl(io.BytesIO(data.encode()), flow_dicts=True, on_error=errors.append,
+                                  on_drift=lambda drift: None, registry=self.registry))
+        self.assertEqual(len(records), 3)
+        self.assertIsInstance(records[0], FlowDict)
+        self.assertEqual(records[0]["order"]["items"][0]["qty"], 2)
+        self.assertEqual([error.line for error in errors], [4])
+
+if __name__ == "__main__":
+    unittest.main()
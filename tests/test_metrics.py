@@ -0,0 +1,98 @@
+"""
+Tests for TypeFlow conversion metrics.
+"""
+
+import decimal
+import io
+import os
+import tempfile
+import unittest
+
+from typeflow.converters import ConversionRegistry
+from typeflow.metrics import disable_metrics, enable_metrics, get_metrics, render_prometheus, write_prometheus
+from typeflow.types import FlowInt, flow
+
+class TestMetrics(unittest.TestCase):
+    """Test conversion and operator metrics."""
+    
+    def setUp(self):
+        """Set up a fresh registry with metrics enabled."""
+        self.registry = ConversionRegistry()
+        self.metrics = enable_metrics(self.registry)
+    
+    def tearDown(self):
+        """Restore the uninstrumented methods."""
+        disable_metrics()
+    
+    def test_counts_conversions_by_source_and_target(self):
+        """Test that conversions are counted per (source, target) pair."""
+        self.registry.to_int("1")
+        self.registry.to_int("2")
+        self.registry.to_float(3)
+        self.registry.to_int_many(["4", "5", 6])
+        
+        self.assertEqual(self.metrics.conversions[("str", "int")], 4)
+        self.assertEqual(self.metrics.conversions[("int", "int")], 1)
+        self.assertEqual(self.metrics.conversions[("int", "float")], 1)
+    
+    def test_counts_silent_fallbacks(self):
+        """Test that substituted defaults are counted with their reason."""
+        class Opaque:
+            pass
+        
+        self.assertEqual(self.registry.to_int("abc"), 0)
+        self.assertEqual(self.registry.to_float(Opaque()), 0.0)
+        
+        self.assertEqual(self.metrics.fallbacks[("str", "int", "converter_error")], 1)
+        self.assertEqual(self.metrics.fallbacks[("Opaque", "float", "no_converter")], 1)
+    
+    def test_counts_flow_operators(self):
+        """Test that Flow operators are counted and restored when disabled."""
+        self.assertTrue(hasattr(FlowInt.__add__, "__wrapped__"))
+        self.assertEqual(FlowInt(1) + "2", "12")
+        self.assertEqual(self.metrics.operations[("__add__", "FlowInt", "str")], 1)
+        
+        disable_metrics()
+        self.assertFalse(hasattr(FlowInt.__add__, "__wrapped__"))
+        self.assertNotIn("convert", vars(self.registry))
+        self.assertIsNone(get_metrics())
+    
+    def test_counts_operator_conversions_and_fallbacks(self):
+        """Test that operands converted or substituted by Flow operators are counted."""
+        disable_metrics()
+        metrics = enable_metrics()
+        self.assertEqual(flow(2) + decimal.Decimal("1.5"), 3)
+        self.assertEqual(flow(42) + [4, 5, 6], "424, 5, 6")
+        
+        self.assertEqual(metrics.conversions[("Decimal", "int")], 1)
+        self.assertEqual(metrics.fallbacks[("list", "int", "converter_error")], 1)
+    
+    def test_renders_prometheus_text(self):
+        """Test the text exposition format."""
+        self.registry.to_int("7")
+        self.registry.to_int('x"y')
+        text = render_prometheus()
+        
+        self.assertIn("# TYPE typeflow_conversions_total counter", text)
+        self.assertIn('typeflow_conversions_total{source="str",target="int"} 2', text)
+        self.assertIn('typeflow_conversion_fallbacks_total{source="str",target="int",reason="converter_error"} 1', text)
+        self.assertIn('typeflow_conversion_seconds_bucket{target="int",le="+Inf"} 2', text)
+        self.assertIn('typeflow_conversion_seconds_count{target="int"} 2', text)
+        self.assertTrue(text.endswith("\n"))
+    
+    def test_writes_to_file_and_path(self):
+        """Test writing the exposition to a file object and to a path."""
+        self.registry.to_bool("yes")
+        buffer = io.StringIO()
+        write_prometheus(buffer)
+        self.assertIn('target="bool"', buffer.getvalue())
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "typeflow.prom")
+            write_prometheus(path)
+            with open(path) as f:
+                self.assertEqual(f.read(), buffer.getvalue())
+            self.assertEqual(os.listdir(directory), ["typeflow.prom"])
+
+if __name__ == "__main__":
+    unittest.main()
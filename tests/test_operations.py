@@ -0,0 +1,125 @@
+"""
+Tests for TypeFlow operator dispatch.
+"""
+
+import unittest
+from decimal import Decimal
+
+from typeflow import configure, flow, register_operation
+from typeflow.operations import OperationTable
+from typeflow.types import FlowInt, FlowList, FlowStr
+
+class Money:
+    """Amount in cents used to exercise custom operations."""
+    
+    def __init__(self, cents):
+        self.cents = cents
+
+class TestOperations(unittest.TestCase):
+    """Test the operation dispatch table."""
+    
+    def tearDown(self):
+        """Reset the configuration."""
+        configure(verbose=False, raise_errors=False)
+    
+    def test_register_operation(self):
+        """Test that a registered handler is used for its operand types."""
+        register_operation(FlowStr, Money, '+', lambda s, m: FlowStr(s + f"${m.cents / 100:.2f}"))
+        
+        result = flow("Total: ") + Money(1250)
+        self.assertEqual(result, "Total: $12.50")
+        self.assertIsInstance(result, FlowStr)
+        # The reflected operation is dispatched separately
+        self.assertTrue((Money(5) + flow("!")).startswith("<"))
+    
+    def test_handlers_follow_the_mro(self):
+        """Test that handlers registered for base classes apply to subclasses."""
+        class Base:
+            pass
+        
+        class Derived(Base):
+            pass
+        
+        table = OperationTable()
+        table.register(str, Base, '*', lambda left, right: 'base')
+        table.register(object, object, '*', lambda left, right: 'any')
+        
+        self.assertEqual(table.resolve(FlowStr, Derived, '*')(None, None), 'base')
+        self.assertEqual(table.resolve(int, Derived, '*')(None, None), 'any')
+        self.assertIn((FlowStr, Derived, '*'), table.handlers)
+        
+        # Registering invalidates resolved handlers
+        table.register(FlowStr, Derived, '*', lambda left, right: 'derived')
+        self.assertEqual(table.resolve(FlowStr, Derived, '*')(None, None), 'derived')
+    
+    def test_reflected_operations(self):
+        """Test operations with a plain value on the left."""
+        self.assertEqual("value: " + flow("x"), "value: x")
+        self.assertEqual("n=" + flow(3), "n=3")
+        self.assertEqual(3 + flow(4), 7)
+        self.assertIsInstance(3 + flow(4), FlowInt)
+        self.assertEqual([0] + flow([1]), [0, 1])
+        self.assertIsInstance([0] + flow([1]), FlowList)
+        self.assertEqual(3 * flow("ab"), "ababab")
+    
+    def test_conversion_fallbacks(self):
+        """Test operands that can't be converted fall back to string concatenation."""
+        self.assertEqual(flow(42) + [4, 5, 6], "424, 5, 6")
+        self.assertEqual(flow(2) + Decimal("1.5"), 3)
+        self.assertEqual(flow("ab") * "x", "ab")
+        
+        configure(raise_errors=True)
+        with self.assertRaises(TypeError):
+            flow(42) + [4, 5, 6]
+    
+    def test_in_place_list_operators(self):
+        """Test that += and *= convert and modify the list itself."""
+        rows = flow([1])
+        accumulator = rows
+        accumulator += [2]
+        accumulator += (3, 4)
+        accumulator += 5
+        self.assertIs(accumulator, rows)
+        self.assertEqual(rows, [1, 2, 3, 4, 5])
+        
+        accumulator *= "2"
+        self.assertIs(accumulator, rows)
+        self.assertEqual(len(rows), 10)
+        
+        # A string is added as one element rather than replacing the list
+        accumulator += "ab"
+        self.assertIs(accumulator, rows)
+        self.assertEqual(rows[-1], "ab")
+        self.assertEqual(len(rows), 11)
+    
+    def test_in_place_dict_operators(self):
+        """Test that += and |= merge into the dict itself."""
+        totals = flow({"a": 1})
+        merged = totals
+        merged += {"b": 2}
+        merged |= [("c", 3)]
+        merged |= (("a", 0),)
+        self.assertIs(merged, totals)
+        self.assertEqual(totals, {"a": 0, "b": 2, "c": 3})
+        
+        # Values that aren't mappings or pairs leave the dict unchanged
+        for other in ([10], 5, Money(5)):
+            merged |= other
+            self.assertIs(merged, totals)
+        self.assertEqual(totals, {"a": 0, "b": 2, "c": 3})
+        
+        configure(raise_errors=True)
+        with self.assertRaises(TypeError):
+            merged |= Money(5)
+        with self.assertRaises(TypeError):
+            merged |= [10]
+    
+    def test_invalid_registrations(self):
+        """Test that unknown operators and non-class operands are rejected."""
+        with self.assertRaises(ValueError):
+            register_operation(FlowStr, Money, '-=', lambda left, right: None)
+        with self.assertRaises(TypeError):
+            register_operation(FlowStr, 'money', '+', lambda left, right: None)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Tests for TypeFlow process-pool conversion.
+"""
+
+import array
+import unittest
+
+from typeflow.converters import ConversionRegistry
+from typeflow.parallel import convert_parallel
+
+class Celsius:
+    """A temperature converted to int by a module-level converter."""
+    
+    def __init__(self, degrees):
+        self.degrees = degrees
+
+def celsius_to_int(value):
+    return round(value.degrees)
+
+class TestConvertParallel(unittest.TestCase):
+    """Test parallel conversion on worker processes."""
+    
+    def setUp(self):
+        """Set up a fresh registry for each test."""
+        self.registry = ConversionRegistry()
+    
+    def test_results_are_ordered_arrays(self):
+        """Test that chunks come back in input order as a packed array."""
+        values = (str(i) if i % 2 else i for i in range(1000))
+        result = convert_parallel(values, 'int', workers=2, chunksize=64, registry=self.registry)
+        self.assertEqual(result, array.array('q', range(1000)))
+    
+    def test_replicates_importable_converters(self):
+        """Test that custom converters registered by reference reach the workers."""
+        self.registry.register_int(Celsius, celsius_to_int)
+        result = convert_parallel([Celsius(1.6), "2", None], 'int', workers=2, chunksize=1, registry=self.registry)
+        self.assertEqual(list(result), [2, 2, 0])
+    
+    def test_skips_lambdas_with_warning(self):
+        """Test that converters that cannot be pickled are reported."""
+        self.registry.register_int(str, lambda x: -1)
+        with self.assertLogs("typeflow", level="WARNING"):
+            result = convert_parallel(["5"], 'int', workers=1, registry=self.registry)
+        self.assertEqual(list(result), [5])
+    
+    def test_empty_and_list_targets(self):
+        """Test empty input and targets that are returned as lists."""
+        self.assertEqual(convert_parallel([], 'float', workers=1, registry=self.registry), array.array('d'))
+        self.assertEqual(convert_parallel([1, 2.5], 'str', workers=1, registry=self.registry), ["1", "2.5"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Tests for TypeFlow compiled schemas.
+"""
+
+import linecache
+import unittest
+
+from typeflow.config import get_config
+from typeflow.converters import ConversionRegistry, ConverterOverlay
+from typeflow.schema import compile_schema
+
+class TestCompileSchema(unittest.TestCase):
+    """Test compiled record converters."""
+    
+    def setUp(self):
+        """Set up a fresh registry for each test."""
+        self.registry = ConversionRegistry()
+        self.schema = {'id': int, 'price': float, 'tags': [str], 'meta': {'active': bool}}
+    
+    def test_converts_nested_record(self):
+        """Test converting a record with nested lists and dicts."""
+        convert = compile_schema(self.schema, self.registry)
+        record = {'id': '7', 'price': 3, 'tags': [1, 'b'], 'meta': {'active': 'yes'}, 'extra': 1}
+        self.assertEqual(convert(record), {'id': 7, 'price': 3.0, 'tags': ['1', 'b'], 'meta': {'active': True}})
+    
+    def test_missing_keys_are_skipped(self):
+        """Test that keys missing from the record are left out."""
+        convert = compile_schema(self.schema, self.registry)
+        self.assertEqual(convert({'id': 1}), {'id': 1})
+    
+    def test_matches_registry_fallbacks(self):
+        """Test that rejected values go through the registry's error handling."""
+        convert = compile_schema({'id': 'int', 'when': [float]}, self.registry)
+        self.assertEqual(convert({'id': 'abc', 'when': [None, 'x']}), {'id': 0, 'when': [0.0, 0.0]})
+        
+        config = get_config()
+        config.raise_errors = True
+        try:
+            with self.assertRaises(TypeError):
+                convert({'id': 'abc'})
+        finally:
+            config.raise_errors = False
+    
+    def test_recompiles_when_registry_changes(self):
+        """Test that registering a converter invalidates the compiled function."""
+        convert = compile_schema({'id': int}, self.registry)
+        self.assertEqual(convert({'id': '0x10'}), {'id': 0})
+        
+        self.registry.register_int(str, lambda x: int(x, 0))
+        self.assertEqual(convert({'id': '0x10'}), {'id': 16})
+        
+        with self.registry.scope({'int': {str: lambda x: -1}}):
+            self.assertEqual(convert({'id': '5'}), {'id': -1})
+        self.assertEqual(convert({'id': '5'}), {'id': 5})
+    
+    def test_alternating_scopes_reuse_functions(self):
+        """Test that each scope's function is generated once and shares a file name."""
+        convert = compile_schema({'id': int}, self.registry)
+        negative = ConverterOverlay({'int': {str: lambda x: -1}})
+        self.assertEqual(convert({'id': '5'}), {'id': 5})
+        with self.registry.scope(negative):
+            self.assertEqual(convert({'id': '5'}), {'id': -1})
+        functions = dict(convert._functions)
+        lines = len(linecache.cache)
+        
+        for _ in range(3):
+            with self.registry.scope(negative):
+                self.assertEqual(convert({'id': '5'}), {'id': -1})
+            self.assertEqual(convert({'id': '5'}), {'id': 5})
+        self.assertEqual(dict(convert._functions), functions)
+        self.assertEqual(len(linecache.cache), lines)
+    
+    def test_compiled_schemas_are_cached(self):
+        """Test that equal schemas share a compiled function."""
+        first = compile_schema(self.schema, self.registry)
+        second = compile_schema({'id': int, 'price': float, 'tags': [str], 'meta': {'active': bool}}, self.registry)
+        self.assertIs(first, second)
+        self.assertIsNot(first, compile_schema(self.schema, ConversionRegistry()))
+    
+    def test_rejects_invalid_schemas(self):
+        """Test errors for schemas that cannot be compiled."""
+        with self.assertRaises(ValueError):
+            compile_schema({'id': 'integer'}, self.registry)
+        with self.assertRaises(ValueError):
+            compile_schema({'ids': [int, str]}, self.registry)
+        with self.assertRaises(TypeError):
+            compile_schema({'id': object}, self.registry)
+
+if __name__ == "__main__":
+    unittest.main()
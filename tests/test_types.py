@@ -0,0 +1,306 @@
+"""
+Tests for the TypeFlow types.
+"""
+
+import copy
+import enum
+import json
+import pickle
+import unittest
+
+from typeflow import configure, flow, flow_join, with_typeflow
+from typeflow.types import (
+    DeepFlowDict, DeepFlowList, FlowBool, FlowDict, FlowDictView, FlowFloat, FlowInt, FlowList, FlowListView, FlowRope, FlowStr, INTERN_STR_LENGTH,
+    LayeredFlowDict
+)
+
+class TestFlowTypes(unittest.TestCase):
+    """Test the memory layout and interning of the Flow types."""
+    
+    def test_no_instance_dict(self):
+        """Test that Flow values don't carry a __dict__."""
+        for value in (FlowStr("a"), FlowInt(1), FlowFloat(1.5), FlowList([1]), FlowDict(a=1), FlowBool(True)):
+            self.assertFalse(hasattr(value, "__dict__"), type(value).__name__)
+            with self.assertRaises(AttributeError):
+                value.note = "x"
+    
+    def test_bool_singletons(self):
+        """Test that FlowBool has one instance per truth value."""
+        self.assertIs(FlowBool(True), FlowBool(1))
+        self.assertIs(FlowBool(False), FlowBool([]))
+        self.assertIs(flow(True), FlowBool(True))
+        self.assertEqual(repr(FlowBool("yes")), "True")
+        self.assertEqual(FlowBool(True) + 1, 2)
+    
+    def test_interning(self):
+        """Test that flow() shares wrappers of small ints and short strings."""
+        self.assertIs(flow(7), flow(7))
+        self.assertIs(flow(-5), flow(-5))
+        self.assertIsInstance(flow(7), FlowInt)
+        self.assertEqual(flow(10 ** 9), 10 ** 9)
+        
+        self.assertIs(flow("ok"), flow("o" + "k"))
+        self.assertIsInstance(flow("ok"), FlowStr)
+        long_text = "x" * (INTERN_STR_LENGTH + 1)
+        self.assertIsNot(flow(long_text), flow(long_text))
+        self.assertEqual(flow(long_text), long_text)
+        
+        # Interned values keep working in operations
+        self.assertEqual(flow(7) + flow("ok"), "7ok")
+    
+    def test_subclasses_are_not_interned(self):
+        """Test that str and int subclasses don't leak into the intern tables."""
+        class Color(str, enum.Enum):
+            RED = "red"
+        
+        class Level(enum.IntEnum):
+            LOW = 1
+        
+        self.assertEqual(flow(Color.RED), str(Color.RED))
+        self.assertEqual(flow("red"), "red")
+        self.assertIsNot(flow(Color.RED), flow("red"))
+        self.assertEqual(flow(Level.LOW), 1)
+        self.assertIs(flow(1), flow(1))
+        self.assertIsNot(flow(Level.LOW), flow(1))
+
+class TestFlowRope(unittest.TestCase):
+    """Test lazy string building."""
+    
+    def test_converts_and_joins_lazily(self):
+        """Test that mixed operands are converted once and joined on first use."""
+        rope = FlowRope("Total: ")
+        for value in (12, " items, ", 3.5, " kg, paid: ", True):
+            rope = rope + value
+        
+        self.assertEqual(len(rope), len("Total: 12 items, 3.5 kg, paid: True"))
+        self.assertIsNone(rope._value)
+        self.assertEqual(rope, "Total: 12 items, 3.5 kg, paid: True")
+        self.assertIsInstance(str(rope), FlowStr)
+        self.assertTrue(rope.startswith("Total"))
+        self.assertEqual(">" + FlowRope(1), ">1")
+    
+    def test_ropes_are_persistent(self):
+        """Test that adding to an older rope doesn't change newer ones."""
+        base = FlowRope("a")
+        first = base + "b"
+        second = base + "c"
+        third = first + "d"
+        
+        self.assertEqual(base, "a")
+        self.assertEqual(first, "ab")
+        self.assertEqual(second, "ac")
+        self.assertEqual(third, "abd")
+        self.assertIs(third._chunks, first._chunks)
+    
+    def test_str_protocols(self):
+        """Test indexing, iteration, ordering, copying and pickling."""
+        rope = FlowRope("a") + "b" + 1
+        self.assertEqual(rope[0], "a")
+        self.assertEqual(rope[1:], "b1")
+        self.assertIn("b1", rope)
+        self.assertEqual(list(rope), ["a", "b", "1"])
+        self.assertLess(rope, "z")
+        self.assertGreater(rope, FlowRope("a"))
+        self.assertEqual(copy.copy(rope), "ab1")
+        self.assertEqual(pickle.loads(pickle.dumps(rope)), "ab1")
+        self.assertEqual(json.dumps(str(rope)), '"ab1"')
+    
+    def test_flow_join(self):
+        """Test that flow_join converts values through the registry."""
+        self.assertEqual(flow_join(",", [1, "a", None, True, [1, 2]]), "1,a,None,True,1, 2")
+        self.assertIsInstance(flow_join(",", []), FlowStr)
+        self.assertEqual(flow_join(0, (x for x in "ab")), "a0b")
+
+class TestFlowViews(unittest.TestCase):
+    """Test views over existing containers."""
+    
+    def test_list_view_works_on_the_original(self):
+        """Test that a list view reads, writes and extends the wrapped list."""
+        data = [3, 1, 2]
+        rows = flow(data, view=True)
+        self.assertIsInstance(rows, FlowListView)
+        
+        rows[0] = 0
+        rows.append(5)
+        rows.sort()
+        accumulator = rows
+        accumulator += (7,)
+        self.assertIs(accumulator, rows)
+        self.assertEqual(data, [0, 1, 2, 5, 7])
+        
+        # Non in-place operators give new values like FlowList's do
+        self.assertEqual(rows + " rows", "0, 1, 2, 5, 7 rows")
+        self.assertIsInstance(rows + [8], FlowList)
+        self.assertEqual(flow("rows: ") + rows, "rows: 0, 1, 2, 5, 7")
+        self.assertEqual(data, [0, 1, 2, 5, 7])
+    
+    def test_dict_view_works_on_the_original(self):
+        """Test that a dict view merges into the wrapped dict."""
+        data = {"a": 1}
+        settings = flow(data, view=True)
+        self.assertIsInstance(settings, FlowDictView)
+        
+        settings |= {"b": 2}
+        settings["c"] = 3
+        self.assertIsInstance(settings, FlowDictView)
+        self.assertEqual(data, {"a": 1, "b": 2, "c": 3})
+        self.assertEqual(settings + {"d": 4}, {"a": 1, "b": 2, "c": 3, "d": 4})
+        self.assertNotIn("d", data)
+    
+    def test_views_use_the_container_methods(self):
+        """Test that views call the wrapped container's own methods."""
+        data = [3, 1, 2, 1]
+        rows = flow(data, view=True)
+        rows.extend([4])
+        self.assertEqual(rows.pop(), 4)
+        rows.remove(3)
+        rows.reverse()
+        self.assertEqual(data, [1, 2, 1])
+        self.assertEqual((rows.index(2), rows.count(1)), (1, 2))
+        self.assertEqual(list(reversed(rows)), [1, 2, 1])
+        for name in ("extend", "pop", "remove", "reverse", "index", "count", "clear"):
+            self.assertIn(name, vars(FlowListView))
+        
+        settings = flow({"a": 1}, view=True)
+        settings.update(b=2)
+        self.assertEqual(settings.setdefault("c", 3), 3)
+        self.assertEqual(settings.pop("a"), 1)
+        self.assertEqual(list(settings.items()), [("b", 2), ("c", 3)])
+        for name in ("keys", "values", "items", "pop", "update", "setdefault"):
+            self.assertIn(name, vars(FlowDictView))
+    
+    def test_detach(self):
+        """Test that detach() copies the wrapped container."""
+        data = [1, 2]
+        copy = flow(data, view=True).detach()
+        copy += [3]
+        self.assertIsInstance(copy, FlowList)
+        self.assertEqual(data, [1, 2])
+        self.assertIsInstance(flow({"a": 1}, view=True).detach(), FlowDict)
+    
+    def test_with_typeflow_views(self):
+        """Test that decorated functions can receive views."""
+        @with_typeflow(view=True)
+        def extend(rows, more):
+            rows += more
+            return rows
+        
+        data = [1, 2]
+        self.assertIsInstance(extend(data, [3]), FlowListView)
+        self.assertEqual(data, [1, 2, 3])
+
+class TestDeepFlow(unittest.TestCase):
+    """Test lazy wrapping of nested values."""
+    
+    def setUp(self):
+        """Create a nested payload."""
+        self.payload = {"orders": [{"id": 7, "items": ["a", "b"], "total": 9.5}], "count": 1}
+        self.deep = flow(self.payload, deep=True)
+    
+    def test_children_are_wrapped_on_access(self):
+        """Test that nested values get the Flow operators."""
+        order = self.deep["orders"][0]
+        self.assertIsInstance(self.deep["orders"], DeepFlowList)
+        self.assertIsInstance(order, DeepFlowDict)
+        self.assertEqual(order["id"] + ": " + order["total"], "7: 9.5")
+        self.assertEqual(order.get("items")[0] + 1, "a1")
+        self.assertIsNone(order.get("missing"))
+        self.assertEqual([item + "!" for item in order["items"]], ["a!", "b!"])
+        
+        # The payload itself is left alone
+        self.assertIs(type(self.payload["orders"][0]), dict)
+    
+    def test_wrapped_children_are_cached(self):
+        """Test that each child is wrapped once."""
+        orders = self.deep["orders"]
+        self.assertIs(orders[0], orders[0])
+        self.assertIs(self.deep["orders"], orders)
+        
+        # Values untouched so far stay plain
+        self.assertIs(type(dict.__getitem__(orders[0], "items")), list)
+        self.assertIsInstance(list(orders[0].values())[1], DeepFlowList)
+    
+    def test_json_round_trip(self):
+        """Test that reading a deep dict leaves it serializable as before."""
+        deep = flow({"active": True, "n": {"b": False, "x": 1.5}}, deep=True)
+        list(deep.items())
+        list(deep["n"].values())
+        self.assertIs(deep["active"], True)
+        self.assertEqual(json.loads(json.dumps(deep)), {"active": True, "n": {"b": False, "x": 1.5}})
+    
+    def test_deep_view_is_rejected(self):
+        """Test that deep wrapping can't be combined with views."""
+        with self.assertRaises(ValueError):
+            flow([1], view=True, deep=True)
+
+class TestLayeredMerges(unittest.TestCase):
+    """Test merging dicts into layers."""
+    
+    def setUp(self):
+        """Turn layered merges on."""
+        configure(layered_merges=True, merge_depth=3)
+    
+    def tearDown(self):
+        """Restore copying merges."""
+        configure(layered_merges=False, merge_depth=8)
+    
+    def test_merge_keeps_layers(self):
+        """Test that + layers dicts with later ones taking precedence."""
+        defaults = flow({"host": "localhost", "port": 80})
+        env = {"port": 8080}
+        merged = defaults + env + {"debug": True}
+        
+        self.assertIsInstance(merged, LayeredFlowDict)
+        self.assertIs(merged.maps[2], env)
+        self.assertEqual(merged, {"host": "localhost", "port": 8080, "debug": True})
+        self.assertEqual(merged + "!", "host: localhost, port: 8080, debug: True!")
+        self.assertIsInstance(merged.flatten(), FlowDict)
+        
+        # Writes and deletes never touch the merged dicts
+        merged["host"] = "example.com"
+        del merged["port"]
+        self.assertEqual(merged, {"host": "example.com", "debug": True})
+        self.assertEqual(defaults, {"host": "localhost", "port": 80})
+        self.assertEqual(env, {"port": 8080})
+    
+    def test_layers_are_flattened_past_merge_depth(self):
+        """Test that chains deeper than merge_depth are flattened."""
+        merged = flow({"a": 0})
+        for index in range(10):
+            merged = merged + {"a": index}
+            self.assertLessEqual(len(merged.maps), 4)
+        self.assertEqual(merged["a"], 9)
+        
+        merged += {"b": 1}
+        merged |= {"a": 10}
+        self.assertIsInstance(merged, LayeredFlowDict)
+        self.assertEqual(merged, {"a": 10, "b": 1})
+        
+        with self.assertRaises(ValueError):
+            configure(merge_depth=0)
+    
+    def test_write_then_merge(self):
+        """Test that a merge wins over keys written on the dict before it."""
+        merged = flow({"k": 1}) + {"x": 0}
+        merged["k"] = 5
+        merged += {"k": 2}
+        self.assertEqual(merged["k"], 2)
+        merged["k"] = 7
+        self.assertEqual(merged, {"k": 7, "x": 0})
+    
+    def test_write_then_delete(self):
+        """Test that deleting a key also hides it in the merged dicts."""
+        base = {"k": 1}
+        merged = flow(base) + {"x": 0}
+        merged["k"] = 5
+        del merged["k"]
+        self.assertEqual(dict(merged), {"x": 0})
+        
+        merged = flow(base) + {"x": 0}
+        merged["k"] = 5
+        self.assertEqual(merged.pop("k"), 5)
+        self.assertNotIn("k", merged)
+        self.assertEqual(base, {"k": 1})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,10 +10,20 @@ logger.addHandler(logging.NullHandler())
 
 # Import key components for public API
 from .config import configure
-from .converters import register_converter, get_converter
+from .converters import register_converter, get_converter, warmup, converters_scope, ConverterOverlay
+from .datetimes import DatetimeParser
+from .columns import convert_column
+from .arrays import FlowArray
+from .schema import compile_schema, CompiledSchema
+from .aio import register_async_converter, aconvert, aconvert_many
+from .parallel import convert_parallel
+from .inference import infer
+from .operations import register_operation
+from .metrics import enable_metrics, disable_metrics, get_metrics, render_prometheus, write_prometheus
 from .core import TypeFlowContext, with_typeflow, enable, disable, is_enabled
 from .types import (
-    FlowStr, FlowInt, FlowFloat, FlowList, FlowDict, FlowBool, flow
+    FlowStr, FlowInt, FlowFloat, FlowList, FlowDict, FlowBool, FlowRope, FlowListView, FlowDictView,
+    DeepFlowList, DeepFlowDict, LayeredFlowDict, flow, flow_join
 )
 
 # Version information
@@ -0,0 +1,157 @@
+"""
+Asyncio conversion support for TypeFlow.
+"""
+
+import array
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Type, Union
+
+from .converters import AsyncConverter, ConversionRegistry, _pack, _registry
+
+logger = logging.getLogger("typeflow")
+
+def register_async_converter(target_type: str, source_type: Type, converter: Callable[[Any], Awaitable[Any]],
+                             batch_size: Optional[int] = None) -> None:
+    """
+    Register an async converter for a specific type.
+    
+    Use this for converters that need I/O, e.g. resolving an ID to a name
+    through a cache service. Async converters are used by aconvert() and
+    aconvert_many() only.
+    
+    Example:
+        async def lookup_names(user_ids):
+            return await user_service.names(user_ids)
+        
+        register_async_converter('str', UserId, lookup_names, batch_size=100)
+    
+    Args:
+        target_type: The target type ('str', 'int', 'float', 'bool', 'list', 'dict', 'datetime')
+        source_type: The source type to convert from
+        converter: A coroutine function converting one value, or a list of
+            values if ``batch_size`` is given
+        batch_size: If given, up to this many distinct values are passed to
+            the converter per call
+    """
+    _registry.register_async(target_type, source_type, converter, batch_size)
+
+async def aconvert(value: Any, target: str, registry: Optional[ConversionRegistry] = None) -> Any:
+    """
+    Convert a value, awaiting its async converter if one is registered.
+    
+    Args:
+        value: The value to convert
+        target: The target kind, e.g. 'str'
+        registry: The registry to use; the global registry by default
+    
+    Returns:
+        The converted value
+    """
+    results = await aconvert_many([value], target, concurrency=1, registry=registry)
+    return results[0]
+
+async def aconvert_many(values: Iterable[Any], target: str, concurrency: int = 10,
+                        registry: Optional[ConversionRegistry] = None) -> Union[array.array, List[Any]]:
+    """
+    Convert many values, running async converters concurrently.
+    
+    Identical values are converted once. Values of types with a batch
+    converter are grouped into batches, and at most ``concurrency`` calls
+    to async converters are in flight at any time. Values without an async
+    converter are converted synchronously. Failed conversions are handled
+    like in convert(): they are logged and replaced by the target's default,
+    or raise TypeError with ``raise_errors=True``.
+    
+    Args:
+        values: The values to convert
+        target: The target kind, e.g. 'str'
+        concurrency: Maximum number of async converter calls in flight
+        registry: The registry to use; the global registry by default
+    
+    Returns:
+        The converted values in input order, packed like convert_many()
+    """
+    if registry is None:
+        registry = _registry
+    
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    
+    if target not in registry.targets:
+        raise ValueError(f"Unknown target type: {target}")
+    
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    
+    results: List[Any] = [None] * len(values)
+    # Distinct values per async converter, and where their results go
+    pending: Dict[AsyncConverter, Dict[Hashable, Tuple[Any, List[int]]]] = {}
+    converters: Dict[type, Optional[AsyncConverter]] = {}
+    
+    for index, value in enumerate(values):
+        value_type = type(value)
+        try:
+            converter = converters[value_type]
+        except KeyError:
+            converter = converters[value_type] = registry.get_async_converter(value_type, target)
+        
+        if converter is None:
+            results[index] = registry.convert(value, target)
+            continue
+        
+        key = _dedupe_key(value)
+        unique = pending.setdefault(converter, {})
+        entry = unique.get(key)
+        if entry is None:
+            unique[key] = (value, [index])
+        else:
+            entry[1].append(index)
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = []
+    for converter, unique in pending.items():
+        entries = list(unique.values())
+        size = converter.batch_size or 1
+        for start in range(0, len(entries), size):
+            batch = entries[start:start + size]
+            tasks.append(asyncio.ensure_future(_run(registry, converter, batch, target, semaphore, results)))
+    
+    if tasks:
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+    
+    return _pack(results, target)
+
+async def _run(registry: ConversionRegistry, converter: AsyncConverter, batch: List[Tuple[Any, List[int]]],
+               target: str, semaphore: asyncio.Semaphore, results: List[Any]) -> None:
+    """Await one converter call and store its results."""
+    batch_values = [value for value, _ in batch]
+    
+    async with semaphore:
+        try:
+            if converter.batch_size is None:
+                converted = [await converter.func(batch_values[0])]
+            else:
+                converted = list(await converter.func(batch_values))
+                if len(converted) != len(batch_values):
+                    raise ValueError(f"Batch converter returned {len(converted)} results for {len(batch_values)} values")
+        except Exception as e:
+            converted = [registry._conversion_failed(value, target, e) for value in batch_values]
+    
+    for (_, indexes), result in zip(batch, converted):
+        for index in indexes:
+            results[index] = result
+
+def _dedupe_key(value: Any) -> Hashable:
+    """Get a key under which equal values of the same type are converted once."""
+    try:
+        hash(value)
+    except TypeError:
+        # Unhashable values are only shared when they are the same object
+        return ('id', id(value))
+    return (type(value), value)
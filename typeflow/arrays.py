@@ -0,0 +1,251 @@
+"""
+NumPy-backed arrays for TypeFlow.
+"""
+
+import logging
+from typing import Any, Iterable, Optional
+
+from .columns import _as_array, convert_column
+from .config import get_config
+from .converters import _registry
+from .operations import _operations
+from .types import FlowBool, FlowFloat, FlowInt, FlowStr
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional dependency
+    np = None
+
+logger = logging.getLogger("typeflow")
+
+class FlowArray:
+    """
+    Column of values backed by a NumPy array, with the operators of the Flow types.
+    
+    Operations are vectorized and broadcast like NumPy's. The other operand
+    decides what ``+`` means: with a string (or an array of strings) the
+    string forms are concatenated, with anything else the values are added
+    as numbers. ``*`` always multiplies numbers. A column of strings is
+    parsed into numbers the first time it is needed, in one vectorized pass
+    (see convert_column()), and the result is kept for later operations:
+    integers if every value is one, floats otherwise. Values that can't be
+    parsed count as 0, or raise TypeError if raise_errors is configured.
+    
+    NumPy arrays and scalars work as operands of FlowStr, FlowInt, FlowFloat
+    and FlowBool too, without converting element by element.
+    
+    Example:
+        prices = FlowArray(['1.5', '2', '3'])
+        prices + 1          # FlowArray(array([2.5, 3. , 4. ]))
+        prices + ' EUR'     # FlowArray(array(['1.5 EUR', '2 EUR', '3 EUR'], dtype='<U7'))
+    """
+    
+    __slots__ = ('data', '_numbers')
+    
+    def __init__(self, values: Iterable[Any]):
+        """
+        Initialize the array.
+        
+        Args:
+            values: An ndarray, which is wrapped without copying, or any
+                iterable of values
+        """
+        if np is None:
+            raise ImportError("FlowArray requires NumPy; install it with 'pip install numpy'")
+        
+        if isinstance(values, FlowArray):
+            self.data = values.data
+            self._numbers = values._numbers
+            return
+        
+        self.data = values if isinstance(values, np.ndarray) else _column(values)
+        # Numeric form of a column of strings or objects, parsed on first use
+        self._numbers: Optional[Any] = None
+    
+    @property
+    def dtype(self) -> Any:
+        """The dtype of the underlying array."""
+        return self.data.dtype
+    
+    def numbers(self) -> Any:
+        """
+        Get the values as a numeric ndarray.
+        
+        Raises:
+            TypeError: If raise_errors is configured and some values can't
+                be parsed
+        """
+        if self.data.dtype.kind in 'biuf':
+            return self.data
+        
+        if self._numbers is None:
+            self._numbers = _parse_numbers(self.data)
+        return self._numbers
+    
+    def strings(self) -> Any:
+        """Get the string forms of the values as an ndarray."""
+        kind = self.data.dtype.kind
+        if kind == 'U':
+            return self.data
+        if kind == 'S':
+            return np.char.decode(self.data, 'utf-8')
+        if kind == 'O':
+            return np.frompyfunc(_registry.to_str, 1, 1)(self.data).astype(str)
+        return self.data.astype(str)
+    
+    def tolist(self) -> list:
+        """Get the values as a list of Python scalars."""
+        return self.data.tolist()
+    
+    def _operate(self, other: Any, op: str, reflected: bool = False) -> "FlowArray":
+        """Apply ``self op other`` (or ``other op self`` if reflected), broadcasting."""
+        other = _array_operand(other)
+        
+        if op == '+' and _is_text(other):
+            left = self.strings()
+            right = other.strings() if isinstance(other, FlowArray) else _registry.to_str(other)
+            return FlowArray(np.char.add(right, left) if reflected else np.char.add(left, right))
+        
+        ufunc = np.add if op == '+' else np.multiply
+        left = self.numbers()
+        right = other.numbers() if isinstance(other, FlowArray) else _scalar_number(other)
+        return FlowArray(ufunc(right, left) if reflected else ufunc(left, right))
+    
+    def __add__(self, other: Any) -> "FlowArray":
+        """Add numbers, or concatenate with strings, element by element."""
+        return self._operate(other, '+')
+    
+    def __radd__(self, other: Any) -> "FlowArray":
+        """Add numbers, or concatenate with strings, element by element (right side)."""
+        return self._operate(other, '+', reflected=True)
+    
+    def __mul__(self, other: Any) -> "FlowArray":
+        """Multiply numbers element by element."""
+        return self._operate(other, '*')
+    
+    def __rmul__(self, other: Any) -> "FlowArray":
+        """Multiply numbers element by element (right side)."""
+        return self._operate(other, '*', reflected=True)
+    
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> Any:
+        if copy:
+            return np.array(self.data, dtype=dtype, copy=True)
+        return self.data if dtype is None else self.data.astype(dtype, copy=False)
+    
+    def __array_ufunc__(self, ufunc: Any, method: str, *inputs: Any, **kwargs: Any) -> Any:
+        # Plain np.add and np.multiply, which NumPy arrays and scalars call
+        # for their operators, follow the rules of + and *
+        if method == '__call__' and not kwargs and len(inputs) == 2 and ufunc in (np.add, np.multiply):
+            op = '+' if ufunc is np.add else '*'
+            if inputs[0] is self:
+                return self._operate(inputs[1], op)
+            return self._operate(inputs[0], op, reflected=True)
+        
+        inputs = tuple(_unwrap(value) for value in inputs)
+        if 'out' in kwargs:
+            kwargs['out'] = tuple(_unwrap(value) for value in kwargs['out'])
+        return _wrap(getattr(ufunc, method)(*inputs, **kwargs))
+    
+    def __len__(self) -> int:
+        return len(self.data)
+    
+    def __iter__(self):
+        return iter(self.data)
+    
+    def __getitem__(self, index: Any) -> Any:
+        return _wrap(self.data[index])
+    
+    def __repr__(self) -> str:
+        return f"FlowArray({self.data!r})"
+
+def _column(values: Iterable[Any]) -> Any:
+    """Turn values into an ndarray, keeping strings as strings and numbers as numbers."""
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    
+    kinds = set(map(type, values))
+    if kinds and all(issubclass(kind, str) for kind in kinds):
+        return np.array(values, dtype=str)
+    if kinds and all(issubclass(kind, bytes) for kind in kinds):
+        return np.array(values, dtype=bytes)
+    if all(issubclass(kind, (int, float)) for kind in kinds):
+        # Integers too large for int64 end up in an object array
+        return np.array(values)
+    return _as_array(values, kinds)
+
+def _parse_numbers(data: Any) -> Any:
+    """Parse a column of strings or objects as integers, or floats if that parses more values."""
+    numbers, valid = convert_column(data.ravel(), 'int')
+    if not valid.all():
+        floats, float_valid = convert_column(data.ravel(), 'float')
+        if float_valid.sum() > valid.sum():
+            numbers, valid = floats, float_valid
+    
+    invalid = len(valid) - int(valid.sum())
+    if invalid:
+        config = get_config()
+        if config.verbose:
+            logger.warning(f"Failed to convert {invalid} of {len(valid)} values to numbers; using 0")
+        if config.raise_errors:
+            raise TypeError(f"Cannot convert {invalid} of {len(valid)} values to numbers")
+    
+    return numbers.reshape(data.shape)
+
+def _array_operand(value: Any) -> Any:
+    """Wrap sequences and arrays in a FlowArray; scalars are returned as they are."""
+    if isinstance(value, FlowArray):
+        return value
+    if isinstance(value, (np.ndarray, list, tuple)):
+        return FlowArray(value)
+    return value
+
+def _is_text(value: Any) -> bool:
+    """Check whether an operand is a string or an array of strings."""
+    if isinstance(value, FlowArray):
+        return value.data.dtype.kind in 'US'
+    return isinstance(value, str)
+
+def _scalar_number(value: Any) -> Any:
+    """Get a scalar operand as a number, parsing it like a column of one value."""
+    if isinstance(value, (int, float, complex, np.number, np.bool_)):
+        return value
+    return _parse_numbers(_as_array([value], {type(value)}))[0]
+
+def _unwrap(value: Any) -> Any:
+    """Get the ndarray of a FlowArray; other values are returned as they are."""
+    return value.data if isinstance(value, FlowArray) else value
+
+def _wrap(value: Any) -> Any:
+    """Wrap ndarrays in a FlowArray; other values are returned as they are."""
+    if isinstance(value, np.ndarray):
+        return FlowArray(value)
+    if isinstance(value, tuple):
+        return tuple(_wrap(item) for item in value)
+    return value
+
+def _array_radd(left: Any, right: Any) -> FlowArray:
+    """Add a Flow value to an array."""
+    return _array_operand(right)._operate(left, '+', reflected=True)
+
+def _array_rmul(left: Any, right: Any) -> FlowArray:
+    """Multiply an array by a Flow value."""
+    return _array_operand(right)._operate(left, '*', reflected=True)
+
+def _register_array_operations() -> None:
+    """Register the handlers for arrays and NumPy scalars as operands of the Flow types."""
+    register = _operations.register
+    
+    for flow_type in (FlowStr, FlowInt, FlowFloat, FlowBool):
+        register(flow_type, np.ndarray, '+', _array_radd)
+        register(flow_type, FlowArray, '+', _array_radd)
+    for flow_type in (FlowStr, FlowInt):
+        register(flow_type, np.ndarray, '*', _array_rmul)
+        register(flow_type, FlowArray, '*', _array_rmul)
+    
+    # NumPy scalars keep their precision instead of going through int()
+    for flow_type in (FlowInt, FlowFloat, FlowBool):
+        register(flow_type, np.number, '+', np.add)
+    register(FlowInt, np.number, '*', np.multiply)
+
+if np is not None:
+    _register_array_operations()
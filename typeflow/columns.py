@@ -0,0 +1,205 @@
+"""
+NumPy-backed column conversion for TypeFlow.
+"""
+
+import logging
+from typing import Any, Optional, Sequence, Set, Tuple
+
+from .converters import FALSE_STRINGS, TRUE_STRINGS, ConversionRegistry, _registry, _str_to_bool, parse_bool
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional dependency
+    np = None
+
+logger = logging.getLogger("typeflow")
+
+# Result dtype for each supported target
+_DTYPES = {'int': 'int64', 'float': 'float64', 'bool': 'bool'}
+
+# Parsers for the fast path over columns of clean strings; int() and float()
+# accept surrounding whitespace just like the default converters
+_PARSERS = {'int': int, 'float': float}
+
+# Number of values parsed per attempt on the fast path
+_CHUNK_SIZE = 1024
+
+# Characters a string may consist of to be parsed by the vectorized path
+_NUMERIC_CHARS = {'int': '0123456789+-', 'float': '0123456789+-.eE'}
+
+# Longest digit string that always fits in an int64
+_MAX_INT_DIGITS = 18
+
+def convert_column(values: Sequence[Any], target: str,
+                   registry: Optional[ConversionRegistry] = None) -> Tuple[Any, Any]:
+    """
+    Convert a column of values to a typed NumPy array.
+    
+    Clean numeric strings, boolean words and blanks are handled with
+    vectorized NumPy operations, and chunks of a list that contain only
+    clean numbers are parsed in a single pass. Rows the vectorized path cannot parse are
+    passed to the registry's converters one by one. Instead of substituting
+    0, 0.0 or False for values that cannot be converted, those rows are
+    marked invalid in the returned mask; blank strings and None are nulls.
+    
+    Args:
+        values: A sequence or ndarray of strings, bytes or other values
+        target: The target kind ('int', 'float' or 'bool')
+        registry: The registry used for rows the vectorized path rejects
+    
+    Returns:
+        A tuple of (converted values, boolean validity mask)
+    """
+    if np is None:
+        raise ImportError("convert_column() requires NumPy; install it with 'pip install numpy'")
+    
+    if target not in _DTYPES:
+        raise ValueError(f"Unsupported column target: {target}")
+    
+    if registry is None:
+        registry = _registry
+    
+    if isinstance(values, np.ndarray):
+        return _convert_array(values, target, registry)
+    
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    
+    kinds = set(map(type, values))
+    if target in _PARSERS and (kinds == {str} or kinds == {bytes}):
+        return _convert_strings(values, target, registry)
+    
+    return _convert_array(_as_array(values, kinds), target, registry)
+
+def _convert_strings(values: Sequence[Any], target: str, registry: ConversionRegistry) -> Tuple[Any, Any]:
+    """
+    Convert a sequence of strings chunk by chunk.
+    
+    Most chunks are clean and are parsed in one go; only chunks containing
+    blanks or bad values go through the masked array path.
+    """
+    parser = _PARSERS[target]
+    out = np.zeros(len(values), dtype=_DTYPES[target])
+    valid = np.ones(len(values), dtype=bool)
+    
+    for start in range(0, len(values), _CHUNK_SIZE):
+        chunk = values[start:start + _CHUNK_SIZE]
+        stop = start + len(chunk)
+        try:
+            out[start:stop] = np.fromiter(map(parser, chunk), dtype=out.dtype, count=len(chunk))
+        except (ValueError, OverflowError):
+            out[start:stop], valid[start:stop] = _convert_array(
+                np.array(chunk, dtype=type(chunk[0])), target, registry
+            )
+    
+    return out, valid
+
+def _convert_array(arr: Any, target: str, registry: ConversionRegistry) -> Tuple[Any, Any]:
+    """Convert an ndarray of any dtype."""
+    out = np.zeros(len(arr), dtype=_DTYPES[target])
+    valid = np.zeros(len(arr), dtype=bool)
+    
+    if arr.dtype.kind in 'US':
+        rejected = _parse_strings(arr, target, out, valid)
+        _convert_rows(arr[rejected].tolist(), rejected, target, registry, out, valid)
+    elif arr.dtype.kind in 'biuf':
+        with np.errstate(invalid='ignore'):
+            out[:] = arr.astype(out.dtype)
+        valid[:] = True
+        if arr.dtype.kind == 'f' and target != 'float':
+            valid &= ~np.isnan(arr)
+    else:
+        _convert_objects(arr, target, registry, out, valid)
+    
+    return out, valid
+
+def _as_array(values: Sequence[Any], kinds: Set[type]) -> Any:
+    """Turn a sequence into an ndarray without letting NumPy coerce mixed types."""
+    if kinds == {str}:
+        return np.array(values, dtype=str)
+    if kinds == {bytes}:
+        return np.array(values, dtype=bytes)
+    
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return arr
+
+def _parse_strings(arr: Any, target: str, out: Any, valid: Any) -> Any:
+    """
+    Parse a str or bytes array in place.
+    
+    Returns:
+        The indexes of the non-blank rows the vectorized path rejected
+    """
+    is_bytes = arr.dtype.kind == 'S'
+    stripped = np.char.strip(arr)
+    blank = np.char.str_len(stripped) == 0
+    
+    if target == 'bool':
+        # The default str -> bool converter does not strip, so neither do we
+        lowered = np.char.lower(arr)
+        true_words = [w.encode('ascii') for w in TRUE_STRINGS] if is_bytes else list(TRUE_STRINGS)
+        false_words = [w.encode('ascii') for w in FALSE_STRINGS] if is_bytes else list(FALSE_STRINGS)
+        is_true = np.isin(lowered, true_words)
+        recognised = is_true | np.isin(lowered, false_words)
+        out[is_true] = True
+        valid |= recognised
+        return np.flatnonzero(~(recognised | blank))
+    
+    chars = _NUMERIC_CHARS[target]
+    candidate = ~blank & (np.char.str_len(np.char.strip(stripped, chars.encode('ascii') if is_bytes else chars)) == 0)
+    if target == 'int':
+        candidate &= np.char.str_len(stripped) <= _MAX_INT_DIGITS
+    
+    indexes = np.flatnonzero(candidate)
+    try:
+        out[indexes] = stripped[indexes].astype(out.dtype)
+    except (ValueError, OverflowError):
+        # Something like '1-2' slipped through the character check; let the
+        # registry decide row by row
+        return np.flatnonzero(~blank)
+    
+    valid[indexes] = True
+    return np.flatnonzero(~blank & ~candidate)
+
+def _convert_objects(arr: Any, target: str, registry: ConversionRegistry, out: Any, valid: Any) -> None:
+    """Convert an object array, vectorizing the str and bytes rows."""
+    kinds = np.fromiter((type(value) for value in arr), dtype=object, count=len(arr))
+    
+    for kind, dtype in ((str, str), (bytes, bytes)):
+        indexes = np.flatnonzero(kinds == kind)
+        if not len(indexes):
+            continue
+        
+        sub_out = np.zeros(len(indexes), dtype=out.dtype)
+        sub_valid = np.zeros(len(indexes), dtype=bool)
+        strings = arr[indexes].astype(dtype)
+        rejected = _parse_strings(strings, target, sub_out, sub_valid)
+        _convert_rows(strings[rejected].tolist(), rejected, target, registry, sub_out, sub_valid)
+        out[indexes] = sub_out
+        valid[indexes] = sub_valid
+    
+    others = np.flatnonzero((kinds != str) & (kinds != bytes) & (kinds != type(None)))
+    _convert_rows(arr[others].tolist(), others, target, registry, out, valid)
+
+def _convert_rows(values: Sequence[Any], indexes: Any, target: str,
+                  registry: ConversionRegistry, out: Any, valid: Any) -> None:
+    """Convert individual rows through the registry, marking failures invalid."""
+    converters = {}
+    for index, value in zip(indexes.tolist(), values):
+        value_type = type(value)
+        converter = converters.get(value_type)
+        if converter is None:
+            converter = registry.resolve(value_type, target)
+            # The default str -> bool converter maps unrecognised words to
+            # False; those rows must be marked invalid instead
+            if converter is _str_to_bool:
+                converter = parse_bool
+            converters[value_type] = converter
+        
+        try:
+            out[index] = converter(value)
+        except Exception as e:
+            logger.debug(f"Cannot convert {value!r} to {target}: {e}")
+            continue
+        valid[index] = True
@@ -15,6 +15,10 @@ class Config:
     verbose: bool = False
     raise_errors: bool = False
     log_level: int = logging.WARNING
+    # Merge dicts with + into a LayeredFlowDict instead of copying them
+    layered_merges: bool = False
+    # Number of layers after which a LayeredFlowDict is flattened
+    merge_depth: int = 8
 
 # Thread-local storage for configuration
 _local = threading.local()
@@ -41,7 +45,8 @@ def _configure_logging(level: int) -> None:
         logger.addHandler(handler)
 
 def configure(verbose: Optional[bool] = None, raise_errors: Optional[bool] = None, 
-              log_level: Optional[int] = None) -> None:
+              log_level: Optional[int] = None, layered_merges: Optional[bool] = None,
+              merge_depth: Optional[int] = None) -> None:
     """
     Configure TypeFlow settings.
     
@@ -49,7 +54,14 @@ def configure(verbose: Optional[bool] = None, raise_errors: Optional[bool] = Non
         verbose: If True, log information about type conversions
         raise_errors: If True, raise errors for conversions that fail
         log_level: Logging level (e.g., logging.INFO, logging.DEBUG)
+        layered_merges: If True, ``+`` on Flow dicts keeps the merged dicts
+            as layers of a LayeredFlowDict instead of copying them
+        merge_depth: Number of layers after which a LayeredFlowDict is
+            flattened into one
     """
+    if merge_depth is not None and merge_depth < 1:
+        raise ValueError(f"merge_depth must be at least 1, got {merge_depth}")
+    
     config = get_config()
     
     if verbose is not None:
@@ -60,4 +72,10 @@ def configure(verbose: Optional[bool] = None, raise_errors: Optional[bool] = Non
     
     if log_level is not None:
         config.log_level = log_level
-        _configure_logging(log_level)
\ No newline at end of file
+        _configure_logging(log_level)
+    
+    if layered_merges is not None:
+        config.layered_merges = layered_merges
+    
+    if merge_depth is not None:
+        config.merge_depth = merge_depth
@@ -2,34 +2,451 @@
 Type conversion functionality for TypeFlow.
 """
 
+import array
 import datetime
 import decimal
 import logging
+import mmap
+import threading
 import uuid
-from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union
+import weakref
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar, Union
+
+from .config import get_config
+from .datetimes import DatetimeParser, default_parser, from_timestamp
 
 logger = logging.getLogger("typeflow")
 
 # Type for conversion functions
 T = TypeVar('T')
 ConversionFunc = Callable[[Any], T]
+AsyncConversionFunc = Callable[[Any], Awaitable[Any]]
+
+@dataclass(frozen=True)
+class TargetKind:
+    """
+    Description of a conversion target.
+    
+    Attributes:
+        name: Name used with register_converter() and convert(), e.g. 'int'
+        label: Human readable name used in log and error messages
+        builtin: Constructor tried when no converter is registered
+        default: Produces the result when a registered converter fails
+        fallback: Produces the result when the builtin constructor fails
+        fallback_desc: Description of the fallback result for log messages
+        immutable: Whether results are immutable and may be shared between
+            callers, which allows them to be memoized
+    """
+    name: str
+    label: str
+    builtin: Callable[[Any], Any]
+    default: Callable[[Any], Any]
+    fallback: Callable[[Any], Any]
+    fallback_desc: str
+    immutable: bool = True
+
+# Built-in conversion targets
+TARGET_KINDS = (
+    TargetKind('str', 'string', str, str, repr, 'repr(value)'),
+    TargetKind('int', 'integer', int, lambda x: 0, lambda x: 0, '0'),
+    TargetKind('float', 'float', float, lambda x: 0.0, lambda x: 0.0, '0.0'),
+    TargetKind('bool', 'boolean', bool, lambda x: False, lambda x: False, 'False'),
+    TargetKind('list', 'list', list, lambda x: [], lambda x: [x], '[value]', immutable=False),
+    TargetKind('dict', 'dict', dict, lambda x: {}, lambda x: {0: x}, '{0: value}', immutable=False),
+    TargetKind('datetime', 'datetime', datetime.datetime, lambda x: None, lambda x: None, 'None'),
+)
+
+# Strings the default str -> bool converter treats as true, and their
+# counterparts for code that needs to recognise explicit false values
+TRUE_STRINGS = ('true', 'yes', 'y', '1', 'on')
+FALSE_STRINGS = ('false', 'no', 'n', '0', 'off')
+
+_TRUE_BYTES = frozenset(word.encode('ascii') for word in TRUE_STRINGS)
+_MAX_TRUE_LEN = max(map(len, TRUE_STRINGS))
+
+def _buffer_to_bool(value: Any) -> bool:
+    """Check a bytes-like value against TRUE_STRINGS without decoding it."""
+    # Longer values can't match, so skip copying them out of the buffer
+    return len(value) <= _MAX_TRUE_LEN and bytes(value).lower() in _TRUE_BYTES
+
+def _str_to_bool(value: str) -> bool:
+    """Check a string against TRUE_STRINGS; any other string is False."""
+    return value.lower() in TRUE_STRINGS
+
+def parse_bool(value: str) -> bool:
+    """
+    Parse a string from TRUE_STRINGS or FALSE_STRINGS strictly.
+    
+    Unlike the default str -> bool converter, unrecognised strings raise
+    ValueError instead of converting to False.
+    """
+    lowered = value.lower()
+    if lowered in TRUE_STRINGS:
+        return True
+    if lowered in FALSE_STRINGS:
+        return False
+    raise ValueError(f"Not a boolean string: {value!r}")
+
+# array.array typecodes used for batch conversion results
+ARRAY_TYPECODES = {'int': 'q', 'float': 'd', 'bool': 'B'}
+
+# Marker stored in the resolution cache for types without a converter
+_MISSING = object()
+
+class _ResolutionCache:
+    """
+    Bounded, weak-keyed cache of resolved converters.
+    
+    Maps a source type to a dict of ``{target: converter}``, where a missing
+    converter is remembered as ``_MISSING`` so unknown types are only
+    resolved once. Entries go away with their type, and the oldest entry is
+    evicted once ``maxsize`` types are cached.
+    """
+    
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        # Rows are keyed by id() so lookups avoid creating a weakref; the
+        # weakref callback drops the row before the id can be reused.
+        self.rows: Dict[int, Dict[str, Any]] = {}
+        self._refs: Dict[int, weakref.ref] = {}
+    
+    def __getitem__(self, type_: Type) -> Dict[str, Any]:
+        return self.rows[id(type_)]
+    
+    def get(self, type_: Type, target: str) -> Any:
+        """Return the cached resolution, or None if it has not been resolved yet."""
+        row = self.rows.get(id(type_))
+        if row is None:
+            return None
+        return row.get(target)
+    
+    def set(self, type_: Type, target: str, converter: Any) -> None:
+        """Remember the resolution of ``type_`` for ``target``."""
+        key = id(type_)
+        row = self.rows.get(key)
+        if row is None:
+            if len(self.rows) >= self.maxsize:
+                self._evict()
+            self._refs[key] = weakref.ref(type_, lambda ref, key=key: self._discard(key))
+            row = self.rows[key] = {}
+        row[target] = converter
+    
+    def _discard(self, key: int) -> None:
+        self.rows.pop(key, None)
+        self._refs.pop(key, None)
+    
+    def _evict(self) -> None:
+        try:
+            self._discard(next(iter(self.rows)))
+        except (StopIteration, RuntimeError):
+            pass
+    
+    def clear(self) -> None:
+        self.rows.clear()
+        self._refs.clear()
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+
+# Special methods that let the builtin constructor of a target handle a
+# type. Targets not listed are never chained: str() and bool() accept any
+# object, and list and dict fall back to wrapping the value
+_BUILTIN_PROTOCOLS = {
+    'int': ('__int__', '__index__', '__trunc__'),
+    'float': ('__float__', '__index__'),
+    # datetime() can't be called with a single value
+    'datetime': (),
+}
+
+def _supports_builtin(type_: Type, target: str) -> bool:
+    """Check whether the target's builtin constructor can handle type_."""
+    protocols = _BUILTIN_PROTOCOLS.get(target)
+    if protocols is None:
+        # str(), bool(), the list and dict fallbacks and constructors of
+        # custom targets accept anything
+        return True
+    return any(hasattr(type_, name) for name in protocols)
+
+def _pack(results: List[Any], target: str) -> Union[array.array, List[Any]]:
+    """Pack batch results into an array.array if the target has a typecode and they fit."""
+    typecode = ARRAY_TYPECODES.get(target)
+    if typecode is None:
+        return results
+    try:
+        return array.array(typecode, results)
+    except (OverflowError, TypeError, ValueError):
+        # e.g. huge ints or non-numeric results of custom converters
+        return results
+
+def _chain(converters: List[ConversionFunc]) -> ConversionFunc:
+    """Compose converters into a single function applied left to right."""
+    if len(converters) == 1:
+        return converters[0]
+    if len(converters) == 2:
+        first, second = converters
+        return lambda value: second(first(value))
+    
+    def chained(value: Any) -> Any:
+        for converter in converters:
+            value = converter(value)
+        return value
+    return chained
+
+# Source types whose conversions may be memoized by the value cache
+VALUE_CACHE_TYPES = frozenset((str, bytes, decimal.Decimal))
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+# An async converter; batch converters take a list of up to batch_size values
+# and return a list of results
+AsyncConverter = namedtuple('AsyncConverter', ['func', 'batch_size'])
+
+class _ValueCache:
+    """
+    Bounded LRU cache of conversion results keyed by (value, target).
+    
+    ``entries`` holds one LRU dict per cacheable target. str and bytes values
+    are their own keys (they never compare equal to each other), and
+    Decimals are keyed by their digits and exponent so that equal but
+    differently written values such as Decimal('1') and Decimal('1.0') don't
+    share a result.
+    """
+    
+    def __init__(self, maxsize: int, targets: Iterable[str]):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.entries: Dict[str, "OrderedDict[Any, Any]"] = {target: OrderedDict() for target in targets}
+        self._size = 0
+    
+    def put(self, entries: "OrderedDict[Any, Any]", key: Any, result: Any) -> None:
+        if key not in entries:
+            self._size += 1
+        entries[key] = result
+        
+        while self._size > self.maxsize:
+            self._evict()
+    
+    def _evict(self) -> None:
+        # Evict from the largest target, which holds most of the stale values
+        entries = max(self.entries.values(), key=len)
+        try:
+            entries.popitem(last=False)
+        except KeyError:
+            pass
+        self._size -= 1
+        self.evictions += 1
+    
+    def add_target(self, target: str) -> None:
+        self.entries.setdefault(target, OrderedDict())
+    
+    def discard_target(self, target: str) -> None:
+        """Forget every result for ``target``."""
+        entries = self.entries.get(target)
+        if entries is not None:
+            # Swap in a new dict so readers still holding the old one can't
+            # put stale results back
+            self.entries[target] = OrderedDict()
+            self._size -= len(entries)
+    
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, self._size)
+
+class _Snapshot:
+    """
+    Immutable state of a ConversionRegistry.
+    
+    Holds read-only views of the target kinds and registered converters
+    plus a dispatch matrix compiled from them. Writers never modify a
+    published snapshot; they build a new one and swap it in, so readers can
+    resolve converters without taking a lock.
+    """
+    
+    def __init__(self, targets: Dict[str, TargetKind], converters: Dict[str, Mapping[type, ConversionFunc]],
+                 generation: int, cache_size: int):
+        self.targets: Mapping[str, TargetKind] = MappingProxyType(targets)
+        self.converters: Mapping[str, Mapping[type, ConversionFunc]] = MappingProxyType(converters)
+        self.generation = generation
+        self.matrix = _ResolutionCache(cache_size)
+        self._kind_paths: Optional[Dict[Tuple[str, str], List[Tuple[str, ConversionFunc]]]] = None
+    
+    def get(self, type_: Type, target: str) -> Any:
+        """Get the dispatch matrix entry for (type_, target), compiling it if needed."""
+        try:
+            return self.matrix.rows[id(type_)][target]
+        except KeyError:
+            converter = self.resolve(type_, target)
+            self.matrix.set(type_, target, converter)
+            return converter
+    
+    def resolve(self, type_: Type, target: str) -> Any:
+        """
+        Find the converter for (type_, target).
+        
+        A converter registered for the closest class in the MRO wins. Types
+        that support the target's builtin protocol (e.g. ``__int__``) are left
+        to the builtin constructor. Otherwise registered converters are
+        chained along the shortest path through other target kinds, e.g.
+        custom type -> str -> int.
+        """
+        converter = self.lookup(type_, target)
+        if converter is not _MISSING or _supports_builtin(type_, target):
+            return converter
+        
+        path = self.find_path(type_, target)
+        if not path:
+            return _MISSING
+        return _chain([converter for _, converter in path])
+    
+    def lookup(self, type_: Type, target: str) -> Any:
+        """Find the converter registered for the closest class in the MRO."""
+        converters = self.converters[target]
+        for klass in type_.__mro__:
+            converter = converters.get(klass)
+            if converter is not None:
+                return converter
+        
+        return _MISSING
+    
+    def find_path(self, type_: Type, target: str) -> List[Tuple[str, ConversionFunc]]:
+        """Find the shortest chain of registered converters from type_ to target."""
+        kind_paths = self._kind_paths
+        if kind_paths is None:
+            kind_paths = self._kind_paths = self._compute_kind_paths()
+        
+        best: List[Tuple[str, ConversionFunc]] = []
+        for kind in self.targets:
+            if kind == target:
+                continue
+            rest = kind_paths.get((kind, target))
+            if rest is None or (best and len(rest) + 1 >= len(best)):
+                continue
+            converter = self.lookup(type_, kind)
+            if converter is not _MISSING:
+                best = [(kind, converter)] + rest
+        
+        return best
+    
+    def _compute_kind_paths(self) -> Dict[Tuple[str, str], List[Tuple[str, ConversionFunc]]]:
+        """
+        Compute the shortest converter chains between target kinds.
+        
+        A kind is connected to another when a converter is registered from
+        the kind's result type (e.g. str for 'str') to the other kind.
+        """
+        edges: Dict[str, List[Tuple[str, ConversionFunc]]] = {}
+        for kind, spec in self.targets.items():
+            edges[kind] = []
+            if not isinstance(spec.builtin, type):
+                continue
+            for other in self.targets:
+                if other != kind:
+                    converter = self.lookup(spec.builtin, other)
+                    if converter is not _MISSING:
+                        edges[kind].append((other, converter))
+        
+        paths: Dict[Tuple[str, str], List[Tuple[str, ConversionFunc]]] = {}
+        for start in self.targets:
+            frontier = [(start, [])]
+            seen = {start}
+            while frontier:
+                next_frontier = []
+                for kind, path in frontier:
+                    for other, converter in edges[kind]:
+                        if other not in seen:
+                            seen.add(other)
+                            paths[(start, other)] = path + [(other, converter)]
+                            next_frontier.append((other, paths[(start, other)]))
+                frontier = next_frontier
+        
+        return paths
+
+class ConverterOverlay:
+    """
+    Converters layered over a registry's own for the duration of a scope.
+    
+    Creating an overlay once (e.g. per tenant) and passing it to
+    ConversionRegistry.scope() lets every scope reuse the dispatch matrix
+    compiled for it.
+    
+    Args:
+        converters: Mapping of target kind to ``{source_type: converter}``
+    """
+    
+    def __init__(self, converters: Mapping[str, Mapping[Type, ConversionFunc]]):
+        self.converters: Dict[str, Dict[Type, ConversionFunc]] = {
+            target: dict(table) for target, table in converters.items()
+        }
+        self._compiled: Optional[Tuple[_Snapshot, _Snapshot]] = None
+        # Last combination with an enclosing overlay, so re-entering the
+        # same nested scopes reuses its compiled snapshot
+        self._combined: Optional[Tuple["ConverterOverlay", "ConverterOverlay"]] = None
+    
+    def over(self, outer: "ConverterOverlay") -> "ConverterOverlay":
+        """Combine with an enclosing overlay; this overlay takes precedence."""
+        combined = self._combined
+        if combined is not None and combined[0] is outer:
+            return combined[1]
+        
+        converters = {target: dict(table) for target, table in outer.converters.items()}
+        for target, table in self.converters.items():
+            converters.setdefault(target, {}).update(table)
+        overlay = ConverterOverlay(converters)
+        self._combined = (outer, overlay)
+        return overlay
+    
+    def snapshot(self, base: _Snapshot) -> _Snapshot:
+        """Get the snapshot of ``base`` with this overlay applied."""
+        compiled = self._compiled
+        if compiled is not None and compiled[0] is base:
+            return compiled[1]
+        
+        converters = dict(base.converters)
+        for target, table in self.converters.items():
+            if target not in converters:
+                raise ValueError(f"Unknown target type: {target}")
+            converters[target] = MappingProxyType({**converters[target], **table})
+        
+        snapshot = _Snapshot(dict(base.targets), converters, base.generation, base.matrix.maxsize)
+        self._compiled = (base, snapshot)
+        return snapshot
 
 class ConversionRegistry:
-    """Registry for type conversion functions."""
-    
-    def __init__(self):
-        self._str_converters: Dict[type, ConversionFunc] = {}
-        self._int_converters: Dict[type, ConversionFunc] = {}
-        self._float_converters: Dict[type, ConversionFunc] = {}
-        self._bool_converters: Dict[type, ConversionFunc] = {}
-        self._list_converters: Dict[type, ConversionFunc] = {}
-        self._dict_converters: Dict[type, ConversionFunc] = {}
-        
-        # Cache for performance
-        self._str_cache: Dict[type, str] = {}
-        self._int_cache: Dict[type, int] = {}
-        self._float_cache: Dict[type, float] = {}
-        self._bool_cache: Dict[type, bool] = {}
+    """
+    Registry for type conversion functions.
+    
+    Registered converters are compiled into a dispatch matrix keyed by
+    (source type, target kind), so a conversion costs a single lookup and a
+    direct call. ``generation`` is bumped on every registration, which lets
+    caches built on top of the registry detect that they are stale.
+    
+    Registrations are copy-on-write: readers work off an immutable snapshot
+    that writers replace atomically, so conversions never take a lock and
+    never see a half-updated table.
+    """
+    
+    def __init__(self, cache_size: int = 1024):
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self._snapshot = _Snapshot({}, {}, 0, cache_size)
+        self._value_cache: Optional[_ValueCache] = None
+        self._overlay: ContextVar[Optional[ConverterOverlay]] = ContextVar(f"typeflow_overlay_{id(self)}", default=None)
+        # Number of scopes currently entered; conversions only look up the
+        # overlay while _scoped is set
+        self._scopes = 0
+        self._scoped = False
+        # Metrics object set by typeflow.metrics.enable_metrics()
+        self._metrics = None
+        self._async_converters: Mapping[str, Mapping[type, AsyncConverter]] = MappingProxyType({})
+        
+        for kind in TARGET_KINDS:
+            self.add_target(kind)
         
         self._register_default_converters()
     
@@ -49,6 +466,8 @@ class ConversionRegistry:
         self.register_str(datetime.time, lambda x: x.isoformat())
         self.register_str(bytes, lambda x: x.decode('utf-8', errors='replace'))
         self.register_str(bytearray, lambda x: x.decode('utf-8', errors='replace'))
+        self.register_str(memoryview, lambda x: str(x, 'utf-8', errors='replace'))
+        self.register_str(mmap.mmap, lambda x: str(x, 'utf-8', errors='replace'))
         self.register_str(type(None), lambda x: "None")
         self.register_str(uuid.UUID, str)
         self.register_str(decimal.Decimal, str)
@@ -58,24 +477,35 @@ class ConversionRegistry:
         self.register_int(str, lambda x: int(x.strip()))
         self.register_int(float, int)
         self.register_int(bool, int)
-        self.register_int(bytes, lambda x: int(x.decode('utf-8', errors='replace').strip()))
-        self.register_int(bytearray, lambda x: int(x.decode('utf-8', errors='replace').strip()))
+        # int() parses ASCII digits straight from any buffer, whitespace included
+        self.register_int(bytes, int)
+        self.register_int(bytearray, int)
+        self.register_int(memoryview, int)
+        self.register_int(mmap.mmap, int)
         self.register_int(decimal.Decimal, int)
+        self.register_int(type(None), lambda x: 0)
         
         # Float converters
         self.register_float(float, lambda x: x)
         self.register_float(int, float)
         self.register_float(str, lambda x: float(x.strip()))
         self.register_float(bool, float)
-        self.register_float(bytes, lambda x: float(x.decode('utf-8', errors='replace').strip()))
-        self.register_float(bytearray, lambda x: float(x.decode('utf-8', errors='replace').strip()))
+        self.register_float(bytes, float)
+        self.register_float(bytearray, float)
+        self.register_float(memoryview, float)
+        self.register_float(mmap.mmap, float)
         self.register_float(decimal.Decimal, float)
+        self.register_float(type(None), lambda x: 0.0)
         
         # Boolean converters
         self.register_bool(bool, lambda x: x)
         self.register_bool(int, lambda x: bool(x))
         self.register_bool(float, lambda x: bool(x))
-        self.register_bool(str, lambda x: x.lower() in ('true', 'yes', 'y', '1', 'on'))
+        self.register_bool(str, _str_to_bool)
+        self.register_bool(bytes, _buffer_to_bool)
+        self.register_bool(bytearray, _buffer_to_bool)
+        self.register_bool(memoryview, _buffer_to_bool)
+        self.register_bool(mmap.mmap, _buffer_to_bool)
         self.register_bool(list, lambda x: bool(x))
         self.register_bool(dict, lambda x: bool(x))
         self.register_bool(type(None), lambda x: False)
@@ -89,316 +519,532 @@ class ConversionRegistry:
         self.register_list(float, lambda x: [x])
         self.register_list(bool, lambda x: [x])
         self.register_list(dict, lambda x: list(x.items()))
+        self.register_list(type(None), lambda x: [])
         
         # Dict converters
         self.register_dict(dict, lambda x: x)
         self.register_dict(list, lambda x: {i: v for i, v in enumerate(x)})
         self.register_dict(tuple, lambda x: {i: v for i, v in enumerate(x)})
+        self.register_dict(type(None), lambda x: {})
+        
+        # Datetime converters
+        self.register_datetime(datetime.datetime, lambda x: x)
+        self.register_datetime(datetime.date, lambda x: datetime.datetime(x.year, x.month, x.day))
+        self.register_datetime(str, default_parser)
+        self.register_datetime(bytes, default_parser)
+        self.register_datetime(bytearray, default_parser)
+        self.register_datetime(memoryview, default_parser)
+        self.register_datetime(mmap.mmap, default_parser)
+        self.register_datetime(int, from_timestamp)
+        self.register_datetime(float, from_timestamp)
+        self.register_datetime(decimal.Decimal, from_timestamp)
+        self.register_datetime(type(None), lambda x: None)
+    
+    def add_target(self, kind: TargetKind) -> None:
+        """
+        Add a new conversion target kind to the dispatch matrix.
+        
+        Args:
+            kind: Description of the target
+        """
+        with self._lock:
+            snapshot = self._snapshot
+            targets = dict(snapshot.targets)
+            targets[kind.name] = kind
+            converters = dict(snapshot.converters)
+            converters.setdefault(kind.name, MappingProxyType({}))
+            self._publish(targets, converters)
+        
+        if self._value_cache is not None and kind.immutable:
+            self._value_cache.add_target(kind.name)
+    
+    @property
+    def targets(self) -> Dict[str, TargetKind]:
+        """The target kinds known to this registry."""
+        return dict(self._snapshot.targets)
+    
+    @property
+    def generation(self) -> int:
+        """Counter bumped every time the registrations change."""
+        return self._snapshot.generation
+    
+    def register(self, target: str, type_: Type, converter: ConversionFunc) -> None:
+        """
+        Register a conversion function from ``type_`` to ``target``.
+        
+        Args:
+            target: The target kind ('str', 'int', 'float', 'bool', 'list', 'dict', 'datetime')
+            type_: The source type to convert from
+            converter: A function that converts instances of the source type
+        """
+        with self._lock:
+            snapshot = self._snapshot
+            if target not in snapshot.converters:
+                raise ValueError(f"Unknown target type: {target}")
+            
+            table = dict(snapshot.converters[target])
+            table[type_] = converter
+            converters = dict(snapshot.converters)
+            converters[target] = MappingProxyType(table)
+            self._publish(snapshot.targets, converters)
+        
+        if self._value_cache is not None and any(issubclass(t, type_) for t in VALUE_CACHE_TYPES):
+            self._value_cache.discard_target(target)
+    
+    def register_async(self, target: str, type_: Type, converter: Callable[[Any], Awaitable[Any]],
+                       batch_size: Optional[int] = None) -> None:
+        """
+        Register an async conversion function from ``type_`` to ``target``.
+        
+        Async converters are only used by aconvert() and aconvert_many();
+        synchronous conversions keep using the regular converters.
+        
+        Args:
+            target: The target kind ('str', 'int', 'float', 'bool', 'list', 'dict', 'datetime')
+            type_: The source type to convert from
+            converter: A coroutine function converting a value, or a list of
+                values if ``batch_size`` is given
+            batch_size: If given, the converter is called with lists of up
+                to this many values and must return a list of results
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        
+        with self._lock:
+            if target not in self._snapshot.targets:
+                raise ValueError(f"Unknown target type: {target}")
+            
+            table = dict(self._async_converters.get(target, {}))
+            table[type_] = AsyncConverter(converter, batch_size)
+            converters = dict(self._async_converters)
+            converters[target] = MappingProxyType(table)
+            self._async_converters = MappingProxyType(converters)
+    
+    def get_async_converter(self, type_: Type, target: str) -> Optional[AsyncConverter]:
+        """
+        Get the async converter registered for the closest class in the MRO.
+        
+        Returns:
+            The AsyncConverter, or None if only synchronous conversion applies
+        """
+        converters = self._async_converters.get(target)
+        if converters:
+            for klass in type_.__mro__:
+                converter = converters.get(klass)
+                if converter is not None:
+                    return converter
+        return None
+    
+    def _publish(self, targets: Mapping[str, TargetKind], converters: Dict[str, Mapping[type, ConversionFunc]]) -> None:
+        """Swap in a new snapshot; must be called with the lock held."""
+        self._snapshot = _Snapshot(dict(targets), converters, self._snapshot.generation + 1, self._cache_size)
+    
+    @contextmanager
+    def scope(self, converters: Union[ConverterOverlay, Mapping[str, Mapping[Type, ConversionFunc]]]) -> Iterator[None]:
+        """
+        Layer converters over the registry for the current context.
+        
+        The overlay is stored in a ContextVar, so it applies to the current
+        thread or asyncio task (and tasks it starts) only. Scopes nest, with
+        the innermost taking precedence. Tasks and threads started inside
+        the scope see its overlay until the last scope of the registry
+        exits, so they should finish before that.
+        
+        Example:
+            with registry.scope({'int': {str: parse_tenant_int}}):
+                registry.to_int("1.234")
+        
+        Args:
+            converters: A ConverterOverlay, or a mapping of target kind to
+                ``{source_type: converter}``
+        """
+        overlay = converters if isinstance(converters, ConverterOverlay) else ConverterOverlay(converters)
+        for target in overlay.converters:
+            if target not in self._snapshot.targets:
+                raise ValueError(f"Unknown target type: {target}")
+        
+        outer = self._overlay.get()
+        if outer is not None:
+            overlay = overlay.over(outer)
+        
+        with self._lock:
+            self._scopes += 1
+            self._scoped = True
+        token = self._overlay.set(overlay)
+        try:
+            yield
+        finally:
+            self._overlay.reset(token)
+            with self._lock:
+                self._scopes -= 1
+                self._scoped = self._scopes > 0
+    
+    def _current_snapshot(self) -> _Snapshot:
+        """Get the snapshot conversions in the current context should use."""
+        snapshot = self._snapshot
+        if self._scoped:
+            overlay = self._overlay.get()
+            if overlay is not None:
+                return overlay.snapshot(snapshot)
+        return snapshot
+    
+    def enable_value_cache(self, maxsize: int = 4096) -> None:
+        """
+        Memoize conversions of repeated values.
+        
+        Only str, bytes and Decimal values (see VALUE_CACHE_TYPES) converted
+        to targets with immutable results are cached. Results are forgotten
+        when a converter that could produce them is registered.
+        
+        Args:
+            maxsize: Maximum number of cached results across all targets
+        """
+        targets = [name for name, kind in self._snapshot.targets.items() if kind.immutable]
+        self._value_cache = _ValueCache(maxsize, targets)
+    
+    def disable_value_cache(self) -> None:
+        """Stop memoizing conversions and drop the cached results."""
+        self._value_cache = None
+    
+    def value_cache_info(self) -> Optional[CacheInfo]:
+        """
+        Get value cache statistics.
+        
+        Returns:
+            A CacheInfo with hits, misses, evictions, maxsize and currsize,
+            or None if the value cache is disabled
+        """
+        if self._value_cache is None:
+            return None
+        return self._value_cache.info()
     
     def register_str(self, type_: Type, converter: ConversionFunc) -> None:
         """Register a conversion function for converting to string."""
-        self._str_converters[type_] = converter
-        # Clear cache for this type
-        if type_ in self._str_cache:
-            del self._str_cache[type_]
+        self.register('str', type_, converter)
     
     def register_int(self, type_: Type, converter: ConversionFunc) -> None:
         """Register a conversion function for converting to integer."""
-        self._int_converters[type_] = converter
-        # Clear cache for this type
-        if type_ in self._int_cache:
-            del self._int_cache[type_]
+        self.register('int', type_, converter)
     
     def register_float(self, type_: Type, converter: ConversionFunc) -> None:
         """Register a conversion function for converting to float."""
-        self._float_converters[type_] = converter
-        # Clear cache for this type
-        if type_ in self._float_cache:
-            del self._float_cache[type_]
+        self.register('float', type_, converter)
     
     def register_bool(self, type_: Type, converter: ConversionFunc) -> None:
         """Register a conversion function for converting to boolean."""
-        self._bool_converters[type_] = converter
-        # Clear cache for this type
-        if type_ in self._bool_cache:
-            del self._bool_cache[type_]
+        self.register('bool', type_, converter)
     
     def register_list(self, type_: Type, converter: ConversionFunc) -> None:
         """Register a conversion function for converting to list."""
-        self._list_converters[type_] = converter
+        self.register('list', type_, converter)
     
     def register_dict(self, type_: Type, converter: ConversionFunc) -> None:
         """Register a conversion function for converting to dictionary."""
-        self._dict_converters[type_] = converter
+        self.register('dict', type_, converter)
+    
+    def register_datetime(self, type_: Type, converter: ConversionFunc) -> None:
+        """Register a conversion function for converting to datetime."""
+        self.register('datetime', type_, converter)
     
-    def _get_converter(self, type_: Type, converters: Dict[type, ConversionFunc]) -> Optional[ConversionFunc]:
+    def _get_converter(self, type_: Type, target: str) -> Optional[ConversionFunc]:
         """Get the conversion function for a specific type."""
-        # Direct match
-        if type_ in converters:
-            return converters[type_]
-        
-        # Check for subclass matches
-        for registered_type, converter in converters.items():
-            if issubclass(type_, registered_type):
-                # Cache this result for future lookups
-                converters[type_] = converter
-                return converter
+        converter = self._current_snapshot().get(type_, target)
+        return None if converter is _MISSING else converter
+    
+    def conversion_path(self, type_: Type, target: str) -> List[str]:
+        """
+        Describe how values of ``type_`` are converted to ``target``.
         
-        return None
+        Args:
+            type_: The source type
+            target: The target kind, e.g. 'int'
+        
+        Returns:
+            The target kinds visited in order, e.g. ['str', 'int'] for a type
+            that only has a str converter. A single entry means a direct
+            conversion; an empty list means no converter applies and the
+            builtin constructor and fallback are used.
+        """
+        snapshot = self._current_snapshot()
+        if target not in snapshot.targets:
+            raise ValueError(f"Unknown target type: {target}")
+        
+        if snapshot.lookup(type_, target) is not _MISSING:
+            return [target]
+        if _supports_builtin(type_, target):
+            return []
+        return [kind for kind, _ in snapshot.find_path(type_, target)]
     
-    def to_str(self, value: Any) -> str:
-        """Convert a value to a string."""
-        if value is None:
-            return "None"
+    def resolve(self, type_: Type, target: str) -> ConversionFunc:
+        """
+        Get the function that converts ``type_`` to ``target`` without fallbacks.
         
-        value_type = type(value)
+        The returned function raises instead of substituting a default value,
+        which suits callers that track invalid values themselves.
         
-        # Check cache first
-        if value_type in self._str_cache:
-            return self._str_cache[value_type]
+        Args:
+            type_: The source type
+            target: The target kind, e.g. 'int'
         
-        # Get converter
-        converter = self._get_converter(value_type, self._str_converters)
+        Returns:
+            The registered or chained converter, or the target's builtin
+            constructor
+        """
+        snapshot = self._current_snapshot()
+        if target not in snapshot.targets:
+            raise ValueError(f"Unknown target type: {target}")
         
-        if converter:
-            try:
-                result = converter(value)
-                return result
-            except Exception as e:
-                from .config import get_config
-                config = get_config()
-                
-                if config.verbose:
-                    logger.warning(f"Error converting {value_type.__name__} to string: {e}")
-                
-                if config.raise_errors:
-                    raise TypeError(f"Cannot convert {value_type.__name__} to string: {e}") from e
-                
-                # Fallback to default str()
-                return str(value)
-        else:
-            # Fallback to default str()
-            return str(value)
+        converter = snapshot.get(type_, target)
+        if converter is _MISSING:
+            return snapshot.targets[target].builtin
+        return converter
     
-    def to_int(self, value: Any) -> int:
-        """Convert a value to an integer."""
-        if value is None:
-            return 0
+    def warmup(self, types: Iterable[Type]) -> None:
+        """
+        Resolve converters for the given types ahead of time.
         
-        value_type = type(value)
+        Args:
+            types: Source types expected at runtime
+        """
+        snapshot = self._current_snapshot()
+        for type_ in types:
+            for target in snapshot.targets:
+                snapshot.get(type_, target)
+    
+    def convert(self, value: Any, target: str) -> Any:
+        """
+        Convert a value to the given target kind.
         
-        # Check cache first
-        if value_type in self._int_cache:
-            return self._int_cache[value_type]
+        Args:
+            value: The value to convert
+            target: The target kind, e.g. 'int'
         
-        # Get converter
-        converter = self._get_converter(value_type, self._int_converters)
+        Returns:
+            The converted value
+        """
+        value_type = type(value)
+        snapshot = self._snapshot
+        if self._scoped:
+            overlay = self._overlay.get()
+            if overlay is not None:
+                return self._convert_scoped(overlay.snapshot(snapshot), value, target)
         
-        if converter:
-            try:
-                result = converter(value)
+        try:
+            converter = snapshot.matrix.rows[id(value_type)][target]
+        except KeyError:
+            if target not in snapshot.targets:
+                raise ValueError(f"Unknown target type: {target}") from None
+            converter = snapshot.get(value_type, target)
+        
+        cache = self._value_cache
+        if cache is not None and value_type in VALUE_CACHE_TYPES:
+            entries = cache.entries.get(target)
+            if entries is not None:
+                key = value.as_tuple() if value_type is decimal.Decimal else value
+                try:
+                    result = entries[key]
+                    entries.move_to_end(key)
+                except KeyError:
+                    return self._convert_and_cache(value, target, converter, cache, entries, key)
+                cache.hits += 1
                 return result
-            except Exception as e:
-                from .config import get_config
-                config = get_config()
-                
-                if config.verbose:
-                    logger.warning(f"Error converting {value_type.__name__} to integer: {e}")
-                
-                if config.raise_errors:
-                    raise TypeError(f"Cannot convert {value_type.__name__} to integer: {e}") from e
-                
-                # Fallback to 0
-                return 0
-        else:
-            # Try default int() or fallback to 0
-            try:
-                return int(value)
-            except (TypeError, ValueError):
-                from .config import get_config
-                config = get_config()
-                
-                if config.verbose:
-                    logger.warning(f"No converter found for {value_type.__name__} to integer, using 0")
-                
-                if config.raise_errors:
-                    raise TypeError(f"Cannot convert {value_type.__name__} to integer") from None
-                
-                return 0
-    
-    def to_float(self, value: Any) -> float:
-        """Convert a value to a float."""
-        if value is None:
-            return 0.0
         
-        value_type = type(value)
+        if converter is _MISSING:
+            return self._convert_unregistered(value, target)
         
-        # Check cache first
-        if value_type in self._float_cache:
-            return self._float_cache[value_type]
+        try:
+            return converter(value)
+        except Exception as e:
+            return self._conversion_failed(value, target, e)
+    
+    def _convert_scoped(self, snapshot: _Snapshot, value: Any, target: str) -> Any:
+        """Convert a value using an overlay's snapshot, bypassing the value cache."""
+        if target not in snapshot.targets:
+            raise ValueError(f"Unknown target type: {target}")
         
-        # Get converter
-        converter = self._get_converter(value_type, self._float_converters)
+        converter = snapshot.get(type(value), target)
+        if converter is _MISSING:
+            return self._convert_unregistered(value, target)
         
-        if converter:
-            try:
-                result = converter(value)
-                return result
-            except Exception as e:
-                from .config import get_config
-                config = get_config()
-                
-                if config.verbose:
-                    logger.warning(f"Error converting {value_type.__name__} to float: {e}")
-                
-                if config.raise_errors:
-                    raise TypeError(f"Cannot convert {value_type.__name__} to float: {e}") from e
-                
-                # Fallback to 0.0
-                return 0.0
-        else:
-            # Try default float() or fallback to 0.0
-            try:
-                return float(value)
-            except (TypeError, ValueError):
-                from .config import get_config
-                config = get_config()
-                
-                if config.verbose:
-                    logger.warning(f"No converter found for {value_type.__name__} to float, using 0.0")
-                
-                if config.raise_errors:
-                    raise TypeError(f"Cannot convert {value_type.__name__} to float") from None
-                
-                return 0.0
+        try:
+            return converter(value)
+        except Exception as e:
+            return self._conversion_failed(value, target, e)
     
-    def to_bool(self, value: Any) -> bool:
-        """Convert a value to a boolean."""
-        if value is None:
-            return False
+    def _convert_and_cache(self, value: Any, target: str, converter: Any, cache: _ValueCache,
+                           entries: "OrderedDict[Any, Any]", key: Any) -> Any:
+        """Convert a value missing from the value cache and remember the result."""
+        cache.misses += 1
+        try:
+            result = (self._snapshot.targets[target].builtin if converter is _MISSING else converter)(value)
+        except Exception as e:
+            # Failures are not cached so they are logged or raised every time
+            if converter is _MISSING:
+                return self._convert_unregistered(value, target)
+            return self._conversion_failed(value, target, e)
         
-        value_type = type(value)
+        cache.put(entries, key, result)
+        return result
+    
+    def _conversion_failed(self, value: Any, target: str, error: Exception) -> Any:
+        """Handle a registered converter that raised."""
+        kind = self._snapshot.targets[target]
+        type_name = type(value).__name__
+        config = get_config()
         
-        # Check cache first
-        if value_type in self._bool_cache:
-            return self._bool_cache[value_type]
+        if config.verbose:
+            logger.warning(f"Error converting {type_name} to {kind.label}: {error}")
         
-        # Get converter
-        converter = self._get_converter(value_type, self._bool_converters)
+        if config.raise_errors:
+            raise TypeError(f"Cannot convert {type_name} to {kind.label}: {error}") from error
         
-        if converter:
-            try:
-                result = converter(value)
-                return result
-            except Exception as e:
-                from .config import get_config
-                config = get_config()
-                
-                if config.verbose:
-                    logger.warning(f"Error converting {value_type.__name__} to boolean: {e}")
-                
-                if config.raise_errors:
-                    raise TypeError(f"Cannot convert {value_type.__name__} to boolean: {e}") from e
-                
-                # Fallback to False
-                return False
-        else:
-            # Try default bool() or fallback to False
-            try:
-                return bool(value)
-            except (TypeError, ValueError):
-                from .config import get_config
-                config = get_config()
-                
-                if config.verbose:
-                    logger.warning(f"No converter found for {value_type.__name__} to boolean, using False")
-                
-                if config.raise_errors:
-                    raise TypeError(f"Cannot convert {value_type.__name__} to boolean") from None
-                
-                return False
+        if self._metrics is not None:
+            self._metrics.record_fallback(type_name, target, 'converter_error')
+        
+        return kind.default(value)
+    
+    def _convert_unregistered(self, value: Any, target: str) -> Any:
+        """Convert a value without a registered converter using the builtin constructor."""
+        kind = self._snapshot.targets[target]
+        try:
+            return kind.builtin(value)
+        except (TypeError, ValueError):
+            type_name = type(value).__name__
+            config = get_config()
+            
+            if config.verbose:
+                logger.warning(f"No converter found for {type_name} to {kind.label}, using {kind.fallback_desc}")
+            
+            if config.raise_errors:
+                raise TypeError(f"Cannot convert {type_name} to {kind.label}") from None
+            
+            if self._metrics is not None:
+                self._metrics.record_fallback(type_name, target, 'no_converter')
+            
+            return kind.fallback(value)
+    
+    def to_str(self, value: Any) -> str:
+        """Convert a value to a string."""
+        return self.convert(value, 'str')
+    
+    def to_int(self, value: Any) -> int:
+        """Convert a value to an integer."""
+        return self.convert(value, 'int')
+    
+    def to_float(self, value: Any) -> float:
+        """Convert a value to a float."""
+        return self.convert(value, 'float')
+    
+    def to_bool(self, value: Any) -> bool:
+        """Convert a value to a boolean."""
+        return self.convert(value, 'bool')
     
     def to_list(self, value: Any) -> list:
         """Convert a value to a list."""
-        if value is None:
-            return []
-        
-        value_type = type(value)
-        
-        # Get converter
-        converter = self._get_converter(value_type, self._list_converters)
-        
-        if converter:
-            try:
-                return converter(value)
-            except Exception as e:
-                from .config import get_config
-                config = get_config()
-                
-                if config.verbose:
-                    logger.warning(f"Error converting {value_type.__name__} to list: {e}")
-                
-                if config.raise_errors:
-                    raise TypeError(f"Cannot convert {value_type.__name__} to list: {e}") from e
-                
-                # Fallback to empty list
-                return []
-        else:
-            # Try default list() or fallback to [value]
-            try:
-                return list(value)
-            except (TypeError, ValueError):
-                from .config import get_config
-                config = get_config()
-                
-                if config.verbose:
-                    logger.warning(f"No converter found for {value_type.__name__} to list, using [value]")
-                
-                if config.raise_errors:
-                    raise TypeError(f"Cannot convert {value_type.__name__} to list") from None
-                
-                return [value]
+        return self.convert(value, 'list')
     
     def to_dict(self, value: Any) -> dict:
         """Convert a value to a dictionary."""
-        if value is None:
-            return {}
+        return self.convert(value, 'dict')
+    
+    def to_datetime(self, value: Any) -> Optional[datetime.datetime]:
+        """
+        Convert a value to a datetime.
         
-        value_type = type(value)
+        ISO 8601 strings are parsed with ``datetime.fromisoformat``; for
+        other strings the format is detected once and reused (see
+        DatetimeParser). Numbers are seconds since the epoch and give aware
+        UTC datetimes. Values that cannot be converted give None.
+        """
+        return self.convert(value, 'datetime')
+    
+    def convert_many(self, values: Iterable[Any], target: str) -> Union[array.array, List[Any]]:
+        """
+        Convert many values to the given target kind.
         
-        # Get converter
-        converter = self._get_converter(value_type, self._dict_converters)
+        Values are grouped by type and the converter is resolved once per
+        group. Numeric and boolean targets are packed into an ``array.array``
+        (see ARRAY_TYPECODES); other targets return a list. If an integer
+        result does not fit in 64 bits, a list is returned instead.
         
-        if converter:
-            try:
-                return converter(value)
-            except Exception as e:
-                from .config import get_config
-                config = get_config()
-                
-                if config.verbose:
-                    logger.warning(f"Error converting {value_type.__name__} to dict: {e}")
-                
-                if config.raise_errors:
-                    raise TypeError(f"Cannot convert {value_type.__name__} to dict: {e}") from e
-                
-                # Fallback to empty dict
-                return {}
+        Args:
+            values: The values to convert
+            target: The target kind, e.g. 'int'
+        
+        Returns:
+            The converted values, in input order
+        """
+        if target not in self._snapshot.targets:
+            raise ValueError(f"Unknown target type: {target}")
+        
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        
+        groups: Dict[type, List[int]] = {}
+        for index, value_type in enumerate(map(type, values)):
+            indexes = groups.get(value_type)
+            if indexes is None:
+                groups[value_type] = [index]
+            else:
+                indexes.append(index)
+        
+        if len(groups) == 1:
+            value_type, = groups
+            results = self._convert_group(value_type, values, target)
         else:
-            # Try default dict() or fallback to {0: value}
+            results = [None] * len(values)
+            for value_type, indexes in groups.items():
+                converted = self._convert_group(value_type, [values[i] for i in indexes], target)
+                for index, result in zip(indexes, converted):
+                    results[index] = result
+        
+        return _pack(results, target)
+    
+    def _convert_group(self, value_type: Type, values: Sequence[Any], target: str) -> List[Any]:
+        """Convert values that all share ``value_type``."""
+        converter = self._get_converter(value_type, target)
+        if converter is None:
+            return [self._convert_unregistered(value, target) for value in values]
+        if isinstance(converter, DatetimeParser):
+            # Detect the format once for this batch
+            converter = converter.fork()
+        
+        results = []
+        append = results.append
+        for value in values:
             try:
-                return dict(value)
-            except (TypeError, ValueError):
-                from .config import get_config
-                config = get_config()
-                
-                if config.verbose:
-                    logger.warning(f"No converter found for {value_type.__name__} to dict, using {0: value}")
-                
-                if config.raise_errors:
-                    raise TypeError(f"Cannot convert {value_type.__name__} to dict") from None
-                
-                return {0: value}
+                append(converter(value))
+            except Exception as e:
+                append(self._conversion_failed(value, target, e))
+        return results
+    
+    def to_str_many(self, values: Iterable[Any]) -> List[str]:
+        """Convert many values to strings."""
+        return self.convert_many(values, 'str')
+    
+    def to_int_many(self, values: Iterable[Any]) -> array.array:
+        """Convert many values to integers, packed into an array('q')."""
+        return self.convert_many(values, 'int')
+    
+    def to_float_many(self, values: Iterable[Any]) -> array.array:
+        """Convert many values to floats, packed into an array('d')."""
+        return self.convert_many(values, 'float')
+    
+    def to_bool_many(self, values: Iterable[Any]) -> array.array:
+        """Convert many values to booleans, packed into an array('B') of 0/1."""
+        return self.convert_many(values, 'bool')
+    
+    def to_list_many(self, values: Iterable[Any]) -> List[list]:
+        """Convert many values to lists."""
+        return self.convert_many(values, 'list')
+    
+    def to_dict_many(self, values: Iterable[Any]) -> List[dict]:
+        """Convert many values to dictionaries."""
+        return self.convert_many(values, 'dict')
+    
+    def to_datetime_many(self, values: Iterable[Any]) -> List[Optional[datetime.datetime]]:
+        """Convert many values to datetimes."""
+        return self.convert_many(values, 'datetime')
 
 # Global conversion registry
 _registry = ConversionRegistry()
@@ -408,33 +1054,46 @@ def register_converter(target_type: str, source_type: Type, converter: Conversio
     Register a custom converter for a specific type.
     
     Args:
-        target_type: The target type ('str', 'int', 'float', 'bool', 'list', 'dict')
+        target_type: The target type ('str', 'int', 'float', 'bool', 'list', 'dict', 'datetime')
         source_type: The source type to convert from
         converter: A function that converts instances of the source type to the target type
     """
-    if target_type == 'str':
-        _registry.register_str(source_type, converter)
-    elif target_type == 'int':
-        _registry.register_int(source_type, converter)
-    elif target_type == 'float':
-        _registry.register_float(source_type, converter)
-    elif target_type == 'bool':
-        _registry.register_bool(source_type, converter)
-    elif target_type == 'list':
-        _registry.register_list(source_type, converter)
-    elif target_type == 'dict':
-        _registry.register_dict(source_type, converter)
-    else:
-        raise ValueError(f"Unknown target type: {target_type}")
+    _registry.register(target_type, source_type, converter)
+
+def converters_scope(converters: Union[ConverterOverlay, Mapping[str, Mapping[Type, ConversionFunc]]]):
+    """
+    Layer custom converters over the global registry for the current context.
+    
+    Works across threads and asyncio tasks, so each request or tenant can
+    use its own parsing rules without affecting the rest of the process.
+    
+    Example:
+        with converters_scope({'float': {str: parse_european_float}}):
+            get_converter('float').to_float("1,5")
+    
+    Args:
+        converters: A ConverterOverlay, or a mapping of target kind
+            ('str', 'int', ...) to ``{source_type: converter}``
+    """
+    return _registry.scope(converters)
 
 def get_converter(target_type: str) -> ConversionRegistry:
     """
     Get the converter registry for a specific target type.
     
     Args:
-        target_type: The target type ('str', 'int', 'float', 'bool', 'list', 'dict')
+        target_type: The target type ('str', 'int', 'float', 'bool', 'list', 'dict', 'datetime')
     
     Returns:
         The conversion registry
     """
-    return _registry
\ No newline at end of file
+    return _registry
+
+def warmup(types: Iterable[Type]) -> None:
+    """
+    Prefill the converter resolution cache for the given source types.
+    
+    Args:
+        types: Source types expected at runtime, e.g. at service start
+    """
+    _registry.warmup(types)
\ No newline at end of file
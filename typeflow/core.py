@@ -151,7 +151,8 @@ class TypeFlowContext:
 
 F = TypeVar('F', bound=Callable[..., Any])
 
-def with_typeflow(func: Optional[F] = None, *, verbose: bool = None, raise_errors: bool = None, auto_flow: bool = True) -> F:
+def with_typeflow(func: Optional[F] = None, *, verbose: bool = None, raise_errors: bool = None, auto_flow: bool = True,
+                  view: bool = False) -> F:
     """
     Decorator for functions with automatic type conversion.
     
@@ -165,6 +166,8 @@ def with_typeflow(func: Optional[F] = None, *, verbose: bool = None, raise_error
         verbose: If True, log information about type conversions
         raise_errors: If True, raise errors for conversions that fail
         auto_flow: If True, automatically wrap function arguments with flow()
+        view: If True, wrap list and dict arguments in views instead of
+            copying them (see flow())
     """
     def decorator(f: F) -> F:
         @functools.wraps(f)
@@ -174,8 +177,8 @@ def with_typeflow(func: Optional[F] = None, *, verbose: bool = None, raise_error
             with TypeFlowContext(verbose=verbose, raise_errors=raise_errors):
                 # If auto_flow is enabled, wrap all arguments with flow()
                 if auto_flow:
-                    args = tuple(flow(arg) for arg in args)
-                    kwargs = {key: flow(value) for key, value in kwargs.items()}
+                    args = tuple(flow(arg, view=view) for arg in args)
+                    kwargs = {key: flow(value, view=view) for key, value in kwargs.items()}
                 return f(*args, **kwargs)
         return cast(F, wrapper)
     
@@ -0,0 +1,143 @@
+"""
+Datetime parsing for TypeFlow.
+"""
+
+import datetime
+import logging
+from typing import Any, Optional, Sequence
+
+logger = logging.getLogger("typeflow")
+
+# Pseudo format for numeric strings holding seconds since the Unix epoch
+EPOCH = 'epoch'
+
+# Formats tried, in order, for strings that are not ISO 8601
+DATETIME_FORMATS = (
+    '%Y-%m-%d %H:%M:%S %z',
+    '%Y/%m/%d %H:%M:%S',
+    '%Y/%m/%d',
+    '%m/%d/%Y %H:%M:%S',
+    '%m/%d/%Y %H:%M',
+    '%m/%d/%Y',
+    '%d/%m/%Y %H:%M:%S',
+    '%d/%m/%Y %H:%M',
+    '%d/%m/%Y',
+    '%d.%m.%Y %H:%M:%S',
+    '%d.%m.%Y',
+    '%d-%b-%Y %H:%M:%S',
+    '%d-%b-%Y',
+    '%d %b %Y %H:%M:%S',
+    '%d %b %Y',
+    '%b %d %Y %H:%M:%S',
+    '%b %d, %Y',
+    '%a, %d %b %Y %H:%M:%S %z',
+    '%a, %d %b %Y %H:%M:%S GMT',
+    '%d/%b/%Y:%H:%M:%S %z',
+    '%Y%m%d%H%M%S',
+    EPOCH,
+)
+
+# Looked up once, as they are called for every value
+_fromisoformat = datetime.datetime.fromisoformat
+_strptime = datetime.datetime.strptime
+
+def from_timestamp(value: Any) -> datetime.datetime:
+    """Convert seconds since the Unix epoch to an aware UTC datetime."""
+    return datetime.datetime.fromtimestamp(float(value), tz=datetime.timezone.utc)
+
+class DatetimeParser:
+    """
+    Parse datetime strings, detecting their format.
+    
+    ISO 8601 strings take a fast path through ``datetime.fromisoformat``.
+    For other strings the formats are tried in order. A registered parser
+    doesn't remember anything, so converting a single value always gives
+    the same result, e.g. for '01/02/2024', whatever was converted before.
+    
+    fork() gives a parser for one column or stream, which remembers the
+    first format that fits, so following values are parsed with a single
+    ``strptime`` call; the format is detected again when a value stops
+    fitting it. convert_many(), the readers and compile_schema() fork
+    registered parsers automatically. Bytes-like values are decoded as
+    ASCII; numeric strings are read as seconds since the epoch (UTC).
+    
+    Example:
+        register_converter('datetime', str, DatetimeParser(['%d/%m/%Y']))
+    """
+    
+    __slots__ = ('formats', 'format', 'remember')
+    
+    def __init__(self, formats: Sequence[str] = DATETIME_FORMATS, remember: bool = False):
+        """
+        Initialize the parser.
+        
+        Args:
+            formats: strptime formats to detect, in order of preference;
+                'epoch' stands for numeric timestamps
+            remember: Whether to keep the detected format for following
+                values; fork() sets this
+        """
+        self.formats = tuple(formats)
+        self.remember = remember
+        # Detected format, or None while values are ISO 8601
+        self.format: Optional[str] = None
+    
+    def __call__(self, value: Any) -> datetime.datetime:
+        """
+        Parse a string or bytes-like value.
+        
+        Raises:
+            ValueError: If the value matches none of the formats
+        """
+        if type(value) is not str:
+            value = str(value, 'ascii')
+        
+        fmt = self.format
+        try:
+            if fmt is None:
+                return _fromisoformat(value)
+            if fmt == EPOCH:
+                return from_timestamp(value)
+            return _strptime(value, fmt)
+        except (ValueError, OverflowError, OSError):
+            return self._detect(value.strip())
+    
+    def fork(self) -> "DatetimeParser":
+        """Get a parser with the same formats that remembers its own detected format."""
+        return DatetimeParser(self.formats, remember=True)
+    
+    def _detect(self, value: str) -> datetime.datetime:
+        """Find the format of a stripped ``value`` and remember it."""
+        try:
+            result = _fromisoformat(value)
+        except ValueError:
+            pass
+        else:
+            if self.remember:
+                self.format = None
+            return result
+        
+        # Try the current format first in case only whitespace got in the way
+        formats = self.formats if self.format is None else (self.format,) + self.formats
+        for fmt in formats:
+            try:
+                result = from_timestamp(value) if fmt == EPOCH else _strptime(value, fmt)
+            except (ValueError, OverflowError, OSError):
+                continue
+            if self.remember:
+                if fmt != self.format:
+                    logger.debug(f"Detected datetime format {fmt!r} from {value!r}")
+                self.format = fmt
+            return result
+        
+        raise ValueError(f"Unknown datetime format: {value!r}")
+    
+    def __repr__(self) -> str:
+        return f"DatetimeParser(format={self.format!r})"
+    
+    def __reduce__(self):
+        return (DatetimeParser, (self.formats, self.remember))
+
+# Parser shared by the default str and bytes -> datetime converters; it
+# doesn't remember formats, so it is safe to share between threads
+default_parser = DatetimeParser()
@@ -0,0 +1,192 @@
+"""
+Sample-based type inference for TypeFlow.
+"""
+
+import datetime
+import decimal
+import itertools
+import logging
+from collections import namedtuple
+from typing import Any, Dict, Iterable, List, Mapping, Union
+
+from .converters import FALSE_STRINGS, TRUE_STRINGS
+from .datetimes import default_parser
+
+logger = logging.getLogger("typeflow")
+
+# Classification of a column, with the target kind to convert it to
+ColumnProfile = namedtuple('ColumnProfile', ['kind', 'target', 'count', 'nulls'])
+
+# Target kind used for each inferred kind
+KIND_TARGETS = {'int': 'int', 'float': 'float', 'bool': 'bool', 'datetime': 'datetime', 'text': 'str'}
+
+# Kinds in order of preference when several fit every value
+_KINDS = ('int', 'float', 'bool', 'datetime')
+
+_BOOL_WORDS = frozenset(TRUE_STRINGS) | frozenset(FALSE_STRINGS)
+
+class _Column:
+    """Running classification of one column."""
+    
+    __slots__ = ('candidates', 'count', 'nulls', 'bool_words', 'parser')
+    
+    def __init__(self):
+        self.candidates = set(_KINDS)
+        self.count = 0
+        self.nulls = 0
+        # Whether a value only makes sense as a boolean, e.g. 'yes' or True
+        self.bool_words = False
+        # Parser detecting the column's datetime format like the default
+        # str -> datetime converter does
+        self.parser = default_parser.fork()
+    
+    def add(self, value: Any) -> None:
+        """Narrow the candidate kinds down to those that fit ``value``."""
+        self.count += 1
+        candidates = self.candidates
+        
+        if isinstance(value, (bytes, bytearray)):
+            value = value.decode('latin-1')
+        
+        if value is None or (isinstance(value, str) and not value.strip()):
+            self.nulls += 1
+        elif not candidates:
+            pass
+        elif isinstance(value, str):
+            self._add_str(value, candidates)
+        elif isinstance(value, bool):
+            self.bool_words = True
+            candidates.discard('datetime')
+        elif isinstance(value, int):
+            if value not in (0, 1):
+                candidates.discard('bool')
+            candidates.discard('datetime')
+        elif isinstance(value, (float, decimal.Decimal)):
+            candidates.difference_update(('int', 'bool', 'datetime'))
+        elif isinstance(value, (datetime.datetime, datetime.date)):
+            candidates.intersection_update(('datetime',))
+        else:
+            candidates.clear()
+    
+    def _add_str(self, value: str, candidates: set) -> None:
+        """Narrow the candidates for a string the way the default converters parse it."""
+        # The default str -> bool converter compares without stripping
+        if 'bool' in candidates and value.lower() not in _BOOL_WORDS:
+            candidates.discard('bool')
+        
+        # The default str -> int and str -> float converters strip first
+        stripped = value.strip()
+        if 'int' in candidates:
+            try:
+                int(stripped)
+            except ValueError:
+                candidates.discard('int')
+        if 'float' in candidates:
+            try:
+                float(stripped)
+            except ValueError:
+                candidates.discard('float')
+            else:
+                candidates.discard('datetime')
+                return
+        
+        if 'bool' in candidates:
+            self.bool_words = True
+        if 'datetime' in candidates:
+            try:
+                self.parser(stripped)
+            except ValueError:
+                candidates.discard('datetime')
+    
+    def profile(self, null_ratio: float) -> ColumnProfile:
+        """Pick the kind and target for the values seen."""
+        candidates = self.candidates
+        if self.nulls == self.count:
+            kind = 'text'
+        elif 'bool' in candidates and self.bool_words:
+            kind = 'bool'
+        else:
+            kind = next((kind for kind in _KINDS if kind in candidates), 'text')
+        
+        target = KIND_TARGETS[kind]
+        if self.count and self.nulls / self.count >= null_ratio:
+            kind = 'null'
+        return ColumnProfile(kind, target, self.count, self.nulls)
+
+def infer(values: Union[Iterable[Any], Mapping[Any, Iterable[Any]]], sample: int = 10000,
+          null_ratio: float = 0.5, details: bool = False) -> Any:
+    """
+    Infer the types of columns or record fields from a sample of values.
+    
+    Each column is classified as 'int', 'float', 'bool', 'datetime', 'null'
+    (at least ``null_ratio`` of the values are None or blank) or 'text' in
+    a single pass over the first ``sample`` items. Strings are judged the
+    way the default converters parse them: int and float values may have
+    surrounding whitespace, booleans must be one of TRUE_STRINGS or
+    FALSE_STRINGS and datetimes must be ISO 8601 or in one of the
+    DATETIME_FORMATS. Columns of only '0' and '1' are ints.
+    
+    Example:
+        schema = infer([{'id': '1', 'paid': 'yes'}, {'id': '2', 'paid': 'no'}])
+        # {'id': 'int', 'paid': 'bool'}
+        convert = compile_schema(schema)
+    
+    Args:
+        values: A single column of values, an iterable of records (dicts) or
+            rows (lists or tuples), or a mapping of column name to values
+        sample: Maximum number of items to look at per column
+        null_ratio: Share of nulls from which a column is 'null'
+        details: If True, return a ColumnProfile per column instead of its
+            target kind
+    
+    Returns:
+        The target kind to convert each column to (null columns use the
+        target of their non-null values), in the shape of the input: a
+        dict for records and column mappings, a list for rows and a single
+        target for a column. Usable as a schema for compile_schema() and
+        read_csv().
+    """
+    if isinstance(values, Mapping):
+        return {name: _infer_column(column, sample, null_ratio, details) for name, column in values.items()}
+    
+    items = list(itertools.islice(values, sample))
+    first = next((item for item in items if item is not None), None)
+    
+    if isinstance(first, Mapping):
+        columns: Dict[Any, _Column] = {}
+        for index, record in enumerate(items):
+            record = record or {}
+            for key, value in record.items():
+                column = columns.get(key)
+                if column is None:
+                    # Records seen before this key appeared count as nulls
+                    column = columns[key] = _Column()
+                    column.count = column.nulls = index
+                column.add(value)
+            for key in columns.keys() - record.keys():
+                columns[key].add(None)
+        return {key: _result(column, null_ratio, details) for key, column in columns.items()}
+    
+    if isinstance(first, (list, tuple)):
+        width = max(len(row) if row is not None else 0 for row in items)
+        row_columns: List[_Column] = [_Column() for _ in range(width)]
+        for row in items:
+            row = row or ()
+            for index, column in enumerate(row_columns):
+                column.add(row[index] if index < len(row) else None)
+        return [_result(column, null_ratio, details) for column in row_columns]
+    
+    return _infer_column(items, sample, null_ratio, details)
+
+def _infer_column(values: Iterable[Any], sample: int, null_ratio: float, details: bool) -> Any:
+    """Classify a single column."""
+    column = _Column()
+    for value in itertools.islice(values, sample):
+        column.add(value)
+    return _result(column, null_ratio, details)
+
+def _result(column: _Column, null_ratio: float, details: bool) -> Any:
+    """Get a column's profile or target kind."""
+    profile = column.profile(null_ratio)
+    logger.debug(f"Inferred {profile.kind} from {profile.count} values ({profile.nulls} null)")
+    return profile if details else profile.target
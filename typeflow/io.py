@@ -0,0 +1,386 @@
+"""
+Streaming readers for TypeFlow.
+"""
+
+import csv
+import io
+import json
+import logging
+import os
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, IO, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .converters import ConversionFunc, ConversionRegistry, _registry, _str_to_bool, parse_bool
+from .datetimes import DatetimeParser
+from .inference import _Column
+from .schema import target_name
+from .types import FlowDict
+
+logger = logging.getLogger("typeflow")
+
+# A row that could not be converted, passed to the on_error callback
+RowError = namedtuple('RowError', ['line', 'row', 'column', 'value', 'error'])
+
+# A key path whose learned type stopped fitting, passed to the on_drift callback
+Drift = namedtuple('Drift', ['path', 'old', 'new', 'value', 'line'])
+
+Source = Union[str, os.PathLike, IO[str], IO[bytes]]
+
+def read_csv(path_or_file: Source, schema: Optional[Mapping[str, Any]] = None, *,
+             batch_size: Optional[int] = None, on_error: Optional[Callable[[RowError], None]] = None,
+             fieldnames: Optional[Sequence[str]] = None, encoding: str = "utf-8",
+             registry: Optional[ConversionRegistry] = None, **fmtparams: Any) -> Iterator[Any]:
+    """
+    Read a CSV file, converting columns as rows are read.
+    
+    The file is streamed, so memory use does not depend on its size. The
+    converter for each column in ``schema`` is resolved once. Blank cells
+    in converted columns become None. Rows with a value that cannot be
+    converted are not substituted with 0 or False; they are passed to
+    ``on_error`` and left out of the output.
+    
+    Example:
+        errors = []
+        for row in read_csv("orders.csv", {'id': int, 'price': float}, on_error=errors.append):
+            ...
+    
+    Args:
+        path_or_file: A path, or a text or binary file object
+        schema: Mapping of column name to target type or kind name
+            (``int``, ``'float'``, ...); other columns are left as strings
+        batch_size: If given, yield lists of up to this many rows instead
+            of single rows
+        on_error: Called with a RowError for each row that fails to convert;
+            if None, a failing row raises ValueError
+        fieldnames: Column names; read from the first row by default
+        encoding: Encoding used for paths and binary files
+        registry: The registry supplying the converters; the global
+            registry by default
+        **fmtparams: Formatting parameters passed to csv.reader()
+    
+    Yields:
+        Dicts mapping column names to converted values, or lists of them
+    """
+    if registry is None:
+        registry = _registry
+    
+    if batch_size is not None and batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    
+    with _open_text(path_or_file, encoding) as f:
+        reader = csv.reader(f, **fmtparams)
+        if fieldnames is None:
+            fieldnames = next(reader, None)
+            if fieldnames is None:
+                return
+        fieldnames = list(fieldnames)
+        
+        rows = _convert_rows(reader, fieldnames, _column_converters(fieldnames, schema or {}, registry), on_error)
+        if batch_size is None:
+            yield from rows
+            return
+        
+        batch: List[Dict[str, Any]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+def _column_converters(fieldnames: List[str], schema: Mapping[str, Any],
+                       registry: ConversionRegistry) -> List[Tuple[int, str, ConversionFunc]]:
+    """Resolve the str converter of each column in the schema once."""
+    missing = [name for name in schema if name not in fieldnames]
+    if missing:
+        raise ValueError(f"Columns not found in CSV header: {', '.join(map(str, missing))}")
+    
+    targets = registry.targets
+    converters = []
+    for index, name in enumerate(fieldnames):
+        if name in schema:
+            target = target_name(schema[name], targets)
+            if target != 'str':
+                converters.append((index, target, _strict(registry.resolve(str, target), str, target)))
+    return converters
+
+def _strict(converter: ConversionFunc, source: type, target: str) -> ConversionFunc:
+    """Swap lenient default converters for ones that reject bad values, and fork stateful ones."""
+    # The default str -> bool converter maps unrecognised words to False
+    if converter is _str_to_bool:
+        return parse_bool
+    # The default float -> int converter truncates
+    if source is float and target == 'int' and converter is int:
+        return _exact_int
+    # Detect the datetime format separately for each column or key path
+    if isinstance(converter, DatetimeParser):
+        return converter.fork()
+    return converter
+
+def _exact_int(value: float) -> int:
+    """Convert a float to int, rejecting values with a fractional part."""
+    if not value.is_integer():
+        raise ValueError(f"Not an integer: {value!r}")
+    return int(value)
+
+def _convert_rows(reader: Iterator[List[str]], fieldnames: List[str],
+                  converters: List[Tuple[int, str, ConversionFunc]],
+                  on_error: Optional[Callable[[RowError], None]]) -> Iterator[Dict[str, Any]]:
+    """Convert the cells of each row and pair them with the column names."""
+    width = len(fieldnames)
+    for row in reader:
+        if len(row) != width:
+            if not row:
+                continue
+            _reject(RowError(reader.line_num, row, None, None,
+                             ValueError(f"Expected {width} fields, got {len(row)}")), on_error)
+            continue
+        
+        # Convert a copy so that rejected rows are reported as read
+        converted = row.copy()
+        try:
+            for index, target, converter in converters:
+                value = row[index]
+                converted[index] = converter(value) if value else None
+        except Exception as e:
+            _reject(RowError(reader.line_num, row, fieldnames[index], value, e), on_error)
+            continue
+        
+        yield dict(zip(fieldnames, converted))
+
+def _reject(error: RowError, on_error: Optional[Callable[[RowError], None]]) -> None:
+    """Send a failed row to the side channel, or raise if there is none."""
+    if on_error is None:
+        column = f" in column {error.column!r}" if error.column is not None else ""
+        raise ValueError(f"Cannot convert row on line {error.line}{column}: {error.error}") from error.error
+    logger.debug(f"Rejected row on line {error.line}: {error.error}")
+    on_error(error)
+
+def read_jsonl(path_or_file: Source, *, learn: int = 1000, on_drift: Optional[Callable[[Drift], None]] = None,
+               on_error: Optional[Callable[[RowError], None]] = None, flow_dicts: bool = False,
+               encoding: str = "utf-8", registry: Optional[ConversionRegistry] = None) -> Iterator[Any]:
+    """
+    Read a JSON Lines file, converting stringly-typed values as records are read.
+    
+    The types of the values at each key path (e.g. ``order.items[].qty``)
+    are learned from the first ``learn`` records, the same way infer()
+    classifies columns. The resulting plan is applied to every record with
+    converters resolved once per path and source type. When a value no
+    longer fits its path's type, say '1.5' at an int path, the path is
+    re-specialized (int -> float) and the drift is reported. Paths first
+    seen after learning are left as they are. Apart from the records
+    buffered while learning, memory use does not depend on the file size.
+    
+    Example:
+        for event in read_jsonl("events.jsonl", on_drift=print):
+            ...
+    
+    Args:
+        path_or_file: A path, or a text or binary file object
+        learn: Number of records to learn the plan from
+        on_drift: Called with a Drift for each re-specialized path; if None,
+            drift is logged as a warning
+        on_error: Called with a RowError for each line that is not valid
+            JSON; if None, such a line raises ValueError
+        flow_dicts: If True, yield FlowDicts instead of dicts
+        encoding: Encoding used for paths and binary files
+        registry: The registry supplying the converters; the global
+            registry by default
+    
+    Yields:
+        The converted records
+    """
+    if registry is None:
+        registry = _registry
+    
+    if learn < 1:
+        raise ValueError(f"learn must be at least 1, got {learn}")
+    
+    wrap = FlowDict if flow_dicts else None
+    plan: Optional[_PathNode] = None
+    root = _PathNode("")
+    buffered: List[Tuple[int, Any]] = []
+    
+    with _open_text(path_or_file, encoding) as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                _reject(RowError(line_num, line, None, None, e), on_error)
+                continue
+            
+            if plan is None:
+                root.learn(record)
+                buffered.append((line_num, record))
+                if len(buffered) < learn:
+                    continue
+                
+                plan = _Plan(root, registry, on_drift)
+                for buffered_line, buffered_record in buffered:
+                    yield _finish(plan.apply(buffered_record, buffered_line), wrap)
+                buffered = []
+                continue
+            
+            yield _finish(plan.apply(record, line_num), wrap)
+    
+    if plan is None and buffered:
+        plan = _Plan(root, registry, on_drift)
+        for buffered_line, buffered_record in buffered:
+            yield _finish(plan.apply(buffered_record, buffered_line), wrap)
+
+def _finish(record: Any, wrap: Optional[type]) -> Any:
+    """Wrap a converted record in a FlowDict if asked to."""
+    if wrap is not None and type(record) is dict:
+        return wrap(record)
+    return record
+
+class _PathNode:
+    """Learned conversion plan for a key path and the paths below it."""
+    
+    __slots__ = ('path', 'fields', 'items', 'column', 'target', 'target_type', 'converters', 'plan')
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.fields: Dict[Any, "_PathNode"] = {}
+        self.items: Optional["_PathNode"] = None
+        # Classification of the scalar values seen at this path
+        self.column: Optional[_Column] = None
+        self.target: Optional[str] = None
+        self.target_type: Optional[type] = None
+        self.converters: Dict[type, ConversionFunc] = {}
+        self.plan: Optional["_Plan"] = None
+    
+    def child(self, key: Any) -> "_PathNode":
+        """Get the node for a key of the mapping at this path."""
+        node = self.fields.get(key)
+        if node is None:
+            node = self.fields[key] = _PathNode(f"{self.path}.{key}" if self.path else str(key))
+        return node
+    
+    def learn(self, value: Any) -> None:
+        """Record the types found in a value at this path."""
+        if isinstance(value, dict):
+            for key, item in value.items():
+                self.child(key).learn(item)
+        elif isinstance(value, list):
+            if self.items is None:
+                self.items = _PathNode(f"{self.path}[]")
+            for item in value:
+                self.items.learn(item)
+        else:
+            if self.column is None:
+                self.column = _Column()
+            self.column.add(value)
+    
+    def specialize(self, plan: "_Plan") -> bool:
+        """
+        Pick converters for this path and the paths below it.
+        
+        Returns:
+            Whether any value at or below this path needs converting
+        """
+        self.plan = plan
+        if self.column is not None:
+            self.set_target(self.column.profile(1.0).target)
+        
+        self.fields = {key: node for key, node in self.fields.items() if node.specialize(plan)}
+        if self.items is not None and not self.items.specialize(plan):
+            self.items = None
+        return bool(self.target or self.fields or self.items)
+    
+    def set_target(self, target: str) -> None:
+        """Convert scalars at this path to ``target``; 'str' leaves them as they are."""
+        kind = self.plan.registry.targets[target]
+        self.target = None if target == 'str' else target
+        self.target_type = kind.builtin if isinstance(kind.builtin, type) else None
+        self.converters = {}
+    
+    def apply(self, value: Any, line: int) -> Any:
+        """Convert a value at this path in place, returning the result."""
+        value_type = type(value)
+        if value_type is dict:
+            for key, node in self.fields.items():
+                if key in value:
+                    value[key] = node.apply(value[key], line)
+            return value
+        
+        if value_type is list:
+            node = self.items
+            if node is not None:
+                for index, item in enumerate(value):
+                    value[index] = node.apply(item, line)
+            return value
+        
+        target = self.target
+        if target is None or value is None or value_type is self.target_type:
+            return value
+        
+        converter = self.converters.get(value_type)
+        if converter is None:
+            converter = self.converters[value_type] = _strict(self.plan.registry.resolve(value_type, target), value_type, target)
+        try:
+            return converter(value)
+        except Exception:
+            return self.drift(value, line)
+    
+    def drift(self, value: Any, line: int) -> Any:
+        """Re-specialize this path for a value that does not fit its type."""
+        if isinstance(value, str) and not value.strip():
+            return None
+        
+        if self.column is None:
+            self.column = _Column()
+        self.column.add(value)
+        old = self.target or 'str'
+        new = self.column.profile(1.0).target
+        if new == old:
+            # The registry's converter is stricter than the profile; keep
+            # values at this path as they are rather than drifting again
+            new = 'str'
+        self.set_target(new)
+        self.plan.report(Drift(self.path, old, new, value, line))
+        
+        if self.target is None:
+            return value
+        return self.apply(value, line)
+
+class _Plan:
+    """Root of a learned plan, with what its nodes share."""
+    
+    def __init__(self, root: _PathNode, registry: ConversionRegistry, on_drift: Optional[Callable[[Drift], None]]):
+        self.registry = registry
+        self.on_drift = on_drift
+        self.root = root
+        root.specialize(self)
+    
+    def apply(self, record: Any, line: int) -> Any:
+        """Convert a record."""
+        return self.root.apply(record, line)
+    
+    def report(self, drift: Drift) -> None:
+        """Pass a drift to the callback, or log it."""
+        if self.on_drift is None:
+            logger.warning(f"Type drift at {drift.path} on line {drift.line}: {drift.old} -> {drift.new} ({drift.value!r})")
+        else:
+            self.on_drift(drift)
+
+@contextmanager
+def _open_text(path_or_file: Source, encoding: str) -> Iterator[IO[str]]:
+    """Open a path, or wrap a binary file, as a text file suitable for csv."""
+    if isinstance(path_or_file, (str, os.PathLike)):
+        with open(path_or_file, newline="", encoding=encoding) as f:
+            yield f
+    elif isinstance(path_or_file, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(path_or_file, "mode", ""):
+        wrapper = io.TextIOWrapper(path_or_file, encoding=encoding, newline="")
+        try:
+            yield wrapper
+        finally:
+            # Leave the caller's file open
+            wrapper.detach()
+    else:
+        yield path_or_file
@@ -0,0 +1,313 @@
+"""
+Conversion metrics for TypeFlow.
+"""
+
+import functools
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, IO, List, Optional, Sequence, Tuple, Union
+
+from .converters import ConversionRegistry, _registry
+from .types import FlowBool, FlowDict, FlowFloat, FlowInt, FlowList, FlowStr
+
+logger = logging.getLogger("typeflow")
+
+# Upper bounds of the latency histogram buckets, in seconds
+DEFAULT_BUCKETS = (1e-06, 2.5e-06, 5e-06, 1e-05, 2.5e-05, 0.0001, 0.001, 0.01)
+
+# Flow types and the operator methods that are instrumented when defined
+_FLOW_TYPES = (FlowStr, FlowInt, FlowFloat, FlowList, FlowDict, FlowBool)
+_OPERATORS = ('__add__', '__radd__', '__mul__', '__rmul__', '__iadd__', '__imul__', '__ior__')
+
+class _Histogram:
+    """Cumulative latency histogram in the Prometheus sense."""
+    
+    __slots__ = ('counts', 'sum', 'count')
+    
+    def __init__(self, buckets: int):
+        self.counts = [0] * buckets
+        self.sum = 0.0
+        self.count = 0
+
+class Metrics:
+    """
+    Counters and latency histograms for conversions and Flow operators.
+    
+    Instances are filled in by enable_metrics(); reading them is safe while
+    other threads keep recording.
+    """
+    
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.conversions: Dict[Tuple[str, str], int] = {}
+        self.fallbacks: Dict[Tuple[str, str, str], int] = {}
+        self.operations: Dict[Tuple[str, str, str], int] = {}
+        self._conversion_seconds: Dict[str, _Histogram] = {}
+        self._operation_seconds: Dict[str, _Histogram] = {}
+    
+    def record_conversion(self, source: str, target: str, seconds: float, count: int = 1) -> None:
+        """
+        Record conversions of ``count`` values from ``source`` to ``target``.
+        
+        Args:
+            source: Name of the source type
+            target: The target kind, e.g. 'int'
+            seconds: Total time spent on the conversions
+            count: Number of values converted
+        """
+        key = (source, target)
+        with self._lock:
+            self.conversions[key] = self.conversions.get(key, 0) + count
+            self._observe(self._conversion_seconds, target, seconds, count)
+    
+    def record_fallback(self, source: str, target: str, reason: str) -> None:
+        """
+        Record a conversion that silently returned a substitute value.
+        
+        Args:
+            source: Name of the source type
+            target: The target kind, e.g. 'int'
+            reason: 'converter_error' if a registered converter raised, or
+                'no_converter' if the builtin constructor failed
+        """
+        key = (source, target, reason)
+        with self._lock:
+            self.fallbacks[key] = self.fallbacks.get(key, 0) + 1
+    
+    def record_operation(self, op: str, left: str, right: str, seconds: float) -> None:
+        """
+        Record a Flow operator call.
+        
+        Args:
+            op: Name of the operator method, e.g. '__add__'
+            left: Name of the type of the Flow operand
+            right: Name of the type of the other operand
+            seconds: Time spent in the operator
+        """
+        key = (op, left, right)
+        with self._lock:
+            self.operations[key] = self.operations.get(key, 0) + 1
+            self._observe(self._operation_seconds, op, seconds, 1)
+    
+    def _observe(self, histograms: Dict[str, _Histogram], label: str, seconds: float, count: int) -> None:
+        """Add ``count`` observations averaging ``seconds / count`` to a histogram."""
+        histogram = histograms.get(label)
+        if histogram is None:
+            histogram = histograms[label] = _Histogram(len(self.buckets))
+        
+        each = seconds / count
+        for i, bound in enumerate(self.buckets):
+            if each <= bound:
+                histogram.counts[i] += count
+        histogram.sum += seconds
+        histogram.count += count
+    
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        with self._lock:
+            self.conversions.clear()
+            self.fallbacks.clear()
+            self.operations.clear()
+            self._conversion_seconds.clear()
+            self._operation_seconds.clear()
+    
+    def render(self) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+        
+        Returns:
+            The metrics, ready to be served from a /metrics endpoint
+        """
+        with self._lock:
+            lines: List[str] = []
+            self._render_counter(lines, 'typeflow_conversions_total',
+                                 'Conversions performed by the registry.',
+                                 ('source', 'target'), self.conversions)
+            self._render_counter(lines, 'typeflow_conversion_fallbacks_total',
+                                 'Conversions that returned a substitute value instead of failing.',
+                                 ('source', 'target', 'reason'), self.fallbacks)
+            self._render_histogram(lines, 'typeflow_conversion_seconds',
+                                   'Time spent converting a value.',
+                                   'target', self._conversion_seconds)
+            self._render_counter(lines, 'typeflow_operations_total',
+                                 'Flow operator calls.',
+                                 ('op', 'left', 'right'), self.operations)
+            self._render_histogram(lines, 'typeflow_operation_seconds',
+                                   'Time spent in a Flow operator.',
+                                   'op', self._operation_seconds)
+        return "\n".join(lines) + "\n"
+    
+    def _render_counter(self, lines: List[str], name: str, help_text: str,
+                        labels: Tuple[str, ...], values: Dict[Tuple[str, ...], int]) -> None:
+        """Append a counter family to ``lines``."""
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for key, value in sorted(values.items()):
+            lines.append(f"{name}{_labels(zip(labels, key))} {value}")
+    
+    def _render_histogram(self, lines: List[str], name: str, help_text: str,
+                          label: str, histograms: Dict[str, _Histogram]) -> None:
+        """Append a histogram family to ``lines``."""
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for value, histogram in sorted(histograms.items()):
+            for bound, count in zip(self.buckets, histogram.counts):
+                lines.append(f"{name}_bucket{_labels([(label, value), ('le', repr(float(bound)))])} {count}")
+            lines.append(f"{name}_bucket{_labels([(label, value), ('le', '+Inf')])} {histogram.count}")
+            lines.append(f"{name}_sum{_labels([(label, value)])} {histogram.sum!r}")
+            lines.append(f"{name}_count{_labels([(label, value)])} {histogram.count}")
+
+def _labels(pairs) -> str:
+    """Format label pairs as ``{name="value",...}``."""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+def _escape(value: str) -> str:
+    """Escape a label value as required by the text exposition format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+# Metrics being recorded, or None while metrics are disabled
+_metrics: Optional[Metrics] = None
+
+# Registries and operator methods replaced by enable_metrics()
+_instrumented: List[ConversionRegistry] = []
+_patched: List[Tuple[type, str, Any]] = []
+
+def enable_metrics(registry: Optional[ConversionRegistry] = None,
+                   buckets: Sequence[float] = DEFAULT_BUCKETS) -> Metrics:
+    """
+    Start recording conversion and Flow operator metrics.
+    
+    Instrumented versions of the conversion and operator methods are
+    swapped in, so metrics cost nothing until they are enabled.
+    
+    Args:
+        registry: Registry to instrument; the global registry by default
+        buckets: Upper bounds of the latency histogram buckets, in seconds
+    
+    Returns:
+        The Metrics being recorded
+    """
+    global _metrics
+    
+    if registry is None:
+        registry = _registry
+    
+    if _metrics is None:
+        _metrics = Metrics(buckets)
+        _patch_operators(_metrics)
+    
+    if registry not in _instrumented:
+        _instrument_registry(registry, _metrics)
+        _instrumented.append(registry)
+    
+    logger.debug("TypeFlow metrics enabled")
+    return _metrics
+
+def disable_metrics() -> None:
+    """Stop recording metrics and restore the uninstrumented methods."""
+    global _metrics
+    
+    for registry in _instrumented:
+        for name in ('convert', '_convert_group'):
+            registry.__dict__.pop(name, None)
+        registry._metrics = None
+    _instrumented.clear()
+    
+    for cls, name, method in reversed(_patched):
+        setattr(cls, name, method)
+    _patched.clear()
+    
+    _metrics = None
+    logger.debug("TypeFlow metrics disabled")
+
+def get_metrics() -> Optional[Metrics]:
+    """Get the metrics being recorded, or None if metrics are disabled."""
+    return _metrics
+
+def render_prometheus() -> str:
+    """
+    Render the recorded metrics in the Prometheus text exposition format.
+    
+    Returns:
+        The metrics text; empty if metrics are disabled
+    """
+    if _metrics is None:
+        return ""
+    return _metrics.render()
+
+def write_prometheus(file: Union[str, os.PathLike, IO[str]]) -> None:
+    """
+    Write the recorded metrics in the Prometheus text exposition format.
+    
+    Paths are replaced atomically, which is what the node_exporter textfile
+    collector expects.
+    
+    Args:
+        file: A path or a writable text file
+    """
+    text = render_prometheus()
+    if hasattr(file, "write"):
+        file.write(text)
+        return
+    
+    directory = os.path.dirname(os.fspath(file)) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".typeflow-", suffix=".prom")
+    try:
+        with os.fdopen(fd, "w") as tmp:
+            tmp.write(text)
+        os.replace(tmp_path, file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def _instrument_registry(registry: ConversionRegistry, metrics: Metrics) -> None:
+    """Shadow a registry's conversion methods with timed versions."""
+    convert = registry.convert
+    convert_group = registry._convert_group
+    perf_counter = time.perf_counter
+    
+    def timed_convert(value: Any, target: str) -> Any:
+        start = perf_counter()
+        try:
+            return convert(value, target)
+        finally:
+            metrics.record_conversion(type(value).__name__, target, perf_counter() - start)
+    
+    def timed_convert_group(value_type: type, values: Sequence[Any], target: str) -> List[Any]:
+        start = perf_counter()
+        try:
+            return convert_group(value_type, values, target)
+        finally:
+            metrics.record_conversion(value_type.__name__, target, perf_counter() - start, len(values))
+    
+    registry.convert = timed_convert
+    registry._convert_group = timed_convert_group
+    registry._metrics = metrics
+
+def _patch_operators(metrics: Metrics) -> None:
+    """Replace the Flow operator methods with timed versions."""
+    for cls in _FLOW_TYPES:
+        for name in _OPERATORS:
+            method = cls.__dict__.get(name)
+            if method is None:
+                continue
+            setattr(cls, name, _timed_operator(method, name, metrics))
+            _patched.append((cls, name, method))
+
+def _timed_operator(method: Any, name: str, metrics: Metrics) -> Any:
+    """Wrap an operator method so that each call is counted and timed."""
+    perf_counter = time.perf_counter
+    
+    @functools.wraps(method)
+    def timed(self, other):
+        start = perf_counter()
+        try:
+            return method(self, other)
+        finally:
+            metrics.record_operation(name, type(self).__name__, type(other).__name__, perf_counter() - start)
+    
+    return timed
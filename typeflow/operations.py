@@ -0,0 +1,112 @@
+"""
+Operator dispatch for TypeFlow.
+"""
+
+import logging
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Type
+
+logger = logging.getLogger("typeflow")
+
+# Type for operation handlers, called with the left and right operands
+OperationFunc = Callable[[Any, Any], Any]
+
+# Operators handlers can be registered for; the in-place ones may modify
+# and return the left operand
+OPERATORS = ('+', '*', '+=', '*=', '|=')
+
+def _not_implemented(left: Any, right: Any) -> Any:
+    """Handler for operand types without a registered operation."""
+    return NotImplemented
+
+class OperationTable:
+    """
+    Dispatch table for the operators of the Flow types.
+    
+    Handlers are registered for (left type, right type, operator). The
+    handler for a pair of operand types is the one registered for the
+    closest classes in their MROs, the left operand's MRO taking
+    precedence, and is cached in ``handlers`` under the exact types, so an
+    operation costs a single dict lookup. Operand types without a handler
+    give NotImplemented, which lets Python try the other operand.
+    
+    Registrations are copy-on-write: register() publishes the new
+    registrations and then swaps in an empty cache, so readers never take
+    a lock and never cache a handler resolved from outdated registrations.
+    """
+    
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self.registered: Mapping[Tuple[Type, Type, str], OperationFunc] = MappingProxyType({})
+        self.handlers: Dict[Tuple[Type, Type, str], OperationFunc] = {}
+    
+    def register(self, left: Type, right: Type, op: str, handler: OperationFunc) -> None:
+        """
+        Register the handler for ``left op right``.
+        
+        Args:
+            left: The type of the left operand
+            right: The type of the right operand
+            op: The operator, one of OPERATORS
+            handler: A function called with the left and right operands
+        """
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator: {op}")
+        if not isinstance(left, type) or not isinstance(right, type):
+            raise TypeError(f"Operand types must be classes, got {left!r} and {right!r}")
+        
+        with self._lock:
+            registered = dict(self.registered)
+            registered[(left, right, op)] = handler
+            self.registered = MappingProxyType(registered)
+            self.handlers = {}
+    
+    def resolve(self, left: Type, right: Type, op: str) -> OperationFunc:
+        """Find the handler for ``left op right`` and cache it."""
+        # Read the cache before the registrations; see the class docstring
+        handlers = self.handlers
+        handler = self.lookup(left, right, op)
+        if handler is None:
+            handler = _not_implemented
+        
+        if len(handlers) >= self.maxsize:
+            handlers.clear()
+        handlers[(left, right, op)] = handler
+        return handler
+    
+    def lookup(self, left: Type, right: Type, op: str) -> Optional[OperationFunc]:
+        """Find the handler registered for the closest classes in the MROs."""
+        registered = self.registered
+        for left_class in left.__mro__:
+            for right_class in right.__mro__:
+                handler = registered.get((left_class, right_class, op))
+                if handler is not None:
+                    return handler
+        
+        return None
+
+# Global operation table, filled with the default handlers by typeflow.types
+_operations = OperationTable()
+
+def register_operation(left_type: Type, right_type: Type, op: str, handler: OperationFunc) -> None:
+    """
+    Register a custom handler for an operator of the Flow types.
+    
+    The handler replaces the default behaviour for operands of these types
+    (and their subclasses, unless they have a handler of their own). The
+    reflected operation is a separate registration: ``Decimal + FlowStr``
+    is dispatched on (Decimal, FlowStr, '+').
+    
+    Example:
+        register_operation(FlowStr, Decimal, '+', lambda s, d: FlowStr(s + format(d, 'f')))
+    
+    Args:
+        left_type: The type of the left operand
+        right_type: The type of the right operand
+        op: The operator ('+', '*', or the in-place '+=', '*=' or '|=')
+        handler: A function called with the left and right operands that
+            returns the result
+    """
+    _operations.register(left_type, right_type, op, handler)
@@ -0,0 +1,133 @@
+"""
+Process-pool parallel conversion for TypeFlow.
+"""
+
+import array
+import itertools
+import logging
+import os
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, List, Optional, Tuple, Type, Union
+
+from .config import get_config
+from .converters import ConversionFunc, ConversionRegistry, _registry
+
+logger = logging.getLogger("typeflow")
+
+# Registry used by the current worker process, set up by _init_worker()
+_worker_registry: Optional[ConversionRegistry] = None
+
+def convert_parallel(values: Iterable[Any], target: str, workers: Optional[int] = None,
+                     chunksize: int = 65536, registry: Optional[ConversionRegistry] = None
+                     ) -> Union[array.array, List[Any]]:
+    """
+    Convert many values on a pool of worker processes.
+    
+    The input is consumed in chunks, so only a few chunks per worker are in
+    memory at a time. Converters registered on the registry are copied to
+    each worker once, when it starts. Custom converters must be importable
+    (module-level functions or classes, not lambdas or closures) to be
+    copied; others are skipped with a warning and the worker's default
+    converters apply instead.
+    
+    Args:
+        values: The values to convert; any iterable
+        target: The target kind, e.g. 'int'
+        workers: Number of worker processes; os.cpu_count() by default
+        chunksize: Number of values sent to a worker per task
+        registry: The registry to replicate; the global registry by default
+    
+    Returns:
+        The converted values in input order, packed like convert_many()
+    """
+    if registry is None:
+        registry = _registry
+    
+    if target not in registry.targets:
+        raise ValueError(f"Unknown target type: {target}")
+    
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+    
+    workers = workers or os.cpu_count() or 1
+    config = get_config()
+    initargs = (_replicable_converters(registry), config.verbose, config.raise_errors)
+    
+    iterator = iter(values)
+    chunks = iter(lambda: list(itertools.islice(iterator, chunksize)), [])
+    results: Union[array.array, List[Any], None] = None
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+        # Keep a bounded number of chunks in flight and collect them in order
+        in_flight = deque()
+        for chunk in chunks:
+            in_flight.append(executor.submit(_convert_chunk, chunk, target))
+            if len(in_flight) >= workers * 2:
+                results = _extend(results, in_flight.popleft().result())
+        
+        while in_flight:
+            results = _extend(results, in_flight.popleft().result())
+    
+    if results is None:
+        return registry.convert_many([], target)
+    return results
+
+def _extend(results: Union[array.array, List[Any], None],
+            chunk: Union[array.array, List[Any]]) -> Union[array.array, List[Any]]:
+    """Append a converted chunk, falling back to a list if the types differ."""
+    if results is None:
+        return chunk
+    if type(results) is not type(chunk):
+        results = list(results)
+    results.extend(chunk)
+    return results
+
+def _replicable_converters(registry: ConversionRegistry) -> List[Tuple[str, Type, ConversionFunc]]:
+    """Get the registry's custom converters that can be sent to worker processes."""
+    defaults = ConversionRegistry()._snapshot.converters
+    entries = []
+    
+    for target, converters in registry._current_snapshot().converters.items():
+        default_table = defaults.get(target, {})
+        for type_, converter in converters.items():
+            if _same_converter(converter, default_table.get(type_)):
+                continue
+            
+            try:
+                pickle.dumps((type_, converter))
+            except Exception:
+                logger.warning(f"Converter for {type_.__name__} to {target} is not importable; "
+                               f"worker processes use their default conversion instead")
+                continue
+            entries.append((target, type_, converter))
+    
+    return entries
+
+def _same_converter(converter: ConversionFunc, default: Optional[ConversionFunc]) -> bool:
+    """Check whether a converter is the default one, which workers register themselves."""
+    if default is None:
+        return False
+    if converter is default:
+        return True
+    
+    # Default lambdas are created per registry but share their code object
+    code = getattr(converter, "__code__", None)
+    return code is not None and code is getattr(default, "__code__", None)
+
+def _init_worker(entries: List[Tuple[str, Type, ConversionFunc]], verbose: bool, raise_errors: bool) -> None:
+    """Set up the registry and configuration of a worker process."""
+    global _worker_registry
+    
+    _worker_registry = ConversionRegistry()
+    for target, type_, converter in entries:
+        _worker_registry.register(target, type_, converter)
+    
+    config = get_config()
+    config.verbose = verbose
+    config.raise_errors = raise_errors
+
+def _convert_chunk(values: List[Any], target: str) -> Union[array.array, List[Any]]:
+    """Convert a chunk of values in a worker process."""
+    return _worker_registry.convert_many(values, target)
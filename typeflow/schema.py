@@ -0,0 +1,289 @@
+"""
+Compiled record schemas for TypeFlow.
+"""
+
+import itertools
+import linecache
+import logging
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from .converters import _MISSING, ConversionRegistry, _registry, _Snapshot
+from .datetimes import DatetimeParser
+
+logger = logging.getLogger("typeflow")
+
+# Source types that get a branch with a pre-resolved converter in compiled
+# code; these are the types found in decoded JSON
+_FAST_SOURCES = (str, int, float, bool, type(None))
+
+# Counter used to give each compiled schema a distinct file name
+_counter = itertools.count()
+
+class CompiledSchema:
+    """
+    A record converter generated from a nested schema.
+    
+    Calling the instance converts a whole record with a single generated
+    function that has the registry's converters bound in as locals. The
+    function is regenerated when converters are registered or a converter
+    scope is entered.
+    
+    Example:
+        convert_order = compile_schema({'id': int, 'tags': [str], 'meta': {'active': bool}})
+        convert_order({'id': '7', 'tags': [1, 2], 'meta': {'active': 'yes'}})
+        # {'id': 7, 'tags': ['1', '2'], 'meta': {'active': True}}
+    """
+    
+    def __init__(self, schema: Any, registry: ConversionRegistry):
+        """
+        Initialize the compiled schema.
+        
+        Args:
+            schema: The schema; see compile_schema()
+            registry: The registry supplying the converters
+        """
+        self.schema = schema
+        self.registry = registry
+        self._compiled: Tuple[Optional[_Snapshot], Optional[Callable[[Any], Any]], str] = (None, None, "")
+        # Functions generated for each live snapshot, so code alternating
+        # between converter scopes doesn't regenerate them
+        self._functions: "weakref.WeakKeyDictionary[_Snapshot, Tuple[Callable[[Any], Any], str]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Tracebacks show the source of the function used last
+        self._filename = f"<typeflow schema {next(_counter)}>"
+        self._select(registry._current_snapshot())
+    
+    def __call__(self, record: Any) -> Any:
+        """
+        Convert a record.
+        
+        Keys missing from the record are left out of the result. Values
+        the bound converters reject go through the registry's regular
+        conversion, including its logging, fallbacks and raise_errors.
+        
+        Args:
+            record: The record to convert, e.g. a decoded JSON object
+        
+        Returns:
+            The converted record
+        """
+        snapshot, func, _ = self._compiled
+        if snapshot is not self.registry._current_snapshot():
+            snapshot, func, _ = self._select(self.registry._current_snapshot())
+        return func(record)
+    
+    @property
+    def source(self) -> str:
+        """The source code of the generated function."""
+        return self._compiled[2]
+    
+    def _select(self, snapshot: _Snapshot) -> Tuple[_Snapshot, Callable[[Any], Any], str]:
+        """Switch to the converter function for a snapshot, generating it if needed."""
+        entry = self._functions.get(snapshot)
+        if entry is None:
+            entry = self._functions[snapshot] = self._compile(snapshot)
+        
+        func, source = entry
+        filename = self._filename
+        linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+        compiled = (snapshot, func, source)
+        self._compiled = compiled
+        return compiled
+    
+    def _compile(self, snapshot: _Snapshot) -> Tuple[Callable[[Any], Any], str]:
+        """Generate the converter function for a snapshot."""
+        generator = _Generator(snapshot, self.registry)
+        source, namespace = generator.generate(self.schema)
+        exec(compile(source, self._filename, "exec"), namespace)
+        logger.debug(f"Compiled schema for registry generation {snapshot.generation}")
+        return namespace["convert_record"], source
+
+class _Generator:
+    """Turns a schema into Python source for a record converter."""
+    
+    def __init__(self, snapshot: _Snapshot, registry: ConversionRegistry):
+        self.snapshot = snapshot
+        self.registry = registry
+        self.bindings: Dict[str, Any] = {}
+        self._bound_ids: Dict[int, str] = {}
+        self._names = itertools.count()
+        self.lines: List[str] = []
+    
+    def generate(self, schema: Any) -> Tuple[str, Dict[str, Any]]:
+        """
+        Generate the source of ``convert_record`` and the values it binds.
+        
+        Returns:
+            A tuple of (source, namespace to exec the source in)
+        """
+        self.emit(2, f"convert = {self.bind(self.registry, 'registry')}.convert")
+        self.node(schema, "record", "result", 2)
+        self.emit(2, "return result")
+        
+        params = ", ".join(f"{name}={name}" for name in self.bindings)
+        header = [
+            "def make():",
+            f"    def convert_record(record, *, {params}):",
+        ]
+        source = "\n".join(header + self.lines + ["    return convert_record", "convert_record = make()", ""])
+        return source, dict(self.bindings)
+    
+    def bind(self, value: Any, hint: str = "c") -> str:
+        """Bind a value into the generated function and return its local name."""
+        name = self._bound_ids.get(id(value))
+        if name is None:
+            name = f"_{hint}{next(self._names)}"
+            self.bindings[name] = value
+            self._bound_ids[id(value)] = name
+        return name
+    
+    def emit(self, indent: int, line: str) -> None:
+        """Add a line of generated code."""
+        self.lines.append("    " * indent + line)
+    
+    def node(self, spec: Any, src: str, dst: str, indent: int) -> None:
+        """Generate code converting the value in ``src`` to ``spec``, storing it in ``dst``."""
+        if isinstance(spec, Mapping):
+            self.mapping(spec, src, dst, indent)
+        elif isinstance(spec, list):
+            if len(spec) != 1:
+                raise ValueError(f"List schemas take exactly one element schema, got {len(spec)}")
+            self.sequence(spec[0], src, dst, indent)
+        else:
+            self.leaf(target_name(spec, self.snapshot.targets), src, dst, indent)
+    
+    def leaf(self, target: str, src: str, dst: str, indent: int) -> None:
+        """Generate code converting a single value to a target kind."""
+        kind = self.snapshot.targets[target]
+        tmp = f"t{next(self._names)}"
+        branch = "if"
+        self.emit(indent, f"{tmp} = type({src})")
+        
+        if isinstance(kind.builtin, type):
+            self.emit(indent, f"if {tmp} is {self.bind(kind.builtin, 'type')}:")
+            self.emit(indent + 1, f"{dst} = {src}")
+            branch = "elif"
+        
+        for source in _FAST_SOURCES:
+            if source is kind.builtin:
+                continue
+            converter = self.snapshot.get(source, target)
+            if converter is _MISSING:
+                continue
+            if isinstance(converter, DatetimeParser):
+                # Detect the format separately for each field
+                converter = converter.fork()
+            
+            self.emit(indent, f"{branch} {tmp} is {self.bind(source, 'type')}:")
+            self.emit(indent + 1, "try:")
+            self.emit(indent + 2, f"{dst} = {self.bind(converter)}({src})")
+            self.emit(indent + 1, "except Exception:")
+            self.emit(indent + 2, f"{dst} = convert({src}, {target!r})")
+            branch = "elif"
+        
+        if branch == "if":
+            self.emit(indent, f"{dst} = convert({src}, {target!r})")
+        else:
+            self.emit(indent, "else:")
+            self.emit(indent + 1, f"{dst} = convert({src}, {target!r})")
+    
+    def mapping(self, spec: Mapping[Any, Any], src: str, dst: str, indent: int) -> None:
+        """Generate code converting a record with known keys."""
+        dict_type = self.bind(dict, "type")
+        self.emit(indent, f"if type({src}) is not {dict_type}:")
+        self.emit(indent + 1, f"{src} = convert({src}, 'dict')")
+        self.emit(indent, f"{dst} = {{}}")
+        
+        for key, child in spec.items():
+            key_expr = repr(key) if type(key) in (str, int) else self.bind(key, "key")
+            value = f"v{next(self._names)}"
+            out = f"o{next(self._names)}"
+            self.emit(indent, "try:")
+            self.emit(indent + 1, f"{value} = {src}[{key_expr}]")
+            self.emit(indent, "except KeyError:")
+            self.emit(indent + 1, "pass")
+            self.emit(indent, "else:")
+            self.node(child, value, out, indent + 1)
+            self.emit(indent + 1, f"{dst}[{key_expr}] = {out}")
+    
+    def sequence(self, spec: Any, src: str, dst: str, indent: int) -> None:
+        """Generate code converting each item of a list."""
+        item = f"x{next(self._names)}"
+        out = f"y{next(self._names)}"
+        append = f"a{next(self._names)}"
+        list_type = self.bind(list, "type")
+        tuple_type = self.bind(tuple, "type")
+        self.emit(indent, f"if type({src}) is not {list_type} and type({src}) is not {tuple_type}:")
+        self.emit(indent + 1, f"{src} = convert({src}, 'list')")
+        self.emit(indent, f"{dst} = []")
+        self.emit(indent, f"{append} = {dst}.append")
+        self.emit(indent, f"for {item} in {src}:")
+        self.node(spec, item, out, indent + 1)
+        self.emit(indent + 1, f"{append}({out})")
+
+# Compiled schemas per registry, keyed by a hashable form of the schema
+_cache: "weakref.WeakKeyDictionary[ConversionRegistry, Dict[Any, CompiledSchema]]" = weakref.WeakKeyDictionary()
+_cache_lock = threading.Lock()
+
+def compile_schema(schema: Any, registry: Optional[ConversionRegistry] = None) -> CompiledSchema:
+    """
+    Compile a nested schema into a fast record converter.
+    
+    Schemas are built from target types or kind names (``int``, ``'float'``,
+    ...), one-element lists for lists of items and dicts for records with
+    known keys. Compiled schemas are cached, so calling compile_schema()
+    again with an equal schema is cheap.
+    
+    Example:
+        convert = compile_schema({'id': int, 'price': float, 'tags': [str], 'meta': {'active': bool}})
+        convert({'id': '1', 'price': '9.99', 'tags': ['a'], 'meta': {'active': 'yes'}})
+    
+    Args:
+        schema: The schema describing the record
+        registry: The registry supplying the converters; the global
+            registry by default
+    
+    Returns:
+        A CompiledSchema that converts records when called
+    """
+    if registry is None:
+        registry = _registry
+    
+    key = _freeze(schema)
+    with _cache_lock:
+        compiled = _cache.setdefault(registry, {}).get(key)
+        if compiled is None:
+            compiled = _cache[registry][key] = CompiledSchema(schema, registry)
+    return compiled
+
+def target_name(spec: Any, targets: Mapping[str, Any]) -> str:
+    """
+    Get the target kind named by a schema leaf.
+    
+    Args:
+        spec: A target kind name such as 'int', or its builtin type such as int
+        targets: The target kinds known to the registry
+    
+    Returns:
+        The target kind name
+    """
+    if isinstance(spec, str):
+        if spec not in targets:
+            raise ValueError(f"Unknown target type: {spec}")
+        return spec
+    
+    for name, kind in targets.items():
+        if kind.builtin is spec:
+            return name
+    raise TypeError(f"Unsupported schema entry: {spec!r}")
+
+def _freeze(schema: Any) -> Any:
+    """Get a hashable key for a schema."""
+    if isinstance(schema, Mapping):
+        return ('dict', tuple((key, _freeze(value)) for key, value in schema.items()))
+    if isinstance(schema, list):
+        return ('list', tuple(_freeze(value) for value in schema))
+    return schema
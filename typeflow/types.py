@@ -3,8 +3,16 @@ Enhanced type implementations for TypeFlow.
 """
 
 import builtins
+import functools
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union, cast
+import time
+from collections import ChainMap
+from collections.abc import MutableMapping, MutableSequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union, cast
+
+from .config import get_config
+from .converters import _registry
+from .operations import _operations
 
 logger = logging.getLogger("typeflow")
 
@@ -16,6 +24,20 @@ _original_list = builtins.list
 _original_dict = builtins.dict
 _original_bool = builtins.bool
 
+# Operators of the original types, used by the handlers so that results
+# don't dispatch back into the Flow types
+_str_add = str.__add__
+_str_mul = str.__mul__
+_int_add = int.__add__
+_int_mul = int.__mul__
+_float_add = float.__add__
+_float_radd = float.__radd__
+_float_rmul = float.__rmul__
+_list_mul = list.__mul__
+_list_imul = list.__imul__
+_list_extend = list.extend
+_dict_update = dict.update
+
 # Type variables for generic methods
 T = TypeVar('T')
 K = TypeVar('K')
@@ -24,494 +46,184 @@ V = TypeVar('V')
 class FlowStr(str):
     """Enhanced string class that handles operations with different types."""
     
-    def __add__(self, other: Any) -> 'FlowStr':
+    __slots__ = ()
+    
+    def __add__(self, other: Any) -> Any:
         """Handle string concatenation with any type."""
-        from .config import get_config
-        from .converters import get_converter
-        
-        config = get_config()
-        
-        if isinstance(other, str):
-            return FlowStr(super().__add__(other))
-        
-        try:
-            # Convert other to string
-            other_str = get_converter('str').to_str(other)
-            
-            if config.verbose and not isinstance(other, str):
-                logger.info(f"Converting {type(other).__name__} to string for concatenation: {other!r} -> {other_str!r}")
-            
-            return FlowStr(super().__add__(other_str))
-        except Exception as e:
-            if config.raise_errors:
-                raise TypeError(f"Cannot concatenate {type(other).__name__} with string: {e}") from e
-            
-            # Fallback to string representation
-            return FlowStr(super().__add__(str(other)))
+        key = (type(self), type(other), '+')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(self, other)
     
-    def __radd__(self, other: Any) -> 'FlowStr':
+    def __radd__(self, other: Any) -> Any:
         """Handle string concatenation with any type (right side)."""
-        from .config import get_config
-        from .converters import get_converter
-        
-        config = get_config()
-        
-        try:
-            # Convert other to string
-            other_str = get_converter('str').to_str(other)
-            
-            if config.verbose and not isinstance(other, str):
-                logger.info(f"Converting {type(other).__name__} to string for concatenation: {other!r} -> {other_str!r}")
-            
-            return FlowStr(other_str + self)
-        except Exception as e:
-            if config.raise_errors:
-                raise TypeError(f"Cannot concatenate string with {type(other).__name__}: {e}") from e
-            
-            # Fallback to string representation
-            return FlowStr(str(other) + self)
+        key = (type(other), type(self), '+')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(other, self)
     
-    def __mul__(self, other: Any) -> 'FlowStr':
+    def __mul__(self, other: Any) -> Any:
         """Handle string multiplication with any type."""
-        from .config import get_config
-        from .converters import get_converter
-        
-        config = get_config()
-        
-        if isinstance(other, int):
-            return FlowStr(super().__mul__(other))
-        
-        try:
-            # Convert other to integer
-            other_int = get_converter('int').to_int(other)
-            
-            if config.verbose and not isinstance(other, int):
-                logger.info(f"Converting {type(other).__name__} to integer for string multiplication: {other!r} -> {other_int!r}")
-            
-            return FlowStr(super().__mul__(other_int))
-        except Exception as e:
-            if config.raise_errors:
-                raise TypeError(f"Cannot multiply string with {type(other).__name__}: {e}") from e
-            
-            # Fallback to 1
-            return FlowStr(self)
+        key = (type(self), type(other), '*')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(self, other)
     
-    def __rmul__(self, other: Any) -> 'FlowStr':
+    def __rmul__(self, other: Any) -> Any:
         """Handle string multiplication with any type (right side)."""
-        return self.__mul__(other)
+        key = (type(other), type(self), '*')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(other, self)
 
 class FlowInt(int):
     """Enhanced integer class that handles operations with different types."""
     
-    def __add__(self, other: Any) -> Union['FlowInt', FlowStr, 'FlowFloat']:
+    __slots__ = ()
+    
+    def __add__(self, other: Any) -> Any:
         """Handle integer addition with any type."""
-        from .config import get_config
-        from .converters import get_converter
-        
-        config = get_config()
-        
-        if isinstance(other, (int, float)):
-            return super().__add__(other)
-        elif isinstance(other, str):
-            # When adding int to str, convert int to str
-            int_str = get_converter('str').to_str(self)
-            
-            if config.verbose:
-                logger.info(f"Converting {type(self).__name__} to string for concatenation with string: {self!r} -> {int_str!r}")
-            
-            return FlowStr(int_str + other)
-        
-        try:
-            # Try to convert other to int
-            other_int = get_converter('int').to_int(other)
-            
-            if config.verbose and not isinstance(other, (int, float, str)):
-                logger.info(f"Converting {type(other).__name__} to integer for addition: {other!r} -> {other_int!r}")
-            
-            return FlowInt(super().__add__(other_int))
-        except Exception as e:
-            # If conversion to int fails, try converting self to the other's type
-            if isinstance(other, float):
-                return FlowFloat(float(self) + other)
-            
-            # As a last resort, convert to string
-            if config.verbose:
-                logger.warning(f"Failed to convert {type(other).__name__} to integer, using string concatenation")
-            
-            int_str = get_converter('str').to_str(self)
-            other_str = get_converter('str').to_str(other)
-            
-            if config.raise_errors:
-                raise TypeError(f"Cannot add integer with {type(other).__name__}: {e}") from e
-            
-            return FlowStr(int_str + other_str)
+        key = (type(self), type(other), '+')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(self, other)
     
-    def __radd__(self, other: Any) -> Union['FlowInt', FlowStr, 'FlowFloat']:
+    def __radd__(self, other: Any) -> Any:
         """Handle integer addition with any type (right side)."""
-        from .config import get_config
-        from .converters import get_converter
-        
-        config = get_config()
-        
-        if isinstance(other, (int, float)):
-            return FlowInt(other + self)
-        elif isinstance(other, str):
-            # When adding str to int, convert int to str
-            int_str = get_converter('str').to_str(self)
-            
-            if config.verbose:
-                logger.info(f"Converting {type(self).__name__} to string for concatenation with string: {self!r} -> {int_str!r}")
-            
-            return FlowStr(other + int_str)
-        
-        try:
-            # Try to convert other to int
-            other_int = get_converter('int').to_int(other)
-            
-            if config.verbose and not isinstance(other, (int, float, str)):
-                logger.info(f"Converting {type(other).__name__} to integer for addition: {other!r} -> {other_int!r}")
-            
-            return FlowInt(other_int + self)
-        except Exception as e:
-            # If conversion to int fails, try converting self to the other's type
-            if isinstance(other, float):
-                return FlowFloat(other + float(self))
-            
-            # As a last resort, convert to string
-            if config.verbose:
-                logger.warning(f"Failed to convert {type(other).__name__} to integer, using string concatenation")
-            
-            int_str = get_converter('str').to_str(self)
-            other_str = get_converter('str').to_str(other)
-            
-            if config.raise_errors:
-                raise TypeError(f"Cannot add {type(other).__name__} with integer: {e}") from e
-            
-            return FlowStr(other_str + int_str)
+        key = (type(other), type(self), '+')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(other, self)
     
-    def __mul__(self, other: Any) -> Union['FlowInt', FlowStr, 'FlowFloat', List[Any]]:
+    def __mul__(self, other: Any) -> Any:
         """Handle integer multiplication with any type."""
-        from .config import get_config
-        from .converters import get_converter
-        
-        config = get_config()
-        
-        if isinstance(other, (int, float)):
-            return super().__mul__(other)
-        elif isinstance(other, str):
-            # When multiplying int with str, use string repetition
-            return FlowStr(other * self)
-        elif isinstance(other, list):
-            # When multiplying int with list, repeat the list
-            return other * self
-        
-        try:
-            # Try to convert other to int
-            other_int = get_converter('int').to_int(other)
-            
-            if config.verbose and not isinstance(other, (int, float, str, list)):
-                logger.info(f"Converting {type(other).__name__} to integer for multiplication: {other!r} -> {other_int!r}")
-            
-            return FlowInt(super().__mul__(other_int))
-        except Exception as e:
-            # If conversion to int fails, try converting self to the other's type
-            if isinstance(other, float):
-                return FlowFloat(float(self) * other)
-            
-            if config.verbose:
-                logger.warning(f"Failed to convert {type(other).__name__} to integer for multiplication")
-            
-            if config.raise_errors:
-                raise TypeError(f"Cannot multiply integer with {type(other).__name__}: {e}") from e
-            
-            # Default behavior: convert other to int or return self
-            return FlowInt(self)
+        key = (type(self), type(other), '*')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(self, other)
 
 class FlowFloat(float):
     """Enhanced float class that handles operations with different types."""
     
-    def __add__(self, other: Any) -> Union['FlowFloat', FlowStr]:
+    __slots__ = ()
+    
+    def __add__(self, other: Any) -> Any:
         """Handle float addition with any type."""
-        from .config import get_config
-        from .converters import get_converter
-        
-        config = get_config()
-        
-        if isinstance(other, (int, float)):
-            return super().__add__(other)
-        elif isinstance(other, str):
-            # When adding float to str, convert float to str
-            float_str = get_converter('str').to_str(self)
-            
-            if config.verbose:
-                logger.info(f"Converting {type(self).__name__} to string for concatenation with string: {self!r} -> {float_str!r}")
-            
-            return FlowStr(float_str + other)
-        
-        try:
-            # Try to convert other to float
-            other_float = get_converter('float').to_float(other)
-            
-            if config.verbose and not isinstance(other, (int, float, str)):
-                logger.info(f"Converting {type(other).__name__} to float for addition: {other!r} -> {other_float!r}")
-            
-            return FlowFloat(super().__add__(other_float))
-        except Exception as e:
-            # As a last resort, convert to string
-            if config.verbose:
-                logger.warning(f"Failed to convert {type(other).__name__} to float, using string concatenation")
-            
-            float_str = get_converter('str').to_str(self)
-            other_str = get_converter('str').to_str(other)
-            
-            if config.raise_errors:
-                raise TypeError(f"Cannot add float with {type(other).__name__}: {e}") from e
-            
-            return FlowStr(float_str + other_str)
+        key = (type(self), type(other), '+')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(self, other)
     
-    def __radd__(self, other: Any) -> Union['FlowFloat', FlowStr]:
+    def __radd__(self, other: Any) -> Any:
         """Handle float addition with any type (right side)."""
-        from .config import get_config
-        from .converters import get_converter
-        
-        config = get_config()
-        
-        if isinstance(other, (int, float)):
-            return FlowFloat(other + self)
-        elif isinstance(other, str):
-            # When adding str to float, convert float to str
-            float_str = get_converter('str').to_str(self)
-            
-            if config.verbose:
-                logger.info(f"Converting {type(self).__name__} to string for concatenation with string: {self!r} -> {float_str!r}")
-            
-            return FlowStr(other + float_str)
-        
-        try:
-            # Try to convert other to float
-            other_float = get_converter('float').to_float(other)
-            
-            if config.verbose and not isinstance(other, (int, float, str)):
-                logger.info(f"Converting {type(other).__name__} to float for addition: {other!r} -> {other_float!r}")
-            
-            return FlowFloat(other_float + self)
-        except Exception as e:
-            # As a last resort, convert to string
-            if config.verbose:
-                logger.warning(f"Failed to convert {type(other).__name__} to float, using string concatenation")
-            
-            float_str = get_converter('str').to_str(self)
-            other_str = get_converter('str').to_str(other)
-            
-            if config.raise_errors:
-                raise TypeError(f"Cannot add {type(other).__name__} with float: {e}") from e
-            
-            return FlowStr(other_str + float_str)
+        key = (type(other), type(self), '+')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(other, self)
 
 class FlowList(list):
     """Enhanced list class that handles operations with different types."""
     
-    def __add__(self, other: Any) -> Union['FlowList', FlowStr]:
+    __slots__ = ()
+    
+    def __add__(self, other: Any) -> Any:
         """Handle list concatenation with any type."""
-        from .config import get_config
-        from .converters import get_converter
-        
-        config = get_config()
-        
-        if isinstance(other, list):
-            return FlowList(super().__add__(other))
-        elif isinstance(other, str):
-            # When adding list to str, convert list to str
-            list_str = get_converter('str').to_str(self)
-            
-            if config.verbose:
-                logger.info(f"Converting {type(self).__name__} to string for concatenation with string: {self!r} -> {list_str!r}")
-            
-            return FlowStr(list_str + other)
-        
-        try:
-            # Try to convert other to list
-            other_list = get_converter('list').to_list(other)
-            
-            if config.verbose and not isinstance(other, (list, str)):
-                logger.info(f"Converting {type(other).__name__} to list for concatenation: {other!r} -> {other_list!r}")
-            
-            return FlowList(super().__add__(other_list))
-        except Exception as e:
-            # As a last resort, convert to string
-            if config.verbose:
-                logger.warning(f"Failed to convert {type(other).__name__} to list, using string concatenation")
-            
-            list_str = get_converter('str').to_str(self)
-            other_str = get_converter('str').to_str(other)
-            
-            if config.raise_errors:
-                raise TypeError(f"Cannot concatenate list with {type(other).__name__}: {e}") from e
-            
-            return FlowStr(list_str + other_str)
+        key = (type(self), type(other), '+')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(self, other)
     
-    def __radd__(self, other: Any) -> Union['FlowList', FlowStr]:
+    def __radd__(self, other: Any) -> Any:
         """Handle list concatenation with any type (right side)."""
-        from .config import get_config
-        from .converters import get_converter
-        
-        config = get_config()
-        
-        if isinstance(other, list):
-            return FlowList(other + self)
-        elif isinstance(other, str):
-            # When adding str to list, convert list to str
-            list_str = get_converter('str').to_str(self)
-            
-            if config.verbose:
-                logger.info(f"Converting {type(self).__name__} to string for concatenation with string: {self!r} -> {list_str!r}")
-            
-            return FlowStr(other + list_str)
-        
-        try:
-            # Try to convert other to list
-            other_list = get_converter('list').to_list(other)
-            
-            if config.verbose and not isinstance(other, (list, str)):
-                logger.info(f"Converting {type(other).__name__} to list for concatenation: {other!r} -> {other_list!r}")
-            
-            return FlowList(other_list + self)
-        except Exception as e:
-            # As a last resort, convert to string
-            if config.verbose:
-                logger.warning(f"Failed to convert {type(other).__name__} to list, using string concatenation")
-            
-            list_str = get_converter('str').to_str(self)
-            other_str = get_converter('str').to_str(other)
-            
-            if config.raise_errors:
-                raise TypeError(f"Cannot concatenate {type(other).__name__} with list: {e}") from e
-            
-            return FlowStr(other_str + list_str)
+        key = (type(other), type(self), '+')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(other, self)
     
-    def __mul__(self, other: Any) -> 'FlowList':
+    def __mul__(self, other: Any) -> Any:
         """Handle list multiplication with any type."""
-        from .config import get_config
-        from .converters import get_converter
-        
-        config = get_config()
-        
-        if isinstance(other, int):
-            return FlowList(super().__mul__(other))
-        
-        try:
-            # Try to convert other to int
-            other_int = get_converter('int').to_int(other)
-            
-            if config.verbose and not isinstance(other, int):
-                logger.info(f"Converting {type(other).__name__} to integer for list multiplication: {other!r} -> {other_int!r}")
-            
-            return FlowList(super().__mul__(other_int))
-        except Exception as e:
-            if config.verbose:
-                logger.warning(f"Failed to convert {type(other).__name__} to integer for list multiplication")
-            
-            if config.raise_errors:
-                raise TypeError(f"Cannot multiply list with {type(other).__name__}: {e}") from e
-            
-            # Default behavior: return empty list
-            return FlowList([])
+        key = (type(self), type(other), '*')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(self, other)
+    
+    def __iadd__(self, other: Any) -> Any:
+        """Extend the list in place with any type."""
+        key = (type(self), type(other), '+=')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(self, other)
+    
+    def __imul__(self, other: Any) -> Any:
+        """Repeat the list in place by any type."""
+        key = (type(self), type(other), '*=')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(self, other)
 
 class FlowDict(dict):
     """Enhanced dictionary class that handles operations with different types."""
     
-    def __add__(self, other: Any) -> Union['FlowDict', FlowStr]:
+    __slots__ = ()
+    
+    def __add__(self, other: Any) -> Any:
         """Handle dictionary addition with any type."""
-        from .config import get_config
-        from .converters import get_converter
-        
-        config = get_config()
-        
-        if isinstance(other, dict):
-            # When adding dict to dict, merge them
-            result = FlowDict(self)
-            result.update(other)
-            return result
-        elif isinstance(other, str):
-            # When adding dict to str, convert dict to str
-            dict_str = get_converter('str').to_str(self)
-            
-            if config.verbose:
-                logger.info(f"Converting {type(self).__name__} to string for concatenation with string: {self!r} -> {dict_str!r}")
-            
-            return FlowStr(dict_str + other)
-        
-        try:
-            # Try to convert other to dict
-            other_dict = get_converter('dict').to_dict(other)
-            
-            if config.verbose and not isinstance(other, (dict, str)):
-                logger.info(f"Converting {type(other).__name__} to dict for merging: {other!r} -> {other_dict!r}")
-            
-            result = FlowDict(self)
-            result.update(other_dict)
-            return result
-        except Exception as e:
-            # As a last resort, convert to string
-            if config.verbose:
-                logger.warning(f"Failed to convert {type(other).__name__} to dict, using string concatenation")
-            
-            dict_str = get_converter('str').to_str(self)
-            other_str = get_converter('str').to_str(other)
-            
-            if config.raise_errors:
-                raise TypeError(f"Cannot add dictionary with {type(other).__name__}: {e}") from e
-            
-            return FlowStr(dict_str + other_str)
+        key = (type(self), type(other), '+')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(self, other)
     
-    def __radd__(self, other: Any) -> Union['FlowDict', FlowStr]:
+    def __radd__(self, other: Any) -> Any:
         """Handle dictionary addition with any type (right side)."""
-        from .config import get_config
-        from .converters import get_converter
-        
-        config = get_config()
-        
-        if isinstance(other, dict):
-            # When adding dict to dict, merge them (other takes precedence)
-            result = FlowDict(other)
-            result.update(self)
-            return result
-        elif isinstance(other, str):
-            # When adding str to dict, convert dict to str
-            dict_str = get_converter('str').to_str(self)
-            
-            if config.verbose:
-                logger.info(f"Converting {type(self).__name__} to string for concatenation with string: {self!r} -> {dict_str!r}")
-            
-            return FlowStr(other + dict_str)
-        
-        try:
-            # Try to convert other to dict
-            other_dict = get_converter('dict').to_dict(other)
-            
-            if config.verbose and not isinstance(other, (dict, str)):
-                logger.info(f"Converting {type(other).__name__} to dict for merging: {other!r} -> {other_dict!r}")
-            
-            result = FlowDict(other_dict)
-            result.update(self)
-            return result
-        except Exception as e:
-            # As a last resort, convert to string
-            if config.verbose:
-                logger.warning(f"Failed to convert {type(other).__name__} to dict, using string concatenation")
-            
-            dict_str = get_converter('str').to_str(self)
-            other_str = get_converter('str').to_str(other)
-            
-            if config.raise_errors:
-                raise TypeError(f"Cannot add {type(other).__name__} with dictionary: {e}") from e
-            
-            return FlowStr(other_str + dict_str)
+        key = (type(other), type(self), '+')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(other, self)
+    
+    def __iadd__(self, other: Any) -> Any:
+        """Merge any type into the dictionary in place."""
+        key = (type(self), type(other), '+=')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(self, other)
+    
+    def __ior__(self, other: Any) -> Any:
+        """Merge any type into the dictionary in place."""
+        key = (type(self), type(other), '|=')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(self, other)
 
 class FlowBool(int):
-    """Enhanced boolean class that handles operations with different types."""
+    """
+    Enhanced boolean class that handles operations with different types.
+    
+    Like bool, there are only two instances, FlowBool(True) and FlowBool(False).
+    """
+    
+    __slots__ = ()
     
     def __new__(cls, value=False):
+        if cls is FlowBool:
+            return _flow_true if value else _flow_false
         return super().__new__(cls, 1 if value else 0)
     
     def __repr__(self):
@@ -520,122 +232,884 @@ class FlowBool(int):
     def __str__(self):
         return 'True' if self else 'False'
     
-    def __add__(self, other: Any) -> Union['FlowInt', 'FlowFloat', FlowStr]:
+    def __add__(self, other: Any) -> Any:
         """Handle boolean addition with any type."""
-        from .config import get_config
-        from .converters import get_converter
+        key = (type(self), type(other), '+')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(self, other)
+    
+    def __radd__(self, other: Any) -> Any:
+        """Handle boolean addition with any type (right side)."""
+        key = (type(other), type(self), '+')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(other, self)
+
+_flow_false = int.__new__(FlowBool, 0)
+_flow_true = int.__new__(FlowBool, 1)
+
+class FlowRope:
+    """
+    String builder that concatenates lazily.
+    
+    Adding to a rope converts the other operand to a string once (through
+    the registry like FlowStr does) and appends it to a list of chunks
+    instead of copying the text so far, so building a large string with
+    ``text = text + value`` in a loop takes linear time. The chunks are
+    joined into a FlowStr the first time the rope is used as a string: by
+    str(), comparison, hashing, indexing, iteration, ``in`` or any str
+    method. A rope isn't a str instance, so APIs that require one, such as
+    ``str.join()`` or ``json.dumps()``, need ``str(rope)``.
+    
+    Ropes are persistent: adding to a rope never changes it. The newest
+    rope built from a chunk list appends to that list in place; adding to
+    an older one copies its chunks first. Don't extend the same rope from
+    several threads at once.
+    
+    Example:
+        report = FlowRope("Orders\n")
+        for order in orders:
+            report = report + order.id + ": " + order.total + "\n"
+        write(str(report))
+    """
+    
+    __slots__ = ('_chunks', '_count', '_length', '_value')
+    
+    def __init__(self, *parts: Any):
+        """
+        Initialize the rope.
         
-        config = get_config()
+        Args:
+            *parts: Initial values, converted to strings and concatenated
+        """
+        self._chunks: List[str] = [_rope_text(part) for part in parts]
+        # Number of chunks that belong to this rope; newer ropes sharing the
+        # list may have appended more
+        self._count = len(self._chunks)
+        self._length = sum(map(len, self._chunks))
+        self._value: Optional[FlowStr] = None
+    
+    def __add__(self, other: Any) -> "FlowRope":
+        """Append any value, converted to a string."""
+        text = _rope_text(other)
+        chunks = self._chunks
+        if len(chunks) != self._count:
+            # A newer rope already appended to the list
+            chunks = chunks[:self._count]
+        chunks.append(text)
         
-        if isinstance(other, (int, float)):
-            # When adding bool to number, convert bool to int
-            return FlowInt(int(self) + other) if isinstance(other, int) else FlowFloat(int(self) + other)
-        elif isinstance(other, str):
-            # When adding bool to str, convert bool to str
-            bool_str = 'True' if self else 'False'
-            
-            if config.verbose:
-                logger.info(f"Converting {type(self).__name__} to string for concatenation with string: {self!r} -> {bool_str!r}")
-            
-            return FlowStr(bool_str + other)
+        rope = FlowRope.__new__(FlowRope)
+        rope._chunks = chunks
+        rope._count = len(chunks)
+        rope._length = self._length + len(text)
+        rope._value = None
+        return rope
+    
+    def __radd__(self, other: Any) -> "FlowRope":
+        """Prepend any value, converted to a string."""
+        rope = FlowRope(other)
+        rope._chunks.extend(self._chunks[:self._count])
+        rope._count = len(rope._chunks)
+        rope._length += self._length
+        return rope
+    
+    def materialize(self) -> FlowStr:
+        """Join the chunks into a FlowStr, once."""
+        value = self._value
+        if value is None:
+            chunks = self._chunks
+            value = self._value = FlowStr(''.join(chunks if len(chunks) == self._count else chunks[:self._count]))
+        return value
+    
+    def __str__(self) -> str:
+        return self.materialize()
+    
+    def __repr__(self) -> str:
+        return f"FlowRope({self.materialize()!r})"
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __eq__(self, other: Any) -> bool:
+        return self.materialize() == _rope_operand(other)
+    
+    def __lt__(self, other: Any) -> bool:
+        return self.materialize() < _rope_operand(other)
+    
+    def __le__(self, other: Any) -> bool:
+        return self.materialize() <= _rope_operand(other)
+    
+    def __gt__(self, other: Any) -> bool:
+        return self.materialize() > _rope_operand(other)
+    
+    def __ge__(self, other: Any) -> bool:
+        return self.materialize() >= _rope_operand(other)
+    
+    def __hash__(self) -> int:
+        return hash(self.materialize())
+    
+    def __getitem__(self, index: Any) -> FlowStr:
+        return FlowStr(self.materialize()[index])
+    
+    def __contains__(self, item: Any) -> bool:
+        return _rope_operand(item) in self.materialize()
+    
+    def __iter__(self):
+        return iter(self.materialize())
+    
+    def __format__(self, format_spec: str) -> str:
+        return format(self.materialize(), format_spec)
+    
+    def __reduce__(self):
+        return (FlowRope, (_original_str(self.materialize()),))
+    
+    def __getattr__(self, name: str) -> Any:
+        # Private and special names are looked up by copy, pickle and the
+        # like, possibly before the slots are set; don't join for them
+        if name.startswith('_'):
+            raise AttributeError(name)
+        # Any other str method works on the joined string
+        return getattr(self.materialize(), name)
+
+def _rope_operand(value: Any) -> Any:
+    """Get the joined string of a rope compared with another one."""
+    return value.materialize() if isinstance(value, FlowRope) else value
+
+def _rope_text(value: Any) -> str:
+    """Convert a value added to a rope to a string."""
+    if isinstance(value, _original_str):
+        return value
+    if isinstance(value, FlowRope):
+        return value.materialize()
+    return _registry.to_str(value)
+
+class FlowListView(MutableSequence):
+    """
+    Flow list operators over an existing list, without copying it.
+    
+    Reads and writes go to the wrapped list, and the operators work like
+    FlowList's (they dispatch on FlowList in the operation table). In-place
+    operators such as ``+=`` modify the wrapped list. Call detach() for an
+    independent FlowList copy.
+    
+    Example:
+        rows = flow(huge_list, view=True)
+        rows += ["footer"]  # appended to huge_list
+    """
+    
+    __slots__ = ('_data',)
+    
+    def __init__(self, data: List[Any]):
+        self._data = data
+    
+    def detach(self) -> FlowList:
+        """Copy the wrapped list into a FlowList."""
+        return FlowList(self._data)
+    
+    def __getitem__(self, index: Any) -> Any:
+        return self._data[index]
+    
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self._data[index] = value
+    
+    def __delitem__(self, index: Any) -> None:
+        del self._data[index]
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __iter__(self):
+        return iter(self._data)
+    
+    def __contains__(self, value: Any) -> bool:
+        return value in self._data
+    
+    def insert(self, index: int, value: Any) -> None:
+        self._data.insert(index, value)
+    
+    # The MutableSequence mixins work element by element; the list's own
+    # methods are much faster
+    def __reversed__(self):
+        return reversed(self._data)
+    
+    def append(self, value: Any) -> None:
+        self._data.append(value)
+    
+    def extend(self, values: Iterable[Any]) -> None:
+        self._data.extend(values)
+    
+    def pop(self, index: int = -1) -> Any:
+        return self._data.pop(index)
+    
+    def remove(self, value: Any) -> None:
+        self._data.remove(value)
+    
+    def clear(self) -> None:
+        self._data.clear()
+    
+    def reverse(self) -> None:
+        self._data.reverse()
+    
+    def index(self, value: Any, *args: Any) -> int:
+        return self._data.index(value, *args)
+    
+    def count(self, value: Any) -> int:
+        return self._data.count(value)
+    
+    def __eq__(self, other: Any) -> bool:
+        return self._data == (other._data if isinstance(other, FlowListView) else other)
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"FlowListView({self._data!r})"
+    
+    def __getattr__(self, name: str) -> Any:
+        # Other list methods, e.g. sort(), work on the wrapped list
+        return getattr(self._data, name)
+    
+    def __add__(self, other: Any) -> Any:
+        """Handle list concatenation with any type."""
+        return _view_operation(self, FlowList, other, '+')
+    
+    def __radd__(self, other: Any) -> Any:
+        """Handle list concatenation with any type (right side)."""
+        return _view_operation(self, FlowList, other, '+', reflected=True)
+    
+    def __mul__(self, other: Any) -> Any:
+        """Handle list multiplication with any type."""
+        return _view_operation(self, FlowList, other, '*')
+    
+    def __iadd__(self, other: Any) -> Any:
+        """Extend the wrapped list in place with any type."""
+        return _view_operation(self, FlowList, other, '+=')
+    
+    def __imul__(self, other: Any) -> Any:
+        """Repeat the wrapped list in place by any type."""
+        return _view_operation(self, FlowList, other, '*=')
+
+class FlowDictView(MutableMapping):
+    """
+    Flow dict operators over an existing dict, without copying it.
+    
+    Reads and writes go to the wrapped dict, and the operators work like
+    FlowDict's. In-place operators such as ``|=`` merge into the wrapped
+    dict. Call detach() for an independent FlowDict copy.
+    """
+    
+    __slots__ = ('_data',)
+    
+    def __init__(self, data: Dict[Any, Any]):
+        self._data = data
+    
+    def detach(self) -> FlowDict:
+        """Copy the wrapped dict into a FlowDict."""
+        return FlowDict(self._data)
+    
+    def __getitem__(self, key: Any) -> Any:
+        return self._data[key]
+    
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._data[key] = value
+    
+    def __delitem__(self, key: Any) -> None:
+        del self._data[key]
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __iter__(self):
+        return iter(self._data)
+    
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+    
+    # Like FlowListView, skip the per-item MutableMapping mixins
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._data.get(key, default)
+    
+    def keys(self):
+        return self._data.keys()
+    
+    def values(self):
+        return self._data.values()
+    
+    def items(self):
+        return self._data.items()
+    
+    def pop(self, key: Any, *default: Any) -> Any:
+        return self._data.pop(key, *default)
+    
+    def popitem(self) -> Tuple[Any, Any]:
+        return self._data.popitem()
+    
+    def clear(self) -> None:
+        self._data.clear()
+    
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._data.update(*args, **kwargs)
+    
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        return self._data.setdefault(key, default)
+    
+    def __eq__(self, other: Any) -> bool:
+        return self._data == (other._data if isinstance(other, FlowDictView) else other)
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"FlowDictView({self._data!r})"
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._data, name)
+    
+    def __add__(self, other: Any) -> Any:
+        """Handle dictionary addition with any type."""
+        return _view_operation(self, FlowDict, other, '+')
+    
+    def __radd__(self, other: Any) -> Any:
+        """Handle dictionary addition with any type (right side)."""
+        return _view_operation(self, FlowDict, other, '+', reflected=True)
+    
+    def __iadd__(self, other: Any) -> Any:
+        """Merge any type into the wrapped dictionary in place."""
+        return _view_operation(self, FlowDict, other, '+=')
+    
+    def __ior__(self, other: Any) -> Any:
+        """Merge any type into the wrapped dictionary in place."""
+        return _view_operation(self, FlowDict, other, '|=')
+
+class LayeredFlowDict(ChainMap):
+    """
+    Result of merging dicts with ``layered_merges`` configured.
+    
+    Instead of copying, ``a + b`` keeps both dicts as layers, looking keys
+    up in the later layers first, so merging costs the same for dicts of
+    any size. ``maps[0]`` holds the keys set on the merged dict since the
+    last merge; the merged dicts and earlier writes follow, latest first. Once there are more than
+    ``merge_depth`` layers they are flattened into one, which keeps lookups
+    bounded.
+    
+    The layers are the merged dicts themselves: changing one after the
+    merge shows through. Use flatten() for an independent FlowDict.
+    """
+    
+    def flatten(self) -> FlowDict:
+        """Copy the merged contents into a FlowDict."""
+        result = FlowDict()
+        for layer in reversed(self.maps):
+            _dict_update(result, layer)
+        return result
+    
+    def _collapse(self) -> None:
+        """Replace the layers with a single writable dict."""
+        self.maps = [dict(self.flatten())]
+    
+    def _merged_has(self, key: Any) -> bool:
+        """Check whether a merged dict below ``maps[0]`` holds the key."""
+        return any(key in layer for layer in self.maps[1:])
+    
+    def __delitem__(self, key: Any) -> None:
+        if self._merged_has(key):
+            # Deleting only the own write would bring the merged value back,
+            # and the merged dicts must not be changed
+            self._collapse()
+        del self.maps[0][key]
+    
+    def pop(self, key: Any, *default: Any) -> Any:
+        if self._merged_has(key):
+            self._collapse()
+        return self.maps[0].pop(key, *default)
+    
+    def popitem(self) -> Tuple[Any, Any]:
+        self._collapse()
+        return self.maps[0].popitem()
+    
+    def clear(self) -> None:
+        self.maps = [{}]
+    
+    def __add__(self, other: Any) -> Any:
+        """Handle dictionary addition with any type."""
+        key = (FlowDict, type(other), '+')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(self, other)
+    
+    def __radd__(self, other: Any) -> Any:
+        """Handle dictionary addition with any type (right side)."""
+        key = (type(other), FlowDict, '+')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(other, self)
+    
+    def __iadd__(self, other: Any) -> Any:
+        """Merge any type into the dictionary in place."""
+        key = (FlowDict, type(other), '+=')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(self, other)
+    
+    def __ior__(self, other: Any) -> Any:
+        """Merge any type into the dictionary in place."""
+        key = (FlowDict, type(other), '|=')
+        handler = _operations.handlers.get(key)
+        if handler is None:
+            handler = _operations.resolve(*key)
+        return handler(self, other)
+
+def _layers(value: Any) -> List[Any]:
+    """Get the layers a merge operand contributes, latest first."""
+    if not isinstance(value, LayeredFlowDict):
+        return [value]
+    writes, *layers = value.maps
+    # Keys set later on the operand must not show through, so copy them
+    return [dict(writes)] + layers if writes else layers
+
+def _layered(layers: List[Any], depth: int) -> LayeredFlowDict:
+    """Make a layered dict, flattening the layers if there are too many."""
+    result = LayeredFlowDict({}, *layers)
+    if len(layers) > depth:
+        result._collapse()
+    return result
+
+def _view_operation(view: Union[FlowListView, FlowDictView], flow_type: Type, other: Any, op: str,
+                    reflected: bool = False) -> Any:
+    """Apply the operation of ``flow_type`` to the container wrapped by a view."""
+    data = view._data
+    key = (type(other), flow_type, op) if reflected else (flow_type, type(other), op)
+    handler = _operations.handlers.get(key)
+    if handler is None:
+        handler = _operations.resolve(*key)
+    
+    result = handler(other, data) if reflected else handler(data, other)
+    # In-place handlers return the container they modified
+    return view if result is data else result
+
+class DeepFlowList(FlowList):
+    """
+    FlowList that wraps its elements in Flow types when they are read.
+    
+    Elements are wrapped on first access by index or iteration, nested
+    lists and dicts becoming DeepFlowList and DeepFlowDict, and the wrapped
+    value replaces the plain one so it is wrapped only once. Parts of a
+    large payload that are never read are never wrapped.
+    """
+    
+    __slots__ = ()
+    
+    def __getitem__(self, index: Any) -> Any:
+        value = list.__getitem__(self, index)
+        if isinstance(index, slice):
+            return DeepFlowList(value)
         
+        wrapped = _deep(value)
+        if wrapped is not value:
+            list.__setitem__(self, index, wrapped)
+        return wrapped
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+class DeepFlowDict(FlowDict):
+    """
+    FlowDict that wraps its values in Flow types when they are read.
+    
+    Values are wrapped on first access through ``[]``, get(), values() or
+    items(), like DeepFlowList's elements.
+    """
+    
+    __slots__ = ()
+    
+    def __getitem__(self, key: Any) -> Any:
+        value = dict.__getitem__(self, key)
+        wrapped = _deep(value)
+        if wrapped is not value:
+            dict.__setitem__(self, key, wrapped)
+        return wrapped
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+    
+    def values(self):
+        self._wrap_all()
+        return dict.values(self)
+    
+    def items(self):
+        self._wrap_all()
+        return dict.items(self)
+    
+    def _wrap_all(self) -> None:
+        """Wrap every value, as values() and items() hand them all out."""
+        for key, value in dict.items(self):
+            wrapped = _deep(value)
+            if wrapped is not value:
+                # Replacing the value of an existing key is safe while iterating
+                dict.__setitem__(self, key, wrapped)
+
+def _deep(value: Any) -> Any:
+    """Wrap a value read from a deep container; other values are returned as they are."""
+    wrap = _deep_wrappers.get(type(value))
+    return value if wrap is None else wrap(value)
+
+def _operand(value: Any, target: str, purpose: str) -> Any:
+    """Convert an operand strictly, raising instead of substituting a default."""
+    converter = _registry.resolve(type(value), target)
+    metrics = _registry._metrics
+    if metrics is None:
+        result = converter(value)
+    else:
+        start = time.perf_counter()
+        result = converter(value)
+        metrics.record_conversion(type(value).__name__, target, time.perf_counter() - start)
+    
+    if get_config().verbose:
+        label = _registry.targets[target].label
+        logger.info(f"Converting {type(value).__name__} to {label} for {purpose}: {value!r} -> {result!r}")
+    
+    return result
+
+def _record_fallback(value: Any, target: str) -> None:
+    """Count an operand that couldn't be converted when metrics are enabled."""
+    metrics = _registry._metrics
+    if metrics is not None:
+        value_type = type(value)
+        builtin = _registry.resolve(value_type, target) is _registry.targets[target].builtin
+        metrics.record_fallback(value_type.__name__, target, 'no_converter' if builtin else 'converter_error')
+
+def _concat(left: Any, right: Any) -> FlowStr:
+    """Concatenate the string forms of both operands, the last resort of most operations."""
+    return FlowStr(_str_add(_registry.to_str(left), _registry.to_str(right)))
+
+def _coercing(target: str, combine: Callable[[Any, Any], Any], purpose: str, message: str,
+              fallback: Callable[[Any, Any], Any] = _concat, reflected: bool = False) -> Callable[[Any, Any], Any]:
+    """
+    Make a handler that converts the other operand to ``target`` and combines the operands.
+    
+    Args:
+        target: The target kind the other operand is converted to
+        combine: Called with the operands after conversion
+        purpose: What the conversion is for, for log messages
+        message: Error message with a ``{}`` for the other operand's type
+        fallback: Called with the original operands if the conversion fails
+        reflected: Whether the Flow value is the right operand
+    """
+    def handler(left: Any, right: Any) -> Any:
+        other = left if reflected else right
         try:
-            # Try to convert other to appropriate type
-            if isinstance(other, bool):
-                return FlowInt(int(self) + int(other))
-            
-            # Try numeric conversion first
-            try:
-                other_num = get_converter('int').to_int(other)
-                
-                if config.verbose and not isinstance(other, (int, float, bool, str)):
-                    logger.info(f"Converting {type(other).__name__} to integer for addition: {other!r} -> {other_num!r}")
-                
-                return FlowInt(int(self) + other_num)
-            except Exception:
-                # If numeric conversion fails, try string
-                bool_str = 'True' if self else 'False'
-                other_str = get_converter('str').to_str(other)
-                
-                if config.verbose:
-                    logger.info(f"Converting {type(other).__name__} to string for concatenation: {other!r} -> {other_str!r}")
-                
-                return FlowStr(bool_str + other_str)
+            converted = _operand(other, target, purpose)
         except Exception as e:
+            config = get_config()
+            type_name = type(other).__name__
+            
             if config.verbose:
-                logger.warning(f"Failed to convert {type(other).__name__} for addition with boolean")
+                logger.warning(f"Failed to convert {type_name} to {_registry.targets[target].label} for {purpose}")
             
             if config.raise_errors:
-                raise TypeError(f"Cannot add boolean with {type(other).__name__}: {e}") from e
+                raise TypeError(f"{message.format(type_name)}: {e}") from e
             
-            # Default: convert both to strings
-            bool_str = 'True' if self else 'False'
-            other_str = str(other)
-            return FlowStr(bool_str + other_str)
-    
-    def __radd__(self, other: Any) -> Union['FlowInt', 'FlowFloat', FlowStr]:
-        """Handle boolean addition with any type (right side)."""
-        from .config import get_config
-        from .converters import get_converter
+            _record_fallback(other, target)
+            return fallback(left, right)
         
+        return combine(converted, right) if reflected else combine(left, converted)
+    
+    return handler
+
+def _with_str(left: Any, right: str) -> FlowStr:
+    """Concatenate a Flow value with a string."""
+    return FlowStr(_str_add(_operand(left, 'str', 'concatenation with string'), right))
+
+def _str_with(left: str, right: Any) -> FlowStr:
+    """Concatenate a string with a Flow value."""
+    return FlowStr(_str_add(left, _operand(right, 'str', 'concatenation with string')))
+
+def _merge(base: Any, other: Any) -> Union["FlowDict", LayeredFlowDict]:
+    """Merge two dicts, the second taking precedence."""
+    config = get_config()
+    if config.layered_merges:
+        return _layered(_layers(other) + _layers(base), config.merge_depth)
+    
+    result = FlowDict(base)
+    _dict_update(result, other)
+    return result
+
+def _concat_lists(left: Any, right: Any) -> "FlowList":
+    """Concatenate two lists, copying each once."""
+    result = FlowList(left)
+    _list_extend(result, right)
+    return result
+
+def _extend(target: "FlowList", items: Any) -> "FlowList":
+    """Extend a list in place."""
+    _list_extend(target, items)
+    return target
+
+def _repeat(target: "FlowList", times: int) -> "FlowList":
+    """Repeat a list in place."""
+    return _list_imul(target, times)
+
+def _update(target: Union["FlowDict", LayeredFlowDict], other: Any) -> Union["FlowDict", LayeredFlowDict]:
+    """Merge into a dict in place, the other dict taking precedence."""
+    if isinstance(target, LayeredFlowDict):
+        # Add the other dict as the latest layer, above the keys written so
+        # far, and start a fresh map for later writes
+        writes, *layers = target.maps
+        target.maps = [{}] + _layers(other) + ([writes] if writes else []) + layers
+        if len(target.maps) > get_config().merge_depth + 1:
+            target._collapse()
+        return target
+    
+    _dict_update(target, other)
+    return target
+
+def _update_pairs(target: Union["FlowDict", LayeredFlowDict], pairs: Any) -> Union["FlowDict", LayeredFlowDict]:
+    """Merge key/value pairs into a dict in place, leaving it unchanged if they aren't pairs."""
+    try:
+        other = _original_dict(pairs)
+    except (TypeError, ValueError) as e:
         config = get_config()
+        type_name = type(pairs).__name__
         
-        if isinstance(other, (int, float)):
-            # When adding number to bool, convert bool to int
-            return FlowInt(other + int(self)) if isinstance(other, int) else FlowFloat(other + int(self))
-        elif isinstance(other, str):
-            # When adding str to bool, convert bool to str
-            bool_str = 'True' if self else 'False'
-            
-            if config.verbose:
-                logger.info(f"Converting {type(self).__name__} to string for concatenation with string: {self!r} -> {bool_str!r}")
-            
-            return FlowStr(other + bool_str)
+        if config.verbose:
+            logger.warning(f"Failed to read {type_name} as key/value pairs for merging")
         
+        if config.raise_errors:
+            raise TypeError(f"Cannot merge dictionary with {type_name}: {e}") from e
+        
+        return target
+    
+    return _update(target, other)
+
+def _bool_add(flag: "FlowBool", other: Any, reflected: bool) -> Any:
+    """Add a boolean to a value that isn't a number or string."""
+    try:
         try:
-            # Try to convert other to appropriate type
-            if isinstance(other, bool):
-                return FlowInt(int(other) + int(self))
-            
-            # Try numeric conversion first
-            try:
-                other_num = get_converter('int').to_int(other)
-                
-                if config.verbose and not isinstance(other, (int, float, bool, str)):
-                    logger.info(f"Converting {type(other).__name__} to integer for addition: {other!r} -> {other_num!r}")
-                
-                return FlowInt(other_num + int(self))
-            except Exception:
-                # If numeric conversion fails, try string
-                bool_str = 'True' if self else 'False'
-                other_str = get_converter('str').to_str(other)
-                
-                if config.verbose:
-                    logger.info(f"Converting {type(other).__name__} to string for concatenation: {other!r} -> {other_str!r}")
-                
-                return FlowStr(other_str + bool_str)
-        except Exception as e:
-            if config.verbose:
-                logger.warning(f"Failed to convert {type(other).__name__} for addition with boolean")
-            
-            if config.raise_errors:
-                raise TypeError(f"Cannot add {type(other).__name__} with boolean: {e}") from e
-            
-            # Default: convert both to strings
-            bool_str = 'True' if self else 'False'
-            other_str = str(other)
-            return FlowStr(other_str + bool_str)
+            number = _operand(other, 'int', 'addition')
+        except Exception:
+            # If numeric conversion fails, try string
+            other_str = _operand(other, 'str', 'concatenation')
+            return FlowStr(_str_add(other_str, _original_str(flag)) if reflected else _str_add(_original_str(flag), other_str))
+        return FlowInt(_int_add(number, flag) if reflected else _int_add(flag, number))
+    except Exception as e:
+        config = get_config()
+        type_name = type(other).__name__
+        
+        if config.verbose:
+            logger.warning(f"Failed to convert {type_name} for addition with boolean")
+        
+        if config.raise_errors:
+            message = f"Cannot add {type_name} with boolean" if reflected else f"Cannot add boolean with {type_name}"
+            raise TypeError(f"{message}: {e}") from e
+        
+        # Default: convert both to strings
+        _record_fallback(other, 'str')
+        return FlowStr(_original_str(other) + _original_str(flag) if reflected else _original_str(flag) + _original_str(other))
 
-def flow(value: Any) -> Union[FlowStr, FlowInt, FlowFloat, FlowList, FlowDict, FlowBool]:
+def _register_default_operations() -> None:
+    """Register the handlers implementing the operators of the Flow types."""
+    register = _operations.register
+    
+    # Strings: concatenate with the string form, repeat by an integer
+    register(FlowStr, str, '+', lambda left, right: FlowStr(_str_add(left, right)))
+    register(str, FlowStr, '+', lambda left, right: FlowStr(_str_add(left, right)))
+    register(FlowStr, object, '+', _coercing(
+        'str', lambda left, right: FlowStr(_str_add(left, right)), 'concatenation',
+        "Cannot concatenate {} with string", lambda left, right: FlowStr(_str_add(left, _original_str(right)))))
+    register(object, FlowStr, '+', _coercing(
+        'str', lambda left, right: FlowStr(_str_add(left, right)), 'concatenation',
+        "Cannot concatenate string with {}", lambda left, right: FlowStr(_str_add(_original_str(left), right)),
+        reflected=True))
+    register(FlowStr, int, '*', lambda left, right: FlowStr(_str_mul(left, right)))
+    register(int, FlowStr, '*', lambda left, right: FlowStr(_str_mul(right, left)))
+    register(FlowStr, object, '*', _coercing(
+        'int', lambda left, right: FlowStr(_str_mul(left, right)), 'string multiplication',
+        "Cannot multiply string with {}", lambda left, right: FlowStr(left)))
+    register(object, FlowStr, '*', _coercing(
+        'int', lambda left, right: FlowStr(_str_mul(right, left)), 'string multiplication',
+        "Cannot multiply string with {}", lambda left, right: FlowStr(right), reflected=True))
+    
+    # Integers: numbers add natively, strings concatenate, anything else is
+    # converted to an integer or concatenated as a string
+    register(FlowInt, int, '+', _int_add)
+    register(FlowInt, float, '+', lambda left, right: _float_radd(right, left))
+    register(FlowInt, str, '+', _with_str)
+    register(FlowInt, object, '+', _coercing(
+        'int', lambda left, right: FlowInt(_int_add(left, right)), 'addition', "Cannot add integer with {}"))
+    register(int, FlowInt, '+', lambda left, right: FlowInt(_int_add(left, right)))
+    register(float, FlowInt, '+', lambda left, right: FlowInt(_float_add(left, right)))
+    register(str, FlowInt, '+', _str_with)
+    register(object, FlowInt, '+', _coercing(
+        'int', lambda left, right: FlowInt(_int_add(left, right)), 'addition', "Cannot add {} with integer",
+        reflected=True))
+    register(FlowInt, int, '*', _int_mul)
+    register(FlowInt, float, '*', lambda left, right: _float_rmul(right, left))
+    register(FlowInt, str, '*', lambda left, right: FlowStr(_str_mul(right, left)))
+    register(FlowInt, list, '*', lambda left, right: right * left)
+    register(FlowInt, object, '*', _coercing(
+        'int', lambda left, right: FlowInt(_int_mul(left, right)), 'multiplication',
+        "Cannot multiply integer with {}", lambda left, right: FlowInt(left)))
+    
+    # Floats
+    register(FlowFloat, int, '+', _float_add)
+    register(FlowFloat, float, '+', _float_add)
+    register(FlowFloat, str, '+', _with_str)
+    register(FlowFloat, object, '+', _coercing(
+        'float', lambda left, right: FlowFloat(_float_add(left, right)), 'addition', "Cannot add float with {}"))
+    register(int, FlowFloat, '+', lambda left, right: FlowFloat(_float_radd(right, left)))
+    register(float, FlowFloat, '+', lambda left, right: FlowFloat(_float_radd(right, left)))
+    register(str, FlowFloat, '+', _str_with)
+    register(object, FlowFloat, '+', _coercing(
+        'float', lambda left, right: FlowFloat(_float_radd(right, left)), 'addition', "Cannot add {} with float",
+        reflected=True))
+    
+    # Lists: concatenate with lists or converted values, repeat by an integer
+    register(FlowList, list, '+', lambda left, right: _concat_lists(left, right))
+    register(FlowList, str, '+', _with_str)
+    # Values that aren't iterable are added as a single element, like to_list() does
+    register(FlowList, object, '+', _coercing(
+        'list', lambda left, right: _concat_lists(left, right), 'concatenation',
+        "Cannot concatenate list with {}", lambda left, right: _concat_lists(left, [right])))
+    register(list, FlowList, '+', lambda left, right: _concat_lists(left, right))
+    register(str, FlowList, '+', _str_with)
+    register(object, FlowList, '+', _coercing(
+        'list', lambda left, right: _concat_lists(left, right), 'concatenation',
+        "Cannot concatenate {} with list", lambda left, right: _concat_lists([left], right), reflected=True))
+    register(FlowList, int, '*', lambda left, right: FlowList(_list_mul(left, right)))
+    register(FlowList, object, '*', _coercing(
+        'int', lambda left, right: FlowList(_list_mul(left, right)), 'list multiplication',
+        "Cannot multiply list with {}", lambda left, right: FlowList()))
+    
+    # In place, the list is extended or repeated instead of copied and the
+    # result is always the list; a string is added as a single element
+    register(FlowList, list, '+=', _extend)
+    register(FlowList, object, '+=', _coercing(
+        'list', _extend, 'concatenation', "Cannot concatenate list with {}",
+        lambda left, right: _extend(left, [right])))
+    register(FlowList, int, '*=', _repeat)
+    register(FlowList, object, '*=', _coercing(
+        'int', _repeat, 'list multiplication', "Cannot multiply list with {}",
+        lambda left, right: _repeat(left, 0)))
+    
+    # Dicts: merge with dicts or converted values, the right operand winning
+    register(FlowDict, dict, '+', _merge)
+    register(FlowDict, str, '+', _with_str)
+    register(FlowDict, object, '+', _coercing('dict', _merge, 'merging', "Cannot add dictionary with {}"))
+    register(dict, FlowDict, '+', _merge)
+    register(str, FlowDict, '+', _str_with)
+    register(object, FlowDict, '+', _coercing('dict', _merge, 'merging', "Cannot add {} with dictionary",
+                                              reflected=True))
+    register(FlowDict, dict, '+=', _update)
+    register(FlowDict, str, '+=', _with_str)
+    register(FlowDict, object, '+=', _coercing('dict', _update, 'merging', "Cannot add dictionary with {}"))
+    # Unlike +, |= follows dict.update(): lists and tuples are read as key/value
+    # pairs, and the dict is left unchanged when the other value isn't a mapping
+    register(FlowDict, dict, '|=', _update)
+    register(FlowDict, list, '|=', _update_pairs)
+    register(FlowDict, tuple, '|=', _update_pairs)
+    register(FlowDict, object, '|=', _coercing(
+        'dict', _update, 'merging', "Cannot merge dictionary with {}", lambda left, right: left))
+    
+    # Booleans: add as 0 or 1 to numbers, concatenate with strings
+    register(FlowBool, int, '+', lambda left, right: FlowInt(_int_add(left, right)))
+    register(FlowBool, float, '+', lambda left, right: FlowFloat(_float_radd(right, left)))
+    register(FlowBool, str, '+', _with_str)
+    register(FlowBool, object, '+', lambda left, right: _bool_add(left, right, reflected=False))
+    register(int, FlowBool, '+', lambda left, right: FlowInt(_int_add(left, right)))
+    register(float, FlowBool, '+', lambda left, right: FlowFloat(_float_add(left, right)))
+    register(str, FlowBool, '+', _str_with)
+    register(object, FlowBool, '+', lambda left, right: _bool_add(right, left, reflected=True))
+
+_register_default_operations()
+
+def _convert_view(view: Union[FlowListView, FlowDictView], target: str) -> Any:
+    """Convert the container wrapped by a view."""
+    return _registry.convert(view._data, target)
+
+def _convert_layered(layered: LayeredFlowDict, target: str) -> Any:
+    """Convert the merged contents of a layered dict."""
+    return _registry.convert(layered.flatten(), target)
+
+def _register_view_converters() -> None:
+    """Let the registry convert views like the containers they wrap."""
+    for target in ('str', 'bool', 'list', 'dict'):
+        for view_type in (FlowListView, FlowDictView):
+            # A partial of a module-level function can be sent to convert_parallel() workers
+            _registry.register(target, view_type, functools.partial(_convert_view, target=target))
+        _registry.register(target, LayeredFlowDict, functools.partial(_convert_layered, target=target))
+
+_register_view_converters()
+
+# Values flow() wraps once and shares: integers in this (inclusive) range
+# and strings of up to INTERN_STR_LENGTH characters, of which at most
+# INTERN_STR_MAXSIZE are remembered at a time
+INTERN_INT_RANGE = (-5, 1024)
+INTERN_STR_LENGTH = 32
+INTERN_STR_MAXSIZE = 65536
+
+_small_int_min, _small_int_max = INTERN_INT_RANGE
+_small_ints = tuple(int.__new__(FlowInt, value) for value in range(_small_int_min, _small_int_max + 1))
+_int_sub = int.__sub__
+_interned_strs: Dict[str, FlowStr] = {}
+
+def flow(value: Any, view: bool = False, deep: bool = False
+         ) -> Union[FlowStr, FlowInt, FlowFloat, FlowList, FlowDict, FlowBool, FlowListView, FlowDictView]:
     """
     Convert a value to its corresponding TypeFlow type.
     
+    Integers in INTERN_INT_RANGE and strings of up to INTERN_STR_LENGTH
+    characters are interned: equal values share one wrapper, so wrapping
+    many repeated small values costs no extra memory.
+    
+    Lists and dicts are copied into a FlowList or FlowDict, unless ``view``
+    is True: then they are wrapped in a FlowListView or FlowDictView that
+    works on the original without copying it.
+    
+    With ``deep`` set, lists and dicts become a DeepFlowList or
+    DeepFlowDict, which wrap nested values in Flow types lazily, as they are
+    read. Only the top level is copied.
+    
     Args:
         value: The value to convert
+        view: If True, wrap lists and dicts in views instead of copying them
+        deep: If True, wrap nested values of lists and dicts too
     
     Returns:
         The value wrapped in the appropriate TypeFlow type
     """
+    if deep:
+        if view:
+            raise ValueError("flow() can't combine view=True with deep=True")
+        if isinstance(value, _original_list):
+            return DeepFlowList(value)
+        if isinstance(value, _original_dict):
+            return DeepFlowDict(value)
+    if view:
+        if isinstance(value, _original_list):
+            return FlowListView(value)
+        if isinstance(value, _original_dict):
+            return FlowDictView(value)
+    if isinstance(value, (FlowListView, FlowDictView)):
+        return value
+    
+    # Only exact str and int values are interned; subclasses such as enums
+    # may have a different text and are wrapped freshly
+    value_type = type(value)
+    if value_type is _original_str and len(value) <= INTERN_STR_LENGTH:
+        interned = _interned_strs.get(value)
+        if interned is None:
+            interned = _intern_str(value)
+        return interned
+    if value_type is _original_int and _small_int_min <= value <= _small_int_max:
+        return _small_ints[_int_sub(value, _small_int_min)]
+    
     if isinstance(value, str):
         return FlowStr(value)
     elif isinstance(value, int) and not isinstance(value, bool):
@@ -650,4 +1124,41 @@ def flow(value: Any) -> Union[FlowStr, FlowInt, FlowFloat, FlowList, FlowDict, F
         return FlowBool(value)
     else:
         # Try to convert to string as a fallback
-        return FlowStr(str(value))
\ No newline at end of file
+        return FlowStr(str(value))
+
+def _intern_str(value: str) -> FlowStr:
+    """Wrap a short string and remember the wrapper."""
+    if len(_interned_strs) >= INTERN_STR_MAXSIZE:
+        _interned_strs.clear()
+    interned = _interned_strs[value] = FlowStr(value)
+    return interned
+
+def flow_join(sep: Any, values: Iterable[Any]) -> FlowStr:
+    """
+    Convert values to strings and join them.
+    
+    Each value is converted through the registry like in FlowStr
+    concatenation, with the converter resolved once per type, and the
+    results are joined in a single copy.
+    
+    Example:
+        flow_join(",", [order_id, 19.99, True, None])  # '1042,19.99,True,None'
+    
+    Args:
+        sep: The separator, converted to a string if it isn't one
+        values: The values to join
+    
+    Returns:
+        The joined string
+    """
+    return FlowStr(_rope_text(sep).join(_registry.convert_many(values, 'str')))
+
+# How values read from deep containers are wrapped, by exact type. Booleans
+# stay plain like None: FlowBool is an int and would serialize as 0 or 1
+_deep_wrappers: Dict[type, Callable[[Any], Any]] = {
+    _original_str: flow,
+    _original_int: flow,
+    _original_float: FlowFloat,
+    _original_list: DeepFlowList,
+    _original_dict: DeepFlowDict,
+}